@@ -0,0 +1 @@
+from .grafo import etapa, executar_etapas
\ No newline at end of file
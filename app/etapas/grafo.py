@@ -0,0 +1,114 @@
+import hashlib
+import random
+import zlib
+import numpy as np
+
+def etapa(nome: str, funcao, entradas: list[str], saidas: list[str] = None) -> dict:
+    """
+    Declara uma etapa do grafo de geração de instâncias.
+
+    Parâmetros:
+    -----------
+    nome : str
+        Nome da etapa. Também é o nome da sua saída quando `saidas` não é informado.
+    funcao : callable
+        Função chamada com as entradas como argumentos nomeados (funcao(**entradas)).
+    entradas : list[str]
+        Nomes das entradas da etapa. Cada nome é a saída de uma etapa anterior ou um parâmetro fornecido em `valores`.
+    saidas : list[str], opcional
+        Nomes das saídas quando a função retorna uma tupla. Cada elemento da tupla fica disponível com o nome correspondente.
+
+    Retorno:
+    --------
+    dict
+        Dicionário {'nome', 'funcao', 'entradas', 'saidas'} usado por executar_etapas.
+    """
+
+    return {'nome': nome, 'funcao': funcao, 'entradas': list(entradas), 'saidas': list(saidas) if saidas else [nome]}
+
+def _impressao_digital(valor) -> tuple:
+    """
+    Converte um parâmetro em uma chave hashable e estável, usada para identificar as entradas de uma etapa no cache.
+    Arrays numpy são identificados pelo hash do seu conteúdo, e não pela sua representação textual (que é abreviada).
+    """
+
+    if isinstance(valor, np.ndarray):
+        return ('ndarray', valor.shape, str(valor.dtype), hashlib.sha1(np.ascontiguousarray(valor).tobytes()).hexdigest())
+    if isinstance(valor, dict):
+        return ('dict', tuple((repr(chave), _impressao_digital(item)) for chave, item in valor.items()))
+    if isinstance(valor, (list, tuple)):
+        return (type(valor).__name__, tuple(_impressao_digital(item) for item in valor))
+    return ('valor', repr(valor))
+
+def _semear(seed, nome: str) -> None:
+    # Semente própria de cada etapa, derivada da semente global e do nome da etapa
+    semente_etapa = zlib.crc32(f"{seed}:{nome}".encode())
+    random.seed(semente_etapa)
+    np.random.seed(semente_etapa)
+
+def executar_etapas(etapas: list[dict], valores: dict, seed: int = None, cache: dict = None) -> dict:
+    """
+    Executa um grafo de etapas em ordem, reaproveitando do cache as etapas cujas entradas não mudaram.
+
+    A chave de cada etapa é formada pelo seu nome, pela semente e pelas chaves das suas entradas (a impressão digital dos
+    parâmetros e as chaves das etapas das quais depende). Assim, ao alterar um parâmetro, apenas as etapas a jusante dele
+    têm a chave alterada e são recalculadas.
+
+    Parâmetros:
+    -----------
+    etapas : list[dict]
+        Etapas criadas com `etapa`, em ordem topológica (cada etapa só depende de etapas anteriores).
+    valores : dict
+        Parâmetros de entrada do grafo, indexados pelo nome usado nas entradas das etapas.
+    seed : int, opcional
+        Semente global. Quando informada, cada etapa é executada com uma semente derivada da global e do seu nome,
+        o que torna seu resultado reprodutível e permite memorizá-lo. Se None, nenhuma semente é alterada e o cache não é usado.
+    cache : dict, opcional
+        Dicionário mantido pelo chamador entre execuções, onde os resultados das etapas são memorizados.
+
+    Retorno:
+    --------
+    dict
+        Dicionário com todas as saídas das etapas, indexadas pelo nome. Os objetos vindos do cache são compartilhados entre
+        execuções e não devem ser modificados.
+    """
+
+    usar_cache = seed is not None and cache is not None
+
+    resultados = {}
+    chaves = {}
+    for definicao in etapas:
+        nome = definicao['nome']
+
+        argumentos = {}
+        chave_entradas = []
+        for entrada in definicao['entradas']:
+            if entrada in resultados:
+                argumentos[entrada] = resultados[entrada]
+                chave_entradas.append(chaves[entrada])
+            elif entrada in valores:
+                argumentos[entrada] = valores[entrada]
+                chave_entradas.append(_impressao_digital(valores[entrada]))
+            else:
+                raise ValueError(f"A entrada '{entrada}' da etapa '{nome}' não é um parâmetro nem a saída de uma etapa anterior.")
+
+        chave = (nome, seed, tuple(chave_entradas))
+
+        if usar_cache and chave in cache:
+            saida = cache[chave]
+        else:
+            if seed is not None:
+                _semear(seed, nome)
+            saida = definicao['funcao'](**argumentos)
+            if usar_cache:
+                cache[chave] = saida
+
+        if len(definicao['saidas']) == 1:
+            resultados[definicao['saidas'][0]] = saida
+            chaves[definicao['saidas'][0]] = chave
+        else:
+            for nome_saida, valor in zip(definicao['saidas'], saida):
+                resultados[nome_saida] = valor
+                chaves[nome_saida] = (chave, nome_saida)
+
+    return resultados
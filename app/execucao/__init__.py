@@ -0,0 +1,4 @@
+from .lote import gerar_lote
+from .campanha import criar_campanha, executar_campanha, estado_campanha, ler_manifesto
+from .familia import gerar_familia, parametros_layout
+from .servico import iniciar_servico, pedir_servico, CAMINHO_SOCKET
\ No newline at end of file
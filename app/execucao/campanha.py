@@ -0,0 +1,227 @@
+import json
+import os
+import random
+import shutil
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from main import gerar_instancia, escrever_instancia
+from prints import estimar_instancia
+
+# Estados de um trabalho no manifesto
+PENDENTE, EXECUTANDO, CONCLUIDO, ERRO = 'pendente', 'executando', 'concluido', 'erro'
+
+NOME_MANIFESTO = 'manifesto.jsonl'
+
+def _escrever_atomico(caminho: str, conteudo: str) -> None:
+    # Escreve em um arquivo temporário na mesma pasta e o renomeia, para que o arquivo nunca fique pela metade
+    temporario = f"{caminho}.tmp{os.getpid()}"
+    with open(temporario, 'w') as f:
+        f.write(conteudo)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporario, caminho)
+
+def _registrar(pasta: str, registro: dict) -> None:
+    # Acrescenta uma linha ao manifesto; uma linha cortada por uma queda é descartada na leitura
+    with open(os.path.join(pasta, NOME_MANIFESTO), 'a') as f:
+        f.write(json.dumps(registro) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+def ler_manifesto(pasta: str) -> tuple[dict, dict[str, dict]]:
+    """
+    Lê o manifesto de uma campanha, reaplicando as mudanças de estado na ordem em que foram registradas.
+
+    Retorno:
+    --------
+    tuple[dict, dict[str, dict]]
+        As opções da campanha e os trabalhos indexados pelo identificador, cada um com 'parametros', 'seed',
+        'custo', 'estado' e, quando concluído, 'arquivo' (ou 'mensagem', em caso de erro).
+    """
+
+    opcoes = {}
+    trabalhos = {}
+    with open(os.path.join(pasta, NOME_MANIFESTO)) as f:
+        for linha in f:
+            try:
+                registro = json.loads(linha)
+            except json.JSONDecodeError:
+                continue
+            if 'opcoes' in registro:
+                opcoes = registro['opcoes']
+            elif 'parametros' in registro:
+                trabalhos[registro['id']] = dict(registro, estado=PENDENTE)
+            elif registro.get('id') in trabalhos:
+                trabalhos[registro['id']].update(registro)
+    return opcoes, trabalhos
+
+def _compactar_manifesto(pasta: str, opcoes: dict, trabalhos: dict[str, dict]) -> None:
+    # Reescreve o manifesto com uma linha por trabalho (já no estado atual)
+    linhas = [json.dumps({'opcoes': opcoes})]
+    for trabalho in trabalhos.values():
+        linhas.append(json.dumps({chave: valor for chave, valor in trabalho.items() if chave != 'estado'}))
+        if trabalho['estado'] != PENDENTE:
+            linhas.append(json.dumps({chave: trabalho[chave] for chave in ('id', 'estado', 'arquivo', 'mensagem') if chave in trabalho}))
+    _escrever_atomico(os.path.join(pasta, NOME_MANIFESTO), '\n'.join(linhas) + '\n')
+
+def criar_campanha(lista_parametros: list[dict],
+                   pasta: str,
+                   replicatas: int = 1,
+                   seed: int = None,
+                   formato: str = 'denso',
+                   podar_elegibilidade: bool = False,
+                   limites: bool = False) -> dict[str, dict]:
+    """
+    Cria o manifesto de uma campanha: um trabalho por (parâmetros, replicata), cada um com identificador e semente próprios.
+
+    O identificador ({índice}-{replicata}, e.g. '00042-003') entra no nome do arquivo da instância, de modo que replicatas
+    com os mesmos números de tarefas, máquinas e caminhões não se sobrescrevem. Cada trabalho guarda também o custo
+    estimado (veja estimar_instancia), usado para executar os maiores primeiro.
+
+    Parâmetros:
+    -----------
+    lista_parametros : list[dict]
+        Parâmetros de cada instância, no formato de gerar_instancia.
+    pasta : str
+        Pasta da campanha, onde ficam o manifesto e as instâncias.
+    replicatas : int, opcional
+        Número de replicatas de cada conjunto de parâmetros (padrão = 1).
+    seed : int, opcional
+        Semente da campanha. O trabalho i (na ordem do manifesto) usa seed + i; se None, as sementes são sorteadas.
+    formato, podar_elegibilidade, limites :
+        Opções de escrita (veja pipeline_gerar_prints_parametros), guardadas no manifesto para a retomada.
+
+    Retorno:
+    --------
+    dict[str, dict]
+        Os trabalhos criados, indexados pelo identificador.
+
+    Exceções:
+    ---------
+    ValueError
+        Se a pasta já contém um manifesto (use executar_campanha para retomá-lo).
+    """
+
+    os.makedirs(pasta, exist_ok=True)
+    if os.path.exists(os.path.join(pasta, NOME_MANIFESTO)):
+        raise ValueError(f"A pasta {pasta} já contém uma campanha; use executar_campanha para retomá-la.")
+
+    opcoes = {'formato': formato, 'podar_elegibilidade': podar_elegibilidade, 'limites': limites}
+    trabalhos = {}
+    for indice, parametros in enumerate(lista_parametros):
+        custo = estimar_instancia(parametros, formato)['segundos']
+        for replicata in range(replicatas):
+            identificador = f"{indice:05d}-{replicata:03d}"
+            semente = seed + len(trabalhos) if seed is not None else random.randrange(2 ** 32)
+            trabalhos[identificador] = {'id': identificador, 'parametros': parametros, 'seed': semente,
+                                        'custo': custo, 'estado': PENDENTE}
+
+    _compactar_manifesto(pasta, opcoes, trabalhos)
+    return trabalhos
+
+def escrever_instancia_identificada(instancia: dict,
+                                    pasta: str,
+                                    identificador: str,
+                                    formato: str = 'denso',
+                                    podar_elegibilidade: bool = False,
+                                    limites: bool = False) -> str:
+    """
+    Escreve uma instância (veja escrever_instancia) com o identificador no nome do arquivo
+    ({nome da instância}_{identificador}_AMPL.txt) e retorna o caminho final.
+
+    A instância é escrita em uma pasta temporária dentro de `pasta` e movida para o nome final com os.replace,
+    de modo que o arquivo final nunca fica pela metade, mesmo se o processo for interrompido.
+    """
+
+    temporaria = os.path.join(pasta, f".tmp_{identificador}")
+    shutil.rmtree(temporaria, ignore_errors=True)
+    os.makedirs(temporaria)
+    try:
+        caminho = escrever_instancia(instancia, temporaria + os.sep, formato, podar_elegibilidade, limites)
+        destino = os.path.join(pasta, os.path.basename(caminho).replace('_AMPL', f"_{identificador}_AMPL"))
+        os.replace(caminho, destino)
+        return destino
+    finally:
+        shutil.rmtree(temporaria, ignore_errors=True)
+
+def _executar_trabalho(trabalho: dict, pasta: str, opcoes: dict) -> str:
+    # Gera e escreve a instância de um trabalho da campanha
+    instancia = gerar_instancia(trabalho['parametros'], trabalho['seed'])
+    return escrever_instancia_identificada(instancia, pasta, trabalho['id'], opcoes['formato'],
+                                           opcoes['podar_elegibilidade'], opcoes['limites'])
+
+def executar_campanha(pasta: str, n_workers: int = None) -> dict[str, int]:
+    """
+    Executa (ou retoma) a campanha de uma pasta criada por criar_campanha.
+
+    Trabalhos que estavam em execução quando a campanha foi interrompida, os que terminaram com erro e os concluídos
+    cujo arquivo não existe mais voltam a ficar pendentes. Os pendentes são executados do maior para o menor custo
+    estimado (regra LPT, que reduz o tempo total com vários processos), submetendo um novo trabalho sempre que
+    um processo fica livre. Cada mudança de estado é acrescentada ao manifesto assim que acontece.
+
+    Parâmetros:
+    -----------
+    pasta : str
+        Pasta da campanha.
+    n_workers : int, opcional
+        Número de processos (padrão = número de núcleos). Se 0, executa no processo principal.
+
+    Retorno:
+    --------
+    dict[str, int]
+        Número de trabalhos em cada estado ao final (veja estado_campanha).
+    """
+
+    opcoes, trabalhos = ler_manifesto(pasta)
+    for trabalho in trabalhos.values():
+        if trabalho['estado'] in (EXECUTANDO, ERRO) or (trabalho['estado'] == CONCLUIDO and not os.path.exists(trabalho.get('arquivo', ''))):
+            trabalho['estado'] = PENDENTE
+            trabalho.pop('mensagem', None)
+    _compactar_manifesto(pasta, opcoes, trabalhos)
+
+    pendentes = sorted((trabalho for trabalho in trabalhos.values() if trabalho['estado'] == PENDENTE),
+                       key=lambda trabalho: (-trabalho['custo'], trabalho['id']))
+
+    def concluir(trabalho: dict, executar) -> None:
+        try:
+            trabalho.update(estado=CONCLUIDO, arquivo=executar())
+            _registrar(pasta, {'id': trabalho['id'], 'estado': CONCLUIDO, 'arquivo': trabalho['arquivo']})
+        except Exception as e:
+            trabalho.update(estado=ERRO, mensagem=str(e))
+            _registrar(pasta, {'id': trabalho['id'], 'estado': ERRO, 'mensagem': str(e)})
+            print(f"Erro no trabalho {trabalho['id']}: {e}")
+
+    if n_workers == 0:
+        for trabalho in pendentes:
+            _registrar(pasta, {'id': trabalho['id'], 'estado': EXECUTANDO})
+            concluir(trabalho, lambda: _executar_trabalho(trabalho, pasta, opcoes))
+    else:
+        limite = n_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=limite) as executor:
+            em_execucao = {}
+            fila = iter(pendentes)
+            while True:
+                # Mantém no máximo um trabalho por processo, para que a ordem LPT seja respeitada
+                for trabalho in fila:
+                    _registrar(pasta, {'id': trabalho['id'], 'estado': EXECUTANDO})
+                    em_execucao[executor.submit(_executar_trabalho, trabalho, pasta, opcoes)] = trabalho
+                    if len(em_execucao) >= limite:
+                        break
+                if not em_execucao:
+                    break
+                concluidos, _ = wait(em_execucao, return_when=FIRST_COMPLETED)
+                for futuro in concluidos:
+                    concluir(em_execucao.pop(futuro), futuro.result)
+
+    return estado_campanha(pasta)
+
+def estado_campanha(pasta: str) -> dict[str, int]:
+    """
+    Retorna o número de trabalhos da campanha em cada estado (pendente, executando, concluido, erro).
+    """
+
+    _, trabalhos = ler_manifesto(pasta)
+    contagem = {estado: 0 for estado in (PENDENTE, EXECUTANDO, CONCLUIDO, ERRO)}
+    for trabalho in trabalhos.values():
+        contagem[trabalho['estado']] += 1
+    return contagem
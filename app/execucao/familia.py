@@ -0,0 +1,111 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from main import etapas_layout, PARAMETROS_PADRAO
+from parametros_avancados import etapas_parametros_avancados
+from etapas import executar_etapas
+from instancia import objeto_compartilhado, anexar_objeto
+from .campanha import escrever_instancia_identificada
+
+# Saídas das etapas do layout usadas pelos parâmetros avançados e pela escrita; são publicadas uma vez em memória
+# compartilhada e lidas sem cópia pelos processos
+CHAVES_COMPARTILHADAS = ('parametros_basicos', 'operacoes_por_area', 'operacoes_por_caminhao', 'coordenadas', 'distancias')
+
+# Layout compartilhado do processo de trabalho (preenchido por _inicializar_familia)
+_compartilhado = {}
+
+def parametros_layout() -> set[str]:
+    """
+    Retorna os nomes dos parâmetros de main() que definem o armazém (entradas externas das etapas do layout).
+    Uma família de instâncias mantém esses parâmetros fixos.
+    """
+
+    etapas = etapas_layout()
+    saidas = {saida for definicao in etapas for saida in definicao['saidas']}
+    return {entrada for definicao in etapas for entrada in definicao['entradas'] if entrada not in saidas}
+
+def _inicializar_familia(descritor: dict) -> None:
+    # Anexa o layout publicado pelo processo principal (os arrays são visões somente leitura da memória compartilhada)
+    _compartilhado.clear()
+    _compartilhado.update(anexar_objeto(descritor))
+
+def _gerar_variante(parametros: dict, seed: int, identificador: str, pasta: str, opcoes: dict) -> str:
+    # Gera os parâmetros avançados de uma variante sobre o layout compartilhado e escreve a instância
+    valores = dict(_compartilhado, **parametros, num_maquinas=parametros['n_maquinas'])
+    instancia = executar_etapas(etapas_parametros_avancados(parametros['modo_setup']), valores, seed)
+    instancia.update(_compartilhado)
+    instancia['parametros'] = parametros
+    return escrever_instancia_identificada(instancia, pasta, identificador, **opcoes)
+
+def gerar_familia(parametros_base: dict,
+                  variantes: list[dict],
+                  pasta: str = '../data/instancias/',
+                  n_workers: int = None,
+                  seed: int = None,
+                  formato: str = 'denso',
+                  podar_elegibilidade: bool = False,
+                  limites: bool = False) -> list[str]:
+    """
+    Gera uma família de instâncias que compartilham as tarefas e o layout e variam apenas os parâmetros avançados
+    (número de empilhadeiras, velocidades, proporcao_areas, faixas de setup e bloqueio, ...).
+
+    As tarefas e o layout são gerados uma única vez no processo principal e publicados em memória compartilhada
+    (veja instancia.publicar_objeto), de onde cada processo de trabalho os lê sem cópia; cada variante executa apenas as etapas dos parâmetros avançados e a escrita. Com seed, a variante
+    é idêntica a gerar_instancia({**parametros_base, **variante}, seed), e todas as variantes usam os mesmos sorteios
+    nas etapas que não mudam, o que as mantém comparáveis.
+
+    Parâmetros:
+    -----------
+    parametros_base : dict
+        Parâmetros da instância, no formato de gerar_instancia.
+    variantes : list[dict]
+        Parâmetros alterados em cada variante. Não podem incluir os parâmetros do layout (veja parametros_layout).
+    pasta : str, opcional
+        Diretório onde as instâncias serão escritas, como {nome da instância}_v{índice}_AMPL.txt.
+    n_workers : int, opcional
+        Número de processos (padrão = número de núcleos). Se 0, gera no processo principal.
+    seed : int, opcional
+        Semente da família. Se None, o layout usa o gerador global e cada variante recebe uma semente sorteada.
+    formato, podar_elegibilidade, limites :
+        Opções de escrita (veja pipeline_gerar_prints_parametros).
+
+    Retorno:
+    --------
+    list[str]
+        Caminho do arquivo de cada variante, na ordem de `variantes`.
+
+    Exceções:
+    ---------
+    ValueError
+        Se alguma variante altera um parâmetro do layout.
+    """
+
+    fixos = parametros_layout()
+    for indice, variante in enumerate(variantes):
+        alterados = sorted(fixos & set(variante))
+        if alterados:
+            raise ValueError(f"A variante {indice} altera parâmetros do layout ({', '.join(alterados)}); "
+                             f"gere uma família para cada layout.")
+
+    parametros_base = dict(PARAMETROS_PADRAO, **parametros_base)
+    layout = executar_etapas(etapas_layout(), parametros_base, seed)
+    compartilhado = {chave: layout[chave] for chave in CHAVES_COMPARTILHADAS}
+
+    opcoes = {'formato': formato, 'podar_elegibilidade': podar_elegibilidade, 'limites': limites}
+    os.makedirs(pasta, exist_ok=True)
+    tarefas = [({**parametros_base, **variante}, seed if seed is not None else random.randrange(2 ** 32), f"v{indice:03d}")
+               for indice, variante in enumerate(variantes)]
+
+    with objeto_compartilhado(compartilhado) as descritor:
+        if n_workers == 0:
+            _inicializar_familia(descritor)
+            try:
+                return [_gerar_variante(parametros, semente, identificador, pasta, opcoes) for parametros, semente, identificador in tarefas]
+            finally:
+                _compartilhado.clear()
+
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_inicializar_familia, initargs=(descritor,)) as executor:
+            futuros = [executor.submit(_gerar_variante, parametros, semente, identificador, pasta, opcoes)
+                       for parametros, semente, identificador in tarefas]
+            return [futuro.result() for futuro in futuros]
@@ -0,0 +1,163 @@
+import os
+import queue
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from main import gerar_instancia
+from instancia import publicar_objeto, anexar_objeto, liberar_objeto
+from .campanha import escrever_instancia_identificada
+
+# Saídas de gerar_instancia necessárias para escrever a instância; as demais (layout, distâncias) não são enviadas ao escritor
+CHAVES_ESCRITA = ('parametros', 'parametros_basicos', 'elegibilidade', 'tempos_processamento', 'datas_entrega',
+                  'tempos_bloqueios', 'tempos_setup')
+
+def _identificador_lote(indice: int) -> str:
+    # Identificador da instância no nome do arquivo: instâncias do lote com as mesmas dimensões teriam o mesmo nome
+    return f"l{indice:03d}"
+
+def _gerar_para_escrita(parametros: dict, seed: int) -> dict:
+    """
+    Gera uma instância em um processo de trabalho e retorna apenas o necessário para escrevê-la.
+    """
+
+    instancia = gerar_instancia(parametros, seed)
+    return {chave: instancia[chave] for chave in CHAVES_ESCRITA}
+
+def _gerar_compartilhada(parametros: dict, seed: int, indice: int, pasta: str, opcoes: dict) -> dict | str:
+    """
+    Gera uma instância em um processo de trabalho e a publica em memória compartilhada, retornando só o descritor:
+    os arrays não são serializados de volta ao processo principal. O escritor remove o segmento depois da escrita.
+    Fora do POSIX, o segmento não sobreviveria ao fim desta chamada, e o descritor traz a instância serializada
+    (veja publicar_objeto).
+
+    Com pasta_temporaria, os tempos de setup e bloqueio estão em disco e seriam copiados para a memória ao
+    serializar a instância; nesse caso o próprio processo escreve a instância e retorna o caminho do arquivo.
+    """
+
+    if parametros.get('pasta_temporaria') is not None:
+        instancia = gerar_instancia(parametros, seed)
+        return escrever_instancia_identificada(instancia, pasta, _identificador_lote(indice), **opcoes)
+
+    descritor = publicar_objeto(_gerar_para_escrita(parametros, seed), remover_aqui=False)
+    liberar_objeto(descritor, remover=False)
+    return descritor
+
+def _escritor(fila: queue.Queue, pasta: str, formato: str, podar_elegibilidade: bool, limites: bool, caminhos: list, erros: list) -> None:
+    # Consome a fila até receber None, escrevendo cada instância em disco; as geradas nos processos de trabalho
+    # chegam como descritores de memória compartilhada, que são anexados e removidos aqui, ou já escritas (o caminho)
+    while True:
+        item = fila.get()
+        if item is None:
+            return
+        indice, instancia, descritor = item
+        if isinstance(descritor, str):
+            caminhos[indice] = descritor
+            continue
+        try:
+            if descritor is not None:
+                instancia = anexar_objeto(descritor)
+            caminhos[indice] = escrever_instancia_identificada(instancia, pasta, _identificador_lote(indice), formato,
+                                                               podar_elegibilidade, limites)
+        except Exception as e:
+            erros.append((indice, e))
+        finally:
+            instancia = None
+            if descritor is not None:
+                liberar_objeto(descritor)
+
+def _entregar_concluidas(pendentes: dict, fila: queue.Queue) -> None:
+    # Aguarda ao menos uma geração terminar e a coloca na fila (bloqueando enquanto a fila estiver cheia)
+    concluidas, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+    for futuro in concluidas:
+        fila.put((pendentes.pop(futuro), None, futuro.result()))
+
+def _descartar_pendentes(pendentes: dict) -> None:
+    # Remove os segmentos das gerações que terminaram mas não chegaram ao escritor (interrupção do lote)
+    for futuro in pendentes:
+        if not futuro.cancel() and futuro.exception() is None and isinstance(futuro.result(), dict):
+            liberar_objeto(futuro.result())
+
+def gerar_lote(lista_parametros: list[dict],
+               pasta: str = '../data/instancias/',
+               n_workers: int = None,
+               tamanho_fila: int = 2,
+               formato: str = 'denso',
+               seed: int = None,
+               podar_elegibilidade: bool = False,
+               limites: bool = False) -> list[str]:
+    """
+    Gera e escreve um lote de instâncias, sobrepondo a geração (em processos de trabalho) à escrita em disco
+    (em uma thread dedicada).
+
+    As instâncias prontas são publicadas em memória compartilhada pelos processos de geração (veja
+    instancia.publicar_objeto) e passam por uma fila limitada até o escritor, que as lê sem cópia. Quando a fila está cheia, novas gerações
+    não são submetidas até que o escritor libere espaço, o que limita a memória a cerca de
+    n_workers + tamanho_fila + 1 instâncias ao mesmo tempo. Instâncias com pasta_temporaria (tempos em disco) são
+    escritas pelos próprios processos de geração, sem passar pela memória compartilhada.
+
+    Parâmetros:
+    -----------
+    lista_parametros : list[dict]
+        Parâmetros de cada instância, no formato de gerar_instancia.
+    pasta : str, opcional
+        Diretório onde as instâncias serão escritas.
+    n_workers : int, opcional
+        Número de processos de geração. Se None, usa o número de núcleos disponíveis. Se 0, a geração é feita
+        no processo principal (apenas a escrita é sobreposta).
+    tamanho_fila : int, opcional
+        Número máximo de instâncias prontas aguardando escrita (padrão = 2).
+    formato : str, opcional
+        Formato de saída (veja pipeline_gerar_prints_parametros). Padrão é 'denso'.
+    seed : int, opcional
+        Semente do lote. A instância i usa a semente seed + i; se None, as sementes são sorteadas com o gerador
+        global, de modo que cada processo gere uma instância diferente.
+    podar_elegibilidade : bool, opcional
+        Escreve s e bk apenas para os pares elegíveis (veja pipeline_gerar_prints_parametros).
+    limites : bool, opcional
+        Escreve também o horizonte e os limites big-M de cada instância (veja pipeline_gerar_prints_parametros).
+
+    Retorno:
+    --------
+    list[str]
+        Caminho do arquivo de cada instância, na ordem de lista_parametros. O nome do arquivo tem a posição da
+        instância no lote ({nome da instância}_l{posição}_AMPL.txt, veja escrever_instancia_identificada), de modo
+        que instâncias com as mesmas dimensões não se sobrescrevem.
+    """
+
+    sementes = [seed + indice if seed is not None else random.randrange(2 ** 32) for indice in range(len(lista_parametros))]
+
+    opcoes = {'formato': formato, 'podar_elegibilidade': podar_elegibilidade, 'limites': limites}
+    fila = queue.Queue(maxsize=tamanho_fila)
+    caminhos = [None] * len(lista_parametros)
+    erros = []
+    escritor = threading.Thread(target=_escritor, args=(fila, pasta, formato, podar_elegibilidade, limites, caminhos, erros), daemon=True)
+    escritor.start()
+
+    try:
+        if n_workers == 0:
+            for indice, parametros in enumerate(lista_parametros):
+                fila.put((indice, _gerar_para_escrita(parametros, sementes[indice]), None))
+        else:
+            limite = n_workers or os.cpu_count() or 1
+            pendentes = {}
+            try:
+                with ProcessPoolExecutor(max_workers=limite) as executor:
+                    for indice, parametros in enumerate(lista_parametros):
+                        # Só submete uma nova geração quando há um processo livre
+                        while len(pendentes) >= limite:
+                            _entregar_concluidas(pendentes, fila)
+                        pendentes[executor.submit(_gerar_compartilhada, parametros, sementes[indice], indice, pasta, opcoes)] = indice
+                    while pendentes:
+                        _entregar_concluidas(pendentes, fila)
+            finally:
+                _descartar_pendentes(pendentes)
+    finally:
+        fila.put(None)
+        escritor.join()
+
+    if erros:
+        indice, erro = erros[0]
+        print(f"Erro ao escrever a instância {indice} do lote: {erro}")
+        raise erro
+    return caminhos
@@ -0,0 +1,284 @@
+import asyncio
+import io
+import json
+import math
+import os
+import random
+import signal
+import socket
+import stat
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from main import PARAMETROS_PADRAO, gerar_instancia, escrever_instancia, escrever_cenarios
+from prints import estimar_instancia
+from instancia import arrays_de_instancia, carregar_arrays_instancia, ler_instancia_ampl, caracteristicas_arquivo, NOMES_CARACTERISTICAS
+from resultados.validacao import validar_solucao
+from resultados.leitura_result import parse_log_file
+
+# Socket no diretório de execução do usuário ($XDG_RUNTIME_DIR) ou, na falta dele, em um diretório privado do
+# usuário na pasta temporária (criado por servir com permissão 0o700)
+CAMINHO_SOCKET = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or os.path.join(tempfile.gettempdir(), f"gerador_instancias-{os.getuid()}"),
+                              'gerador_instancias.sock')
+
+# Pasta raiz padrão das instâncias escritas pelo serviço
+PASTA_RAIZ = '../data/instancias/'
+
+# Tamanho máximo de uma linha de pedido (em bytes)
+LIMITE_PEDIDO = 2 ** 24
+
+def _inicializar_worker() -> None:
+    # Os processos herdam o estado do gerador global do serviço; sem novas sementes, pedidos sem seed repetiriam as instâncias
+    random.seed()
+    np.random.seed()
+
+def _gerar(pedido: dict) -> tuple[dict, bytes]:
+    """
+    Gera uma instância. Com 'binario', retorna os arrays da instância em .npz (sem escrever em disco); senão,
+    escreve a instância (ou os cenários, com 'n_cenarios') na pasta e retorna o caminho.
+    """
+
+    if pedido.get('limites') and pedido.get('n_cenarios') is not None:
+        raise ValueError("Os limites não podem ser escritos em um arquivo de cenários: use limites ou n_cenarios.")
+
+    parametros = dict(PARAMETROS_PADRAO, **pedido['parametros'])
+    instancia = gerar_instancia(parametros, pedido.get('seed'))
+    if pedido.get('binario'):
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays_de_instancia(instancia))
+        return {'formato': 'npz'}, buffer.getvalue()
+
+    pasta = pedido['pasta']
+    formato = pedido.get('formato', 'denso')
+    podar_elegibilidade = pedido.get('podar_elegibilidade', False)
+    if pedido.get('n_cenarios') is not None:
+        caminho = escrever_cenarios(instancia, pedido['n_cenarios'], pasta, formato, podar_elegibilidade, pedido.get('seed'))
+    else:
+        caminho = escrever_instancia(instancia, pasta, formato, podar_elegibilidade, pedido.get('limites', False))
+    return {'arquivo': caminho}, None
+
+def _estimar(pedido: dict) -> tuple[dict, bytes]:
+    # Estimativa de tamanho, memória e tempo (veja estimar_instancia)
+    parametros = dict(PARAMETROS_PADRAO, **pedido['parametros'])
+    estimativa = estimar_instancia(parametros, pedido.get('formato', 'denso'), pedido.get('modelo'), pedido.get('podar_elegibilidade', False),
+                                   pedido.get('n_cenarios'))
+    return estimativa, None
+
+def _caracteristicas(pedido: dict) -> tuple[dict, bytes]:
+    # Vetor de características de uma instância salva (NaN vira null no JSON)
+    valores = caracteristicas_arquivo(pedido['arquivo'])
+    return {nome: None if math.isnan(valor) else valor for nome, valor in zip(NOMES_CARACTERISTICAS, valores.tolist())}, None
+
+def _validar(pedido: dict) -> tuple[dict, bytes]:
+    # Valida o log de uma solução contra a instância (veja validar_solucao)
+    caminho_instancia = pedido['instancia']
+    ler = carregar_arrays_instancia if caminho_instancia.endswith('.npz') else ler_instancia_ampl
+    violacoes = validar_solucao(ler(caminho_instancia), parse_log_file(pedido['log']),
+                                pedido.get('por_empilhadeira'), pedido.get('tolerancia', 1e-4))
+    return violacoes, None
+
+# Ações atendidas pelos processos de trabalho
+ACOES = {
+    'gerar': _gerar,
+    'estimar': _estimar,
+    'caracteristicas': _caracteristicas,
+    'validar': _validar,
+}
+
+def _dentro_da_raiz(pasta: str, pasta_raiz: str) -> str:
+    """
+    Resolve uma pasta enviada por um cliente (relativa à pasta raiz, ou absoluta) e retorna o caminho real.
+
+    Exceções:
+    ---------
+    ValueError
+        Se a pasta, seguidos os links simbólicos, fica fora da pasta raiz.
+    """
+
+    raiz = os.path.realpath(pasta_raiz)
+    caminho = os.path.realpath(os.path.join(raiz, pasta))
+    if os.path.commonpath([raiz, caminho]) != raiz:
+        raise ValueError(f"A pasta {pasta} fica fora da pasta raiz do serviço ({raiz}).")
+    return caminho + os.sep
+
+def _restringir_pastas(pedido: dict, pasta_raiz: str) -> dict:
+    # As pastas em que o pedido escreve (a da instância e a dos arquivos temporários) ficam dentro da pasta raiz
+    pedido = dict(pedido, pasta=_dentro_da_raiz(pedido.get('pasta', ''), pasta_raiz))
+    parametros = pedido.get('parametros')
+    if isinstance(parametros, dict) and parametros.get('pasta_temporaria') is not None:
+        pedido['parametros'] = dict(parametros, pasta_temporaria=_dentro_da_raiz(parametros['pasta_temporaria'], pasta_raiz))
+    return pedido
+
+def _preparar_socket(caminho_socket: str) -> None:
+    """
+    Prepara o caminho do socket: cria o diretório (0o700) se não existe e remove um socket abandonado.
+
+    Exceções:
+    ---------
+    ValueError
+        Se o diretório não pertence ao usuário ou pode ser alterado por outros usuários, se o caminho existe e não é
+        um socket, ou se outro serviço já atende no socket.
+    """
+
+    diretorio = os.path.dirname(os.path.abspath(caminho_socket))
+    os.makedirs(diretorio, mode=0o700, exist_ok=True)
+    informacoes = os.stat(diretorio)
+    if informacoes.st_uid != os.getuid() or informacoes.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise ValueError(f"O diretório {diretorio} do socket deve pertencer ao usuário e não ter escrita para outros usuários.")
+
+    if not os.path.lexists(caminho_socket):
+        return
+    if not stat.S_ISSOCK(os.lstat(caminho_socket).st_mode):
+        raise ValueError(f"{caminho_socket} existe e não é um socket.")
+    # Só remove o socket se nenhum serviço responde nele
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexao:
+        try:
+            conexao.connect(caminho_socket)
+        except ConnectionRefusedError:
+            os.remove(caminho_socket)
+            return
+    raise ValueError(f"Já há um serviço atendendo em {caminho_socket}.")
+
+async def _responder(escritor: asyncio.StreamWriter, resposta: dict, dados: bytes = None) -> None:
+    # Uma linha JSON com o resultado, seguida de resposta['bytes'] bytes quando há dados binários
+    if dados is not None:
+        resposta['bytes'] = len(dados)
+    escritor.write(json.dumps(resposta).encode() + b'\n')
+    if dados is not None:
+        escritor.write(dados)
+    await escritor.drain()
+
+async def servir(caminho_socket: str = CAMINHO_SOCKET, n_workers: int = None, pasta_raiz: str = PASTA_RAIZ) -> None:
+    """
+    Atende pedidos de geração e análise de instâncias em um socket Unix até receber a ação 'encerrar'
+    (ou SIGINT/SIGTERM). Veja iniciar_servico para o protocolo.
+    """
+
+    _preparar_socket(caminho_socket)
+
+    laco = asyncio.get_running_loop()
+    encerrar = asyncio.Event()
+    for sinal in (signal.SIGINT, signal.SIGTERM):
+        laco.add_signal_handler(sinal, encerrar.set)
+
+    executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_inicializar_worker) if n_workers != 0 else None
+    # Sem processos, os pedidos compartilham o estado global de random e np.random (ressemeado a cada etapa):
+    # são atendidos um por vez, para que a geração com seed seja reprodutível
+    trava = asyncio.Lock()
+
+    async def executar(funcao, pedido: dict) -> tuple[dict, bytes]:
+        if executor is None:
+            async with trava:
+                return await asyncio.to_thread(funcao, pedido)
+        return await laco.run_in_executor(executor, funcao, pedido)
+
+    async def atender(leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        # Cada conexão pode enviar vários pedidos, atendidos em ordem; conexões diferentes são atendidas em paralelo
+        try:
+            while not encerrar.is_set():
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                pedido = {}
+                try:
+                    pedido = json.loads(linha)
+                    acao = pedido.get('acao')
+                    resposta = {'id': pedido.get('id'), 'ok': True}
+                    if acao == 'ping':
+                        await _responder(escritor, dict(resposta, resultado={'pid': os.getpid()}))
+                    elif acao == 'encerrar':
+                        await _responder(escritor, resposta)
+                        encerrar.set()
+                    elif acao in ACOES:
+                        if acao == 'gerar':
+                            pedido = _restringir_pastas(pedido, pasta_raiz)
+                        resultado, dados = await executar(ACOES[acao], pedido)
+                        await _responder(escritor, dict(resposta, resultado=resultado), dados)
+                    else:
+                        raise ValueError(f"Ação desconhecida: {acao}. Use uma de {', '.join(['ping', 'encerrar', *ACOES])}.")
+                except Exception as e:
+                    # O erro de um pedido é devolvido ao cliente e o serviço continua atendendo
+                    identificador = pedido.get('id') if isinstance(pedido, dict) else None
+                    await _responder(escritor, {'id': identificador, 'ok': False, 'erro': f"{type(e).__name__}: {e}"})
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Cliente desconectado ou serviço encerrado com a conexão aberta
+            pass
+        finally:
+            escritor.close()
+
+    servidor = await asyncio.start_unix_server(atender, path=caminho_socket, limit=LIMITE_PEDIDO)
+    os.chmod(caminho_socket, 0o600)
+    print(f"Serviço de instâncias em {caminho_socket} (pid {os.getpid()})")
+    try:
+        async with servidor:
+            await encerrar.wait()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if os.path.exists(caminho_socket):
+            os.remove(caminho_socket)
+
+def iniciar_servico(caminho_socket: str = CAMINHO_SOCKET, n_workers: int = None, pasta_raiz: str = PASTA_RAIZ) -> None:
+    """
+    Inicia um serviço local que mantém os módulos do gerador carregados e um pool de processos ativo, para que
+    scripts de orquestração gerem e analisem instâncias sem pagar a importação a cada passo
+    (e.g. python -c "from execucao import iniciar_servico; iniciar_servico()", executado na pasta app).
+
+    Protocolo (socket Unix): cada pedido é uma linha JSON com a 'acao' e os seus campos (e um 'id' opcional,
+    devolvido na resposta). A resposta é uma linha JSON com 'ok' e 'resultado' (ou 'erro'); quando há dados
+    binários, a linha tem 'bytes' e é seguida por esse número de bytes. Uma conexão pode enviar vários pedidos.
+
+    Ações:
+    - 'gerar': 'parametros' (os de main(), sem 'pasta'), 'seed', 'pasta', 'formato', 'podar_elegibilidade',
+      'limites' ou 'n_cenarios' opcionais; retorna {'arquivo': caminho}. A 'pasta' (e a 'pasta_temporaria' dos
+      parâmetros) é relativa à pasta raiz do serviço, e pastas fora dela são recusadas. Com 'binario': true, não escreve em disco
+      e envia os arrays da instância (veja instancia.montar_arrays_instancia) em .npz.
+    - 'estimar': 'parametros', 'formato', 'podar_elegibilidade', 'modelo' e 'n_cenarios' opcionais; retorna a estimativa de
+      estimar_instancia.
+    - 'caracteristicas': 'arquivo' (.npz ou *_AMPL.txt); retorna {nome: valor} (veja instancia.caracteristicas_instancia).
+    - 'validar': 'log' e 'instancia', 'por_empilhadeira' e 'tolerancia' opcionais; retorna as violações de validar_solucao.
+    - 'ping': retorna o pid do serviço. 'encerrar': encerra o serviço.
+
+    Parâmetros:
+    -----------
+    caminho_socket : str, opcional
+        Caminho do socket Unix (padrão = CAMINHO_SOCKET). O diretório deve pertencer ao usuário, sem escrita para
+        outros usuários, e o socket só aceita conexões do usuário (0o600). Um socket abandonado no caminho é
+        removido; se outro serviço responde nele, o serviço não é iniciado (ValueError).
+    n_workers : int, opcional
+        Número de processos (padrão = número de núcleos). Se 0, os pedidos são atendidos em uma thread do próprio
+        serviço, um por vez (ping e encerrar continuam respondendo enquanto um pedido é atendido).
+    pasta_raiz : str, opcional
+        Pasta em que o serviço escreve as instâncias (padrão = PASTA_RAIZ).
+    """
+
+    asyncio.run(servir(caminho_socket, n_workers, pasta_raiz))
+
+def pedir_servico(pedido: dict, caminho_socket: str = CAMINHO_SOCKET) -> dict:
+    """
+    Envia um pedido ao serviço (veja iniciar_servico) e aguarda a resposta.
+
+    Retorno:
+    --------
+    dict
+        A resposta do serviço; os dados binários, quando há, ficam em 'dados' (e.g. np.load(io.BytesIO(resposta['dados']))).
+
+    Exceções:
+    ---------
+    ValueError
+        Se o serviço não conseguiu atender o pedido (a mensagem traz o erro ocorrido no serviço).
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexao:
+        conexao.connect(caminho_socket)
+        conexao.sendall(json.dumps(pedido).encode() + b'\n')
+        arquivo = conexao.makefile('rb')
+        resposta = json.loads(arquivo.readline())
+        if 'bytes' in resposta:
+            resposta['dados'] = arquivo.read(resposta['bytes'])
+
+    if not resposta['ok']:
+        raise ValueError(f"O serviço não atendeu o pedido: {resposta['erro']}")
+    return resposta
@@ -0,0 +1,2 @@
+from .construtiva import programar_lista, solucao_para_parametros, escrever_valores_iniciais, alpha_por_empilhadeira
+from .pipeline_heuristica import pipeline_heuristica
\ No newline at end of file
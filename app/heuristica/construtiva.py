@@ -0,0 +1,196 @@
+import heapq
+import numpy as np
+
+def alpha_por_empilhadeira(n_maquinas: int, n_caminhoes: int) -> bool:
+    """
+    Indica se o alpha lido do log fica indexado por empilhadeira (matrizes operação x caminhão) ou por caminhão
+    (matrizes operação x máquina), seguindo a mesma regra de calculate_metrics.
+    """
+
+    return n_maquinas <= n_caminhoes
+
+def programar_lista(arrays: dict[str, np.ndarray]) -> dict:
+    """
+    Constrói uma programação viável com uma heurística de lista (list scheduling).
+
+    As operações liberadas (cujo predecessor já foi programado) são escolhidas pela menor data de saída do caminhão
+    e, em caso de empate, pelo número da operação. Cada operação vai para a máquina elegível em que termina mais cedo,
+    respeitando o término do predecessor e, na máquina, o término da operação anterior mais o setup e o bloqueio
+    entre as duas: t[j] >= t[i] + p[i, k] + s[i, j, k] + bk[i, j, k].
+
+    Parâmetros:
+    -----------
+    arrays : dict[str, np.ndarray]
+        Arrays da instância (veja instancia.montar_arrays_instancia).
+
+    Retorno:
+    --------
+    dict
+        Dicionário contendo:
+        - 'maquina': vetor (n,) com a máquina (a partir de 1) de cada operação.
+        - 'inicio': vetor (n,) com o instante de início de cada operação.
+        - 'termino': vetor (n,) com o instante de término de cada operação.
+        - 'sequencias': {maquina: [operações na ordem de execução]}.
+
+    Exceções:
+    ---------
+    ValueError
+        Se alguma operação não tiver máquina elegível ou se os predecessores formarem um ciclo.
+    """
+
+    p = arrays['p']
+    s = arrays['s']
+    bk = arrays['bk']
+    pr = arrays['pr']
+    d = arrays['d']
+    caminhao = arrays['caminhao']
+    n_operacoes, n_maquinas = p.shape
+
+    elegiveis = ~np.isnan(p)
+    sem_maquina = np.flatnonzero(~elegiveis.any(axis=1))
+    if len(sem_maquina):
+        raise ValueError(f"A operação {sem_maquina[0] + 1} não possui máquinas elegíveis.")
+
+    # Sucessores de cada operação (a partir do vetor de predecessores)
+    sucessores = [[] for _ in range(n_operacoes)]
+    for operacao, predecessor in enumerate(pr.tolist()):
+        if predecessor > 0:
+            sucessores[predecessor - 1].append(operacao)
+
+    # Prioridade: data de saída do caminhão da operação
+    prioridade = d[caminhao - 1].astype(np.float64) if len(d) else np.zeros(n_operacoes)
+    liberacao = np.zeros(n_operacoes)
+    liberadas = [(prioridade[operacao], operacao) for operacao in np.flatnonzero(pr == 0).tolist()]
+    heapq.heapify(liberadas)
+
+    maquina = np.zeros(n_operacoes, dtype=np.int64)
+    inicio = np.zeros(n_operacoes)
+    termino = np.zeros(n_operacoes)
+    ultima = np.full(n_maquinas, -1, dtype=np.int64)
+    disponivel = np.zeros(n_maquinas)
+    indices_maquinas = np.arange(n_maquinas)
+    sequencias = {k: [] for k in range(1, n_maquinas + 1)}
+
+    programadas = 0
+    while liberadas:
+        _, operacao = heapq.heappop(liberadas)
+
+        # Início possível em cada máquina: após o predecessor e após a última operação da máquina mais setup e bloqueio
+        anteriores = np.maximum(ultima, 0)
+        intervalo = np.where(ultima >= 0,
+                             s[indices_maquinas, anteriores, operacao] + bk[indices_maquinas, anteriores, operacao], 0)
+        inicios = np.maximum(liberacao[operacao], disponivel + intervalo)
+        terminos = np.where(elegiveis[operacao], inicios + np.nan_to_num(p[operacao]), np.inf)
+        k = int(np.argmin(terminos))
+
+        maquina[operacao] = k + 1
+        inicio[operacao] = inicios[k]
+        termino[operacao] = terminos[k]
+        ultima[k] = operacao
+        disponivel[k] = terminos[k]
+        sequencias[k + 1].append(operacao + 1)
+        programadas += 1
+
+        for sucessor in sucessores[operacao]:
+            liberacao[sucessor] = termino[operacao]
+            heapq.heappush(liberadas, (prioridade[sucessor], sucessor))
+
+    if programadas < n_operacoes:
+        raise ValueError("Os predecessores das operações formam um ciclo; não há programação viável.")
+
+    return {'maquina': maquina, 'inicio': inicio, 'termino': termino, 'sequencias': sequencias}
+
+def solucao_para_parametros(arrays: dict[str, np.ndarray], programacao: dict, por_empilhadeira: bool = None) -> dict:
+    """
+    Converte uma programação na mesma estrutura retornada por parse_log_file, para uso em calculate_metrics
+    e nos gráficos de Gantt.
+
+    Parâmetros:
+    -----------
+    arrays : dict[str, np.ndarray]
+        Arrays da instância.
+    programacao : dict
+        Saída de programar_lista.
+    por_empilhadeira : bool, opcional
+        Se True, alpha é indexado por empilhadeira (matrizes operação x caminhão); se False, por caminhão
+        (matrizes operação x máquina). Se None, usa alpha_por_empilhadeira.
+
+    Retorno:
+    --------
+    dict
+        Dicionário com as chaves de parse_log_file ('MAC', 'alpha', 't', 'A', 'p', 'd') e também 'n_caminhoes' e 'n_maquinas'.
+    """
+
+    p = arrays['p']
+    d = arrays['d']
+    caminhao = arrays['caminhao']
+    n_operacoes, n_maquinas = p.shape
+    n_caminhoes = len(d)
+    if por_empilhadeira is None:
+        por_empilhadeira = alpha_por_empilhadeira(n_maquinas, n_caminhoes)
+
+    maquina = programacao['maquina']
+    linhas = np.arange(n_operacoes)
+    alpha = {}
+    if por_empilhadeira:
+        for k in range(1, n_maquinas + 1):
+            matriz = np.zeros((n_operacoes, n_caminhoes), dtype=int)
+            selecionadas = maquina == k
+            matriz[linhas[selecionadas], caminhao[selecionadas] - 1] = 1
+            alpha[k] = matriz
+    else:
+        for c in range(1, n_caminhoes + 1):
+            matriz = np.zeros((n_operacoes, n_maquinas), dtype=int)
+            selecionadas = caminhao == c
+            matriz[linhas[selecionadas], maquina[selecionadas] - 1] = 1
+            alpha[c] = matriz
+
+    # Saída de cada caminhão: término da sua última operação
+    saida = np.zeros(n_caminhoes)
+    np.maximum.at(saida, caminhao - 1, programacao['termino'])
+    atraso = np.maximum(saida - d, 0)
+
+    operacoes, maquinas = np.nonzero(~np.isnan(p))
+    return {
+        'MAC': float(programacao['termino'].max()) if n_operacoes else 0.0,
+        'alpha': alpha,
+        't': {operacao + 1: float(valor) for operacao, valor in enumerate(programacao['inicio'].tolist())},
+        'A': {c + 1: float(valor) for c, valor in enumerate(atraso.tolist())},
+        'p': [(int(operacao) + 1, int(k) + 1, float(p[operacao, k])) for operacao, k in zip(operacoes, maquinas)],
+        'd': {c + 1: float(valor) for c, valor in enumerate(d.tolist())},
+        'n_caminhoes': n_caminhoes,
+        'n_maquinas': n_maquinas,
+    }
+
+def escrever_valores_iniciais(arrays: dict[str, np.ndarray], programacao: dict, nome_arquivo: str) -> None:
+    """
+    Escreve a programação como valores iniciais das variáveis do modelo AMPL (seção de dados com `var`),
+    para ser carregada após o arquivo da instância e usada como ponto de partida pelo solver.
+
+    São escritos alpha[operação, caminhão, máquina] (apenas as atribuições iguais a 1), t[operação], A[caminhão] e MAC.
+    """
+
+    caminhao = arrays['caminhao']
+    d = arrays['d']
+    maquina = programacao['maquina']
+    termino = programacao['termino']
+
+    saida = np.zeros(len(d))
+    np.maximum.at(saida, caminhao - 1, termino)
+    atraso = np.maximum(saida - d, 0)
+
+    with open(nome_arquivo, 'w') as f:
+        f.write("# Valores iniciais gerados pela heuristica construtiva\n")
+        f.write("var alpha :=\n")
+        for operacao in range(len(maquina)):
+            f.write(f"{operacao + 1} {caminhao[operacao]} {maquina[operacao]} 1\n")
+        f.write(";\n\n")
+        f.write("var t :=\n")
+        for operacao, valor in enumerate(programacao['inicio'].tolist()):
+            f.write(f"{operacao + 1} {round(valor)}\n")
+        f.write(";\n\n")
+        f.write("var A :=\n")
+        for c, valor in enumerate(atraso.tolist()):
+            f.write(f"{c + 1} {round(valor)}\n")
+        f.write(";\n\n")
+        f.write(f"var MAC := {round(termino.max()) if len(termino) else 0};\n")
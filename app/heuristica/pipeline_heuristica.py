@@ -0,0 +1,33 @@
+from .construtiva import programar_lista, solucao_para_parametros, escrever_valores_iniciais
+from instancia import arrays_de_instancia
+from prints import nome_arquivo_instancia
+
+def pipeline_heuristica(instancia: dict, pasta: str = None, por_empilhadeira: bool = None) -> dict:
+    """
+    Programa uma instância gerada por gerar_instancia com a heurística construtiva e, opcionalmente, escreve
+    a programação como valores iniciais para o AMPL.
+
+    Parâmetros:
+    - instancia: Dicionário retornado por gerar_instancia.
+    - pasta: Se informado, escreve os valores iniciais em {pasta}{nome da instância}_inicial.txt.
+    - por_empilhadeira: Indexação do alpha retornado (veja solucao_para_parametros).
+
+    Retorno:
+    - Dicionário no formato de parse_log_file (com 'n_caminhoes' e 'n_maquinas'), pronto para calculate_metrics
+      e para os gráficos de Gantt. Se pasta for informada, o caminho dos valores iniciais fica em 'arquivo_inicial'.
+    """
+
+    arrays = arrays_de_instancia(instancia)
+    programacao = programar_lista(arrays)
+    parametros = solucao_para_parametros(arrays, programacao, por_empilhadeira)
+
+    if pasta is not None:
+        config = instancia['parametros']
+        nome_arquivo = nome_arquivo_instancia(pasta, config['n_tarefas_docas'], config['n_tarefas_estoque'],
+                                              config['n_maquinas'], config['n_caminhoes'],
+                                              config['todos_caminhoes_atrasados'], config['todos_caminhoes_adiantados'])
+        nome_arquivo = nome_arquivo.replace('_AMPL.txt', '_inicial.txt')
+        escrever_valores_iniciais(arrays, programacao, nome_arquivo)
+        parametros['arquivo_inicial'] = nome_arquivo
+
+    return parametros
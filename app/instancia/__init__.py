@@ -0,0 +1,4 @@
+from .arrays import montar_arrays_instancia, salvar_arrays_instancia, carregar_arrays_instancia, arrays_de_instancia
+from .leitura import ler_instancia_ampl, ler_parametros_ampl
+from .caracteristicas import NOMES_CARACTERISTICAS, caracteristicas_instancia, caracteristicas_de_instancia, caracteristicas_arquivo, caracteristicas_diretorio
+from .memoria_compartilhada import publicar_objeto, anexar_objeto, liberar_objeto, objeto_compartilhado
\ No newline at end of file
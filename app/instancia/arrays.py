@@ -0,0 +1,129 @@
+import numpy as np
+from parametros_avancados import MatrizTriangular, TemposConstantes
+
+def _tensor_pares(tempos, n_maquinas: int, n_operacoes: int, dtype: type = np.int32) -> np.ndarray:
+    """
+    Converte os tempos entre pares de operações em um tensor (n_maquinas, n_operacoes, n_operacoes) simétrico.
+
+    Aceita a MatrizTriangular (em memória ou em disco), os TemposConstantes do modo determinístico, o dicionário
+    {'Empilhadeira k': {'i,j': tempo}} (com os pares guardados em um só sentido) ou um tensor numpy.
+    Os pares ausentes e as máquinas ausentes do dicionário ficam com zero.
+    """
+
+    if isinstance(tempos, np.ndarray):
+        return np.rint(tempos[:n_maquinas, :n_operacoes, :n_operacoes]).astype(dtype)
+    if isinstance(tempos, MatrizTriangular):
+        # Tempos em disco (np.memmap) são expandidos em um tensor também em disco, na mesma pasta
+        return tempos.tensor(tempos.pasta_temporaria)[:n_maquinas, :n_operacoes, :n_operacoes].astype(dtype, copy=False)
+    if isinstance(tempos, TemposConstantes):
+        return tempos.tensor()[:n_maquinas, :n_operacoes, :n_operacoes].astype(dtype, copy=False)
+
+    tensor = np.zeros((n_maquinas, n_operacoes, n_operacoes), dtype=dtype)
+    for maquina in range(1, n_maquinas + 1):
+        pares = tempos.get(f'Empilhadeira {maquina}')
+        if not pares:
+            continue
+        chaves = np.array([list(map(int, chave.split(','))) for chave in pares.keys()], dtype=np.int64).reshape(-1, 2) - 1
+        valores = np.rint(np.array([float(valor) for valor in pares.values()]))
+        validos = (chaves < n_operacoes).all(axis=1)
+        chaves, valores = chaves[validos], valores[validos]
+        tensor[maquina - 1, chaves[:, 1], chaves[:, 0]] = valores
+        tensor[maquina - 1, chaves[:, 0], chaves[:, 1]] = valores
+    return tensor
+
+def montar_arrays_instancia(n_maquinas: int,
+                            n_caminhoes: int,
+                            resultados: dict[str, any],
+                            elegibilidade: dict[int, dict],
+                            tempos_processamento: dict[str, dict],
+                            datas_saida: dict[str, float],
+                            n_operacoes_por_tarefa: int,
+                            tempos_bloqueios,
+                            tempos_setup) -> dict[str, np.ndarray]:
+    """
+    Monta a representação em arrays de uma instância, com os mesmos parâmetros do arquivo AMPL.
+
+    Parâmetros:
+    -----------
+    Os mesmos de pipeline_gerar_prints_parametros (sem os nomes de arquivo).
+
+    Retorno:
+    --------
+    dict[str, np.ndarray]
+        Dicionário contendo:
+        - 'n_jobs', 'n_machines', 'n_caminhoes': escalares.
+        - 'n_operations': vetor (n_jobs,) com o número de operações de cada tarefa.
+        - 'd': vetor (n_caminhoes,) com a data de saída de cada caminhão.
+        - 'pr': vetor (n,) com o predecessor de cada operação (0 quando não há).
+        - 'caminhao': vetor (n,) com o caminhão de cada operação.
+        - 'Ri': array (n, n_caminhoes, n_maquinas) de 0/1 com a elegibilidade.
+        - 'p': matriz (n, n_maquinas) com os tempos de processamento (NaN nas máquinas não elegíveis).
+        - 's', 'bk': tensores (n_maquinas, n, n) com os tempos de setup e de bloqueio (zero na diagonal).
+        Os índices dos arrays começam em zero, correspondendo à operação, caminhão ou máquina 1.
+    """
+
+    n_jobs = resultados['n_total_tarefas']
+    n_operacoes = resultados['n_total_operacoes']
+
+    d = np.zeros(n_caminhoes, dtype=np.int64)
+    for caminhao, data_saida in datas_saida.items():
+        d[int(caminhao.split()[1]) - 1] = round(data_saida)
+
+    pr = np.zeros(n_operacoes, dtype=np.int64)
+    for operacao, predecessor in resultados['predecessores'].items():
+        pr[operacao - 1] = predecessor
+
+    caminhao = np.zeros(n_operacoes, dtype=np.int64)
+    Ri = np.zeros((n_operacoes, n_caminhoes, n_maquinas), dtype=np.int8)
+    p = np.full((n_operacoes, n_maquinas), np.nan)
+    for operacao, dados in elegibilidade.items():
+        caminhao[operacao - 1] = dados['caminhao']
+        for maquina in dados['maquinas']:
+            Ri[operacao - 1, dados['caminhao'] - 1, maquina - 1] = 1
+            p[operacao - 1, maquina - 1] = round(tempos_processamento[f'Empilhadeira {maquina}'][operacao]['tempo'])
+
+    return {
+        'n_jobs': np.array(n_jobs),
+        'n_machines': np.array(n_maquinas),
+        'n_caminhoes': np.array(n_caminhoes),
+        'n_operations': np.full(n_jobs, n_operacoes_por_tarefa, dtype=np.int64),
+        'd': d,
+        'pr': pr,
+        'caminhao': caminhao,
+        'Ri': Ri,
+        'p': p,
+        's': _tensor_pares(tempos_setup, n_maquinas, n_operacoes),
+        'bk': _tensor_pares(tempos_bloqueios, n_maquinas, n_operacoes),
+    }
+
+def salvar_arrays_instancia(arrays: dict[str, np.ndarray], nome_arquivo: str) -> None:
+    """
+    Salva os arrays de uma instância em um arquivo .npz (sem compressão, para que o tamanho seja previsível).
+    """
+
+    with open(nome_arquivo, 'wb') as f:
+        np.savez(f, **arrays)
+
+def carregar_arrays_instancia(nome_arquivo: str) -> dict[str, np.ndarray]:
+    """
+    Carrega os arrays de uma instância salva por salvar_arrays_instancia.
+    """
+
+    with np.load(nome_arquivo) as dados:
+        return {chave: dados[chave] for chave in dados.files}
+
+def arrays_de_instancia(instancia: dict) -> dict[str, np.ndarray]:
+    """
+    Monta os arrays (veja montar_arrays_instancia) de uma instância retornada por gerar_instancia.
+    """
+
+    parametros = instancia['parametros']
+    return montar_arrays_instancia(parametros['n_maquinas'],
+                                   parametros['n_caminhoes'],
+                                   instancia['parametros_basicos'],
+                                   instancia['elegibilidade'],
+                                   instancia['tempos_processamento'],
+                                   instancia['datas_entrega'],
+                                   parametros['n_operacoes_por_tarefa'],
+                                   instancia['tempos_bloqueios'],
+                                   instancia['tempos_setup'])
@@ -0,0 +1,233 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .arrays import arrays_de_instancia, carregar_arrays_instancia
+from .leitura import ler_instancia_ampl
+
+# Ordem fixa das características de uma instância (veja caracteristicas_instancia)
+NOMES_CARACTERISTICAS = (
+    'n_operacoes', 'n_maquinas', 'n_caminhoes',
+    'densidade_elegibilidade', 'desvio_elegibilidade', 'frac_operacoes_sem_maquina',
+    'p_medio', 'cv_p',
+    'cv_carga_maquinas', 'razao_carga_maxima',
+    'setup_medio', 'cv_setup', 'frac_setup_zero', 'setup_relativo',
+    'bloqueio_medio', 'cv_bloqueio', 'bloqueio_relativo',
+    'aperto_medio', 'aperto_minimo', 'frac_caminhoes_apertados', 'aperto_global',
+    'distancia_carregada_media', 'cv_distancia_carregada', 'dispersao_origens', 'distancia_vazio_media',
+    'operacoes_por_caminhao_media', 'cv_operacoes_por_caminhao', 'razao_caminhao_maximo',
+)
+
+def _razao(numerador: float, denominador: float) -> float:
+    # Divisão que resulta em NaN (em vez de erro ou infinito) quando o denominador é zero
+    return float(numerador) / float(denominador) if denominador else float('nan')
+
+def _cv(valores: np.ndarray) -> float:
+    # Coeficiente de variação (desvio padrão / média)
+    return _razao(valores.std(), valores.mean()) if len(valores) else float('nan')
+
+def _estatisticas_pares(tempos: np.ndarray, elegivel: np.ndarray) -> tuple[float, float, float]:
+    """
+    Média, coeficiente de variação e fração de zeros dos tempos entre pares de operações distintas elegíveis à mesma
+    máquina. Considerar só os pares elegíveis torna o resultado igual com e sem a poda da elegibilidade na escrita.
+    """
+
+    soma = soma_quadrados = zeros = pares = 0.0
+    for maquina in range(tempos.shape[0]):
+        operacoes = np.flatnonzero(elegivel[:, maquina])
+        if len(operacoes) < 2:
+            continue
+        bloco = tempos[maquina][np.ix_(operacoes, operacoes)].astype(np.float64)
+        n_pares = len(operacoes) * (len(operacoes) - 1)
+        # A diagonal é zero e não entra nas somas, só na contagem de zeros
+        soma += bloco.sum()
+        soma_quadrados += np.square(bloco).sum()
+        zeros += len(bloco) * len(bloco) - np.count_nonzero(bloco) - len(operacoes)
+        pares += n_pares
+
+    if pares == 0:
+        return float('nan'), float('nan'), float('nan')
+    media = soma / pares
+    desvio = np.sqrt(max(soma_quadrados / pares - media * media, 0.0))
+    return media, _razao(desvio, media), zeros / pares
+
+def _media_diferenca_absoluta(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Média de |a_i - b_j| sobre todos os pares (i, j), em O((n + m) log m), ordenando b e usando somas acumuladas.
+    """
+
+    if len(a) == 0 or len(b) == 0:
+        return float('nan')
+    b = np.sort(b)
+    acumulada = np.concatenate(([0.0], np.cumsum(b)))
+    menores = np.searchsorted(b, a, side='right')
+    # Para cada a_i: (a_i * k - soma dos k menores) + (soma dos maiores - a_i * (m - k))
+    total = (a * menores - acumulada[menores]) + (acumulada[-1] - acumulada[menores] - a * (len(b) - menores))
+    return float(total.sum()) / (len(a) * len(b))
+
+def caracteristicas_instancia(arrays: dict[str, np.ndarray], coordenadas: dict[str, np.ndarray] = None) -> np.ndarray:
+    """
+    Calcula o vetor de características de uma instância, na ordem de NOMES_CARACTERISTICAS.
+
+    As características medem o tamanho da instância, a densidade da elegibilidade, o desequilíbrio da carga entre
+    as máquinas (cada operação dividida igualmente entre as suas máquinas elegíveis), os tempos de setup e bloqueio
+    (entre pares elegíveis à mesma máquina, também relativos ao tempo de processamento médio), o aperto das datas de
+    saída (data / soma dos menores tempos das operações do caminhão; 'aperto_global' compara a maior data com a carga
+    total dividida pelas máquinas), a dispersão espacial das operações e a distribuição do tamanho dos caminhões.
+
+    Parâmetros:
+    -----------
+    arrays : dict[str, np.ndarray]
+        Arrays da instância (veja montar_arrays_instancia ou ler_instancia_ampl).
+    coordenadas : dict[str, np.ndarray], opcional
+        Coordenadas das operações (veja layout.alocar_pontos_operacoes). Sem elas, as características espaciais são NaN.
+
+    Retorno:
+    --------
+    np.ndarray
+        Vetor float64 (len(NOMES_CARACTERISTICAS),). Características indefinidas (e.g. divisão por zero) são NaN.
+    """
+
+    p = arrays['p']
+    if p.ndim == 3:
+        # Arquivo de cenários: usa a média dos cenários, apenas nas células elegíveis (as demais são NaN em todos
+        # os cenários e continuam NaN, sem o aviso de média vazia do np.nanmean)
+        validos = ~np.isnan(p)
+        contagem = validos.sum(axis=0)
+        p = np.divide(np.where(validos, p, 0).sum(axis=0), contagem, out=np.full(p.shape[1:], np.nan), where=contagem > 0)
+    n_operacoes, n_maquinas = p.shape
+    n_caminhoes = int(arrays['n_caminhoes'])
+    d = arrays['d'] if arrays['d'].ndim == 1 else arrays['d'].mean(axis=0)
+
+    # Elegibilidade por operação e máquina (qualquer caminhão)
+    elegivel = arrays['Ri'].any(axis=1)
+    n_elegiveis = elegivel.sum(axis=1)
+    densidade = n_elegiveis / n_maquinas if n_maquinas else np.zeros(n_operacoes)
+
+    # Tempos de processamento nas máquinas elegíveis e menor tempo de cada operação
+    tempos = np.where(elegivel, p, np.nan)
+    com_maquina = n_elegiveis > 0
+    p_elegiveis = tempos[elegivel]
+    p_minimo = np.zeros(n_operacoes)
+    p_minimo[com_maquina] = np.nanmin(tempos[com_maquina], axis=1)
+
+    # Carga esperada de cada máquina: cada operação dividida igualmente entre as suas máquinas elegíveis
+    carga = np.nansum(tempos / np.maximum(n_elegiveis, 1)[:, None], axis=0)
+    p_medio = p_elegiveis.mean() if len(p_elegiveis) else float('nan')
+
+    setup_medio, cv_setup, frac_setup_zero = _estatisticas_pares(arrays['s'], elegivel)
+    bloqueio_medio, cv_bloqueio, _ = _estatisticas_pares(arrays['bk'], elegivel)
+
+    # Aperto das datas de saída: data / carga mínima do caminhão
+    caminhao = arrays['caminhao']
+    carga_caminhao = np.bincount(caminhao, weights=p_minimo, minlength=n_caminhoes + 1)[1:n_caminhoes + 1]
+    tamanho_caminhao = np.bincount(caminhao, minlength=n_caminhoes + 1)[1:n_caminhoes + 1].astype(np.float64)
+    com_carga = carga_caminhao > 0
+    aperto = d[com_carga] / carga_caminhao[com_carga]
+
+    distancia_media = cv_distancia = dispersao = vazio_medio = float('nan')
+    if coordenadas is not None:
+        carregada = (np.abs(coordenadas['destino_x'] - coordenadas['origem_x'])
+                     + np.abs(coordenadas['destino_y'] - coordenadas['origem_y']))
+        distancia_media = float(carregada.mean()) if len(carregada) else float('nan')
+        cv_distancia = _cv(carregada)
+        dispersao = float(np.sqrt(coordenadas['origem_x'].var() + coordenadas['origem_y'].var())) if len(carregada) else float('nan')
+        # Média do deslocamento em vazio (destino de i -> origem de j) sobre todos os pares, sem montar a matriz
+        vazio_medio = (_media_diferenca_absoluta(coordenadas['destino_x'], coordenadas['origem_x'])
+                       + _media_diferenca_absoluta(coordenadas['destino_y'], coordenadas['origem_y']))
+
+    valores = {
+        'n_operacoes': n_operacoes,
+        'n_maquinas': n_maquinas,
+        'n_caminhoes': n_caminhoes,
+        'densidade_elegibilidade': densidade.mean() if n_operacoes else float('nan'),
+        'desvio_elegibilidade': densidade.std() if n_operacoes else float('nan'),
+        'frac_operacoes_sem_maquina': _razao(np.count_nonzero(~com_maquina), n_operacoes),
+        'p_medio': p_medio,
+        'cv_p': _cv(p_elegiveis),
+        'cv_carga_maquinas': _cv(carga),
+        'razao_carga_maxima': _razao(carga.max(initial=0), carga.mean()) if n_maquinas else float('nan'),
+        'setup_medio': setup_medio,
+        'cv_setup': cv_setup,
+        'frac_setup_zero': frac_setup_zero,
+        'setup_relativo': _razao(setup_medio, p_medio),
+        'bloqueio_medio': bloqueio_medio,
+        'cv_bloqueio': cv_bloqueio,
+        'bloqueio_relativo': _razao(bloqueio_medio, p_medio),
+        'aperto_medio': aperto.mean() if len(aperto) else float('nan'),
+        'aperto_minimo': aperto.min() if len(aperto) else float('nan'),
+        'frac_caminhoes_apertados': _razao(np.count_nonzero(aperto < 1), len(aperto)),
+        'aperto_global': _razao(d.max(initial=0), p_minimo.sum() / n_maquinas) if n_maquinas else float('nan'),
+        'distancia_carregada_media': distancia_media,
+        'cv_distancia_carregada': cv_distancia,
+        'dispersao_origens': dispersao,
+        'distancia_vazio_media': vazio_medio,
+        'operacoes_por_caminhao_media': tamanho_caminhao.mean() if n_caminhoes else float('nan'),
+        'cv_operacoes_por_caminhao': _cv(tamanho_caminhao),
+        'razao_caminhao_maximo': _razao(tamanho_caminhao.max(initial=0), tamanho_caminhao.mean()) if n_caminhoes else float('nan'),
+    }
+    return np.array([valores[nome] for nome in NOMES_CARACTERISTICAS], dtype=np.float64)
+
+def caracteristicas_de_instancia(instancia: dict) -> np.ndarray:
+    """
+    Calcula as características (veja caracteristicas_instancia) de uma instância retornada por gerar_instancia,
+    incluindo as espaciais.
+    """
+
+    return caracteristicas_instancia(arrays_de_instancia(instancia), instancia.get('coordenadas'))
+
+def caracteristicas_arquivo(caminho: str) -> np.ndarray:
+    """
+    Calcula as características de uma instância salva em disco (.npz de salvar_arrays_instancia ou *_AMPL.txt).
+    Os arquivos não guardam as coordenadas, então as características espaciais são NaN.
+    """
+
+    arrays = carregar_arrays_instancia(caminho) if caminho.endswith('.npz') else ler_instancia_ampl(caminho)
+    return caracteristicas_instancia(arrays)
+
+def _caracteristicas_ou_nan(caminho: str) -> tuple[np.ndarray, str]:
+    # Executado nos processos de trabalho: um erro em um arquivo não interrompe os demais
+    try:
+        return caracteristicas_arquivo(caminho), None
+    except Exception as e:
+        return np.full(len(NOMES_CARACTERISTICAS), np.nan), str(e)
+
+def caracteristicas_diretorio(pasta: str, n_workers: int = None, tamanho_lote: int = 16) -> tuple[list[str], np.ndarray]:
+    """
+    Calcula as características de todas as instâncias de uma pasta (*_AMPL.npz e *_AMPL.txt; quando há os dois,
+    usa o .npz), em paralelo.
+
+    Parâmetros:
+    -----------
+    pasta : str
+        Pasta com as instâncias.
+    n_workers : int, opcional
+        Número de processos (padrão = número de núcleos). Se 0, calcula no processo principal.
+    tamanho_lote : int, opcional
+        Número de arquivos enviados a um processo de cada vez, para diluir o custo da comunicação quando há
+        muitas instâncias pequenas (padrão = 16).
+
+    Retorno:
+    --------
+    tuple[list[str], np.ndarray]
+        Os caminhos das instâncias, em ordem alfabética, e a matriz (n_instancias, len(NOMES_CARACTERISTICAS)).
+        Instâncias que não puderam ser lidas ficam com uma linha de NaN (e o erro é impresso).
+    """
+
+    instancias = {}
+    for sufixo in ('_AMPL.txt', '_AMPL.npz'):
+        instancias.update({nome[:-len(sufixo)]: os.path.join(pasta, nome) for nome in os.listdir(pasta) if nome.endswith(sufixo)})
+    caminhos = sorted(instancias.values())
+
+    if n_workers == 0:
+        resultados = [_caracteristicas_ou_nan(caminho) for caminho in caminhos]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            resultados = list(executor.map(_caracteristicas_ou_nan, caminhos, chunksize=tamanho_lote))
+
+    for caminho, (_, erro) in zip(caminhos, resultados):
+        if erro is not None:
+            print(f"Erro ao ler {os.path.basename(caminho)}: {erro}")
+    matriz = np.array([vetor for vetor, _ in resultados], dtype=np.float64).reshape(len(caminhos), len(NOMES_CARACTERISTICAS))
+    return caminhos, matriz
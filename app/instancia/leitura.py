@@ -0,0 +1,228 @@
+import re
+import numpy as np
+
+# Declaração de um parâmetro: nome, valor padrão opcional e, no formato de tabela, a lista de colunas
+_DECLARACAO = re.compile(r'\s*param\s+(\w+)\s*(?:default\s+(\S+)\s*)?(?::([^:=\[]*))?\s*$', re.DOTALL)
+
+# Declaração de um conjunto (e.g. set SCENARIOS), que os parâmetros já determinam
+_CONJUNTO = re.compile(r'\s*set\s+\w+\s*$')
+
+# Cabeçalho de uma fatia ([*,*,k] ou [*,c,*]), seguido da lista de colunas no formato de tabela
+_FATIA = re.compile(r'\[([^\]]*)\]\s*(?::([^:=]*):=)?')
+
+# Tipo de cada parâmetro da instância; os demais (e.g. H, ES, LS, M_op, A_max) são lidos como inteiros
+# quando todos os valores são inteiros
+_TIPOS = {'n_operations': np.int64, 'd': np.int64, 'pr': np.int64, 'Ri': np.int8, 'p': np.float64,
+          's': np.int32, 'bk': np.int32}
+
+def _numeros(texto: str) -> np.ndarray:
+    """
+    Converte de uma vez os números de um trecho do arquivo em um vetor float64 (o '.' do AMPL vira NaN).
+
+    Os arquivos só têm inteiros, então os tokens são localizados nos bytes do texto e convertidos com operações
+    vetorizadas, agrupados pelo número de dígitos. Se houver algum número com casas decimais, usa np.fromstring.
+    """
+
+    dados = np.frombuffer(texto.encode(), dtype=np.uint8)
+    # Tokens: sequências de '-', '.' e dígitos (bytes 45 a 57; '/' não aparece nos arquivos)
+    caractere = ((dados >= 45) & (dados <= 57)).view(np.int8)
+    borda = np.diff(caractere, prepend=np.int8(0), append=np.int8(0))
+    inicios = np.flatnonzero(borda == 1)
+    fins = np.flatnonzero(borda == -1)
+
+    primeiro = dados[inicios]
+    ausente = primeiro == ord('.')
+    if np.count_nonzero(dados == ord('.')) > np.count_nonzero(ausente) or (fins[ausente] - inicios[ausente] > 1).any():
+        return np.fromstring(texto.replace(' .', ' nan'), dtype=np.float64, sep=' ')
+
+    negativo = primeiro == ord('-')
+    comeco = inicios + negativo
+    digitos = fins - comeco
+    valores = np.zeros(len(inicios), dtype=np.float64)
+    for n_digitos in range(1, int(digitos.max(initial=0)) + 1):
+        tokens = np.flatnonzero(digitos == n_digitos)
+        posicao = comeco[tokens]
+        inteiro = dados[posicao].astype(np.int64) - ord('0')
+        for k in range(1, n_digitos):
+            inteiro = inteiro * 10 + dados[posicao + k] - ord('0')
+        valores[tokens] = inteiro
+    valores[negativo] *= -1
+    valores[ausente] = np.nan
+    return valores
+
+def _ler_corpo(corpo: str, colunas: str = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lê os valores de um parâmetro (o trecho depois de ':='), em qualquer dos formatos escritos por print_parametros:
+    tuplas (índices seguidos do valor), fatias [*,*,k] com tuplas ou fatias/parâmetros em tabela (linhas rotuladas
+    e colunas listadas no cabeçalho).
+
+    Retorno:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        Os índices (k, dimensão), a partir de 1, e os valores (k,) de cada entrada.
+    """
+
+    partes = _FATIA.split(corpo)
+    # Trecho antes da primeira fatia, seguido de (modelo, colunas, trecho) de cada fatia
+    trechos = [(None, colunas, partes[0])] + [tuple(partes[i:i + 3]) for i in range(1, len(partes), 3)]
+
+    todos_indices = []
+    todos_valores = []
+    for modelo, colunas_trecho, texto in trechos:
+        if modelo is None and not texto.strip():
+            continue
+        valores = _numeros(texto)
+
+        if modelo is not None:
+            modelo = [posicao.strip() for posicao in modelo.split(',')]
+        elif colunas_trecho is not None:
+            modelo = ['*', '*']
+        else:
+            # Tuplas fora de fatias: uma por linha, com os índices seguidos do valor
+            primeira = next(linha for linha in texto.splitlines() if linha.strip())
+            modelo = ['*'] * (len(primeira.split()) - 1)
+        livres = [posicao for posicao, indice in enumerate(modelo) if indice == '*']
+
+        if colunas_trecho is not None:
+            rotulos = np.array(colunas_trecho.split(), dtype=np.int64)
+            tabela = valores.reshape(-1, len(rotulos) + 1)
+            linhas = tabela[:, 0].astype(np.int64)
+            valores = tabela[:, 1:].ravel()
+            indices = np.empty((len(valores), len(modelo)), dtype=np.int64)
+            indices[:, livres[0]] = np.repeat(linhas, len(rotulos))
+            indices[:, livres[1]] = np.tile(rotulos, len(linhas))
+        else:
+            tuplas = valores.reshape(-1, len(livres) + 1)
+            valores = tuplas[:, -1]
+            indices = np.empty((len(valores), len(modelo)), dtype=np.int64)
+            indices[:, livres] = tuplas[:, :-1]
+        for posicao, indice in enumerate(modelo):
+            if indice != '*':
+                indices[:, posicao] = int(indice)
+
+        todos_indices.append(indices)
+        todos_valores.append(valores)
+
+    if not todos_indices:
+        return np.zeros((0, 0), dtype=np.int64), np.zeros(0)
+    return np.concatenate(todos_indices), np.concatenate(todos_valores)
+
+def _montar(indices: np.ndarray, valores: np.ndarray, forma: tuple, padrao: float, dtype: type) -> np.ndarray:
+    # Preenche um array com os valores lidos (índices a partir de 1); ausentes ficam com o padrão e NaN vira zero nos inteiros
+    array = np.full(forma, padrao, dtype=np.float64)
+    array[tuple((indices - 1).T)] = valores
+    if np.issubdtype(dtype, np.integer):
+        array = np.nan_to_num(array, nan=0.0)
+    return array.astype(dtype)
+
+def ler_parametros_ampl(caminho: str) -> dict[str, tuple[np.ndarray, np.ndarray, float]]:
+    """
+    Lê todas as declarações `param` de um arquivo AMPL, sem interpretá-las. As declarações `set` são ignoradas.
+
+    Retorno:
+    --------
+    dict[str, tuple[np.ndarray, np.ndarray, float]]
+        Para cada parâmetro, os índices (k, dimensão) a partir de 1, os valores (k,) e o valor padrão declarado
+        (None se não houver). Parâmetros escalares têm dimensão zero e um único valor.
+    """
+
+    with open(caminho) as f:
+        texto = f.read()
+
+    parametros = {}
+    for declaracao in texto.split(';'):
+        cabecalho, separador, corpo = declaracao.partition(':=')
+        if not separador:
+            continue
+        # Os comentários ficam entre as declarações, antes do 'param'
+        cabecalho = re.sub(r'#[^\n]*', '', cabecalho)
+        if _CONJUNTO.match(cabecalho):
+            continue
+        encontrado = _DECLARACAO.match(cabecalho)
+        if encontrado is None:
+            raise ValueError(f"Declaração não reconhecida no arquivo {caminho}: {cabecalho.strip()[:60]}")
+        nome, padrao, colunas = encontrado.groups()
+        indices, valores = _ler_corpo(corpo, colunas)
+        parametros[nome] = (indices, valores, float(padrao) if padrao is not None else None)
+    return parametros
+
+def ler_instancia_ampl(caminho: str) -> dict[str, np.ndarray]:
+    """
+    Lê um arquivo *_AMPL.txt escrito por pipeline_gerar_prints_parametros (ou pipeline_gerar_prints_cenarios) nos
+    arrays de montar_arrays_instancia, sem precisar gerar a instância novamente.
+
+    Aceita os formatos 'denso', 'esparso' e 'tabela', com ou sem a poda da elegibilidade. Cada seção é convertida de
+    uma vez (veja _numeros), e os tempos de setup e bloqueio são lidos uma fatia [*,*,k] por vez.
+
+    Parâmetros:
+    -----------
+    caminho : str
+        Caminho do arquivo.
+
+    Retorno:
+    --------
+    dict[str, np.ndarray]
+        As chaves de montar_arrays_instancia ('caminhao' vem da elegibilidade e é zero quando nenhuma operação
+        da tarefa tem máquinas elegíveis). Em um arquivo de cenários, há também 'n_scenarios', e 'p' e 'd' ganham o cenário como primeiro eixo.
+        Os demais parâmetros do arquivo (e.g. os limites H, ES, LS, M_op e A_max) são incluídos com o próprio nome.
+
+    Exceções:
+    ---------
+    ValueError
+        Se falta algum parâmetro da instância ou uma declaração não é reconhecida.
+    """
+
+    parametros = ler_parametros_ampl(caminho)
+    for nome in ('n_jobs', 'n_machines', 'n_caminhoes', 'n_operations', 'd', 'pr', 'Ri', 'p', 's', 'bk'):
+        if nome not in parametros:
+            raise ValueError(f"O arquivo {caminho} não tem o parâmetro {nome}.")
+
+    def escalar(nome: str) -> int:
+        return int(parametros[nome][1][0])
+
+    n_jobs = escalar('n_jobs')
+    n_maquinas = escalar('n_machines')
+    n_caminhoes = escalar('n_caminhoes')
+    n_operacoes = int(parametros['pr'][0][:, 0].max(initial=0))
+    cenarios = (escalar('n_scenarios'),) if 'n_scenarios' in parametros else ()
+
+    formas = {
+        'n_operations': (n_jobs,),
+        'd': (*cenarios, n_caminhoes),
+        'pr': (n_operacoes,),
+        'Ri': (n_operacoes, n_caminhoes, n_maquinas),
+        'p': (*cenarios, n_operacoes, n_maquinas),
+        's': (n_maquinas, n_operacoes, n_operacoes),
+        'bk': (n_maquinas, n_operacoes, n_operacoes),
+    }
+
+    arrays = {'n_jobs': np.array(n_jobs), 'n_machines': np.array(n_maquinas), 'n_caminhoes': np.array(n_caminhoes)}
+    for nome, (indices, valores, padrao) in parametros.items():
+        if nome in arrays:
+            continue
+        if nome in formas:
+            if nome in ('s', 'bk'):
+                # s[i,j,k] é guardado como tensor[k, i, j] (um parâmetro só com o valor padrão não tem índices)
+                indices = indices.reshape(-1, 3)[:, [2, 0, 1]]
+            padrao = padrao if padrao is not None else (np.nan if nome == 'p' else 0)
+            arrays[nome] = _montar(indices, valores, formas[nome], padrao, _TIPOS[nome])
+        else:
+            inteiro = bool(np.all(np.mod(valores[~np.isnan(valores)], 1) == 0))
+            dtype = np.int64 if inteiro else np.float64
+            if indices.shape[1] == 0:
+                arrays[nome] = np.array(valores[0]).astype(dtype)
+            else:
+                forma = tuple(indices.max(axis=0))
+                arrays[nome] = _montar(indices, valores, forma, padrao if padrao is not None else 0, dtype)
+
+    # Caminhão de cada operação, a partir da elegibilidade; uma operação sem máquinas elegíveis herda o caminhão
+    # do predecessor ou do sucessor (operações da mesma tarefa são do mesmo caminhão)
+    elegivel = arrays['Ri'].any(axis=2)
+    caminhao = np.where(elegivel.any(axis=1), elegivel.argmax(axis=1) + 1, 0).astype(np.int64)
+    operacoes = np.flatnonzero(arrays['pr'] > 0)
+    predecessores = arrays['pr'][operacoes] - 1
+    for _ in range(int(arrays['n_operations'].max(initial=1))):
+        caminhao[operacoes] = np.where(caminhao[operacoes] == 0, caminhao[predecessores], caminhao[operacoes])
+        caminhao[predecessores] = np.where(caminhao[predecessores] == 0, caminhao[operacoes], caminhao[predecessores])
+    arrays['caminhao'] = caminhao
+    return arrays
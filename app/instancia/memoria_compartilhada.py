@@ -0,0 +1,158 @@
+import os
+import pickle
+import threading
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+
+# Alinhamento (em bytes) de cada array dentro do segmento
+ALINHAMENTO = 64
+
+# Segmentos abertos neste processo (publicados ou anexados), pelo nome
+_segmentos = {}
+
+# Segmentos que não puderam ser fechados porque ainda havia arrays usando o mapeamento
+_fechamento_pendente = []
+
+# O resource_tracker só acompanha segmentos POSIX. No Windows, o segmento deixa de existir quando o último
+# processo que o tem aberto o fecha
+_POSIX = os.name == 'posix'
+
+# Serializa a abertura e o cancelamento do registro de segmentos entre as threads do processo
+_trava = threading.Lock()
+
+def _nome_tracker(segmento: shared_memory.SharedMemory) -> str:
+    # Nome com que o SharedMemory registra o segmento no resource_tracker (com a '/' inicial no POSIX)
+    return segmento._name
+
+def _abrir(nome: str) -> shared_memory.SharedMemory:
+    # Abre um segmento existente sem mantê-lo registrado no resource_tracker: o tracker de um processo de trabalho
+    # removeria, quando o processo termina, um segmento que ainda é usado pelo processo principal
+    try:
+        return shared_memory.SharedMemory(name=nome, track=False)
+    except TypeError:
+        # Python < 3.13 sempre registra o segmento aberto; o registro é desfeito logo em seguida
+        with _trava:
+            segmento = shared_memory.SharedMemory(name=nome)
+            if _POSIX:
+                resource_tracker.unregister(_nome_tracker(segmento), 'shared_memory')
+            return segmento
+
+def _fechar(segmento: shared_memory.SharedMemory) -> bool:
+    # Fecha o mapeamento local; retorna False se ainda há arrays apontando para ele
+    try:
+        segmento.close()
+        return True
+    except BufferError:
+        return False
+
+def publicar_objeto(objeto, remover_aqui: bool = True) -> dict:
+    """
+    Publica um objeto (e.g. um dicionário de arrays, como as saídas de gerar_instancia) em um segmento de memória
+    compartilhada, para que outros processos o leiam sem cópia.
+
+    O objeto é serializado com o protocolo 5 do pickle: os arrays contíguos do numpy são copiados uma única vez
+    para o segmento, e o restante (dicionários, listas, escalares) fica no descritor, que é pequeno e pode ser
+    enviado aos processos de trabalho no lugar do objeto.
+
+    Parâmetros:
+    -----------
+    objeto :
+        Objeto a publicar.
+    remover_aqui : bool, opcional
+        Se True (padrão), o segmento pertence a este processo, que deve removê-lo com liberar_objeto (ou use
+        objeto_compartilhado); se o processo terminar sem removê-lo, o resource_tracker o remove. Use False em
+        um processo de trabalho que publica um resultado para o processo principal remover. Fora do POSIX, o
+        segmento não sobreviveria ao fechamento neste processo; com False, o objeto é então serializado inteiro
+        no descritor, e anexar_objeto o desserializa sem usar memória compartilhada.
+
+    Retorno:
+    --------
+    dict
+        Descritor do objeto publicado, usado em anexar_objeto e liberar_objeto.
+    """
+
+    if not remover_aqui and not _POSIX:
+        return {'nome': None, 'dados': pickle.dumps(objeto, protocol=5), 'buffers': []}
+
+    buffers = []
+    dados = pickle.dumps(objeto, protocol=5, buffer_callback=buffers.append)
+    visoes = [buffer.raw() for buffer in buffers]
+
+    posicoes = []
+    tamanho = 0
+    for visao in visoes:
+        posicoes.append((tamanho, visao.nbytes))
+        tamanho += -(-visao.nbytes // ALINHAMENTO) * ALINHAMENTO
+    if not visoes:
+        return {'nome': None, 'dados': dados, 'buffers': []}
+
+    segmento = shared_memory.SharedMemory(create=True, size=max(tamanho, 1))
+    if not remover_aqui and _POSIX:
+        resource_tracker.unregister(_nome_tracker(segmento), 'shared_memory')
+    for visao, (inicio, n_bytes) in zip(visoes, posicoes):
+        segmento.buf[inicio:inicio + n_bytes] = visao
+    _segmentos[segmento.name] = segmento
+    return {'nome': segmento.name, 'dados': dados, 'buffers': posicoes}
+
+def anexar_objeto(descritor: dict, somente_leitura: bool = True):
+    """
+    Reconstrói, em qualquer processo, um objeto publicado por publicar_objeto. Os arrays são visões do segmento
+    compartilhado (sem cópia) e, por padrão, somente leitura. O segmento fica aberto no processo até liberar_objeto.
+    """
+
+    nome = descritor['nome']
+    if nome is None:
+        return pickle.loads(descritor['dados'])
+    segmento = _segmentos.get(nome)
+    if segmento is None:
+        segmento = _segmentos[nome] = _abrir(nome)
+    buffer = segmento.buf.toreadonly() if somente_leitura else segmento.buf
+    return pickle.loads(descritor['dados'], buffers=[buffer[inicio:inicio + n_bytes] for inicio, n_bytes in descritor['buffers']])
+
+def liberar_objeto(descritor: dict, remover: bool = True) -> None:
+    """
+    Fecha o segmento de um objeto publicado neste processo e, se remover=True, o remove do sistema (os processos
+    que ainda o têm aberto continuam lendo até fechá-lo). Use remover=False nos processos que só anexaram o objeto,
+    ou no processo de trabalho que publicou um resultado para outro processo remover.
+
+    Se ainda houver arrays do objeto em uso neste processo, o fechamento é adiado para a próxima chamada.
+    Remover um segmento que já foi removido não é um erro.
+    """
+
+    _fechamento_pendente[:] = [segmento for segmento in _fechamento_pendente if not _fechar(segmento)]
+
+    nome = descritor['nome']
+    if nome is None:
+        return
+    segmento = _segmentos.pop(nome, None)
+    if segmento is None:
+        if not remover:
+            return
+        try:
+            segmento = _abrir(nome)
+        except FileNotFoundError:
+            return
+    if remover:
+        # unlink desfaz o registro no resource_tracker; registra antes (o registro não se acumula), pois o segmento
+        # pode ter sido criado em outro processo ou anexado por um processo de trabalho que compartilha o tracker
+        if _POSIX:
+            resource_tracker.register(_nome_tracker(segmento), 'shared_memory')
+        try:
+            segmento.unlink()
+        except FileNotFoundError:
+            pass
+    if not _fechar(segmento):
+        _fechamento_pendente.append(segmento)
+
+@contextmanager
+def objeto_compartilhado(objeto):
+    """
+    Publica um objeto em memória compartilhada durante o bloco `with` e o remove ao sair (mesmo em caso de erro).
+    Retorna o descritor, que é o que deve ser enviado aos processos de trabalho (veja anexar_objeto).
+    """
+
+    descritor = publicar_objeto(objeto)
+    try:
+        yield descritor
+    finally:
+        liberar_objeto(descritor)
@@ -1 +1,2 @@
-from .pipeline_layout import pipeline_gerar_layout_e_caminhos_processamento
\ No newline at end of file
+from .pipeline_layout import pipeline_gerar_layout_e_caminhos_processamento
+from .alocacao import operacoes_da_area
\ No newline at end of file
@@ -0,0 +1,105 @@
+import numpy as np
+
+def extrair_pontos_operacoes(coordenadas: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    Monta as matrizes de coordenadas de origem e destino de cada operação a partir dos vetores de coordenadas.
+
+    Operações ímpares partem de um estoque (ou das docas de entrada) e terminam no ponto de Picking da própria operação.
+    Operações pares partem do ponto de Picking da operação anterior e terminam nas docas de saída.
+
+    Parâmetros:
+    -----------
+    coordenadas : dict[str, np.ndarray]
+        Coordenadas das operações retornadas por alocar_pontos_operacoes.
+
+    Retorno:
+    --------
+    dict[str, np.ndarray]
+        Dicionário contendo:
+        - 'operacoes': vetor (n,) com o número das operações, em ordem crescente.
+        - 'origem': matriz (n, 2) com as coordenadas (x, y) de origem de cada operação.
+        - 'destino': matriz (n, 2) com as coordenadas (x, y) de destino de cada operação.
+    """
+
+    return {
+        'operacoes': coordenadas['operacoes'],
+        'origem': np.column_stack((coordenadas['origem_x'], coordenadas['origem_y'])),
+        'destino': np.column_stack((coordenadas['destino_x'], coordenadas['destino_y'])),
+    }
+
+def matriz_distancias_vazio(origem: np.ndarray,
+                            destino: np.ndarray,
+                            dtype: type = np.float64,
+                            tamanho_bloco: int = None) -> np.ndarray:
+    """
+    Calcula a matriz de distâncias de Manhattan percorridas em vazio entre o fim de cada operação e o início das demais.
+
+    Parâmetros:
+    -----------
+    origem : np.ndarray
+        Matriz (n, 2) com as coordenadas de origem das operações.
+    destino : np.ndarray
+        Matriz (k, 2) com as coordenadas de destino das operações (todas, k = n, ou apenas um bloco de linhas).
+    dtype : type, opcional
+        Tipo numérico da matriz resultante (e.g., np.float32 para reduzir a memória pela metade). Padrão é np.float64.
+    tamanho_bloco : int, opcional
+        Número de linhas calculadas por vez. Limita a memória temporária a O(tamanho_bloco * n) em instâncias grandes.
+        Se None, a matriz é calculada de uma só vez.
+
+    Retorno:
+    --------
+    np.ndarray
+        Matriz (k, n) onde o elemento [i, j] é a distância de Manhattan entre o destino da operação i e a origem da operação j.
+    """
+
+    origem = np.asarray(origem, dtype=dtype)
+    destino = np.asarray(destino, dtype=dtype)
+    n = origem.shape[0]
+    k = destino.shape[0]
+
+    if tamanho_bloco is None or tamanho_bloco >= k:
+        return (np.abs(destino[:, 0, None] - origem[None, :, 0]) + np.abs(destino[:, 1, None] - origem[None, :, 1])).astype(dtype, copy=False)
+
+    distancias = np.empty((k, n), dtype=dtype)
+    for inicio in range(0, k, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, k)
+        bloco = distancias[inicio:fim]
+        np.abs(destino[inicio:fim, 0, None] - origem[None, :, 0], out=bloco)
+        bloco += np.abs(destino[inicio:fim, 1, None] - origem[None, :, 1])
+    return distancias
+
+def calcular_distancias_operacoes(coordenadas: dict[str, np.ndarray],
+                                  dtype: type = np.float64,
+                                  tamanho_bloco: int = None,
+                                  vazio: bool = True) -> dict[str, np.ndarray]:
+    """
+    Pré-calcula as distâncias de todas as operações para reuso pelas etapas de geração e de análise.
+
+    Parâmetros:
+    -----------
+    coordenadas : dict[str, np.ndarray]
+        Coordenadas das operações retornadas por alocar_pontos_operacoes.
+    dtype : type, opcional
+        Tipo numérico das distâncias (padrão é np.float64).
+    tamanho_bloco : int, opcional
+        Número de linhas da matriz de deslocamento em vazio calculadas por vez (veja matriz_distancias_vazio).
+    vazio : bool, opcional
+        Se False, não monta a matriz (n, n) de deslocamento em vazio, que pode ser calculada por blocos a partir
+        de 'origem' e 'destino' (padrão = True).
+
+    Retorno:
+    --------
+    dict[str, np.ndarray]
+        Dicionário com as chaves de extrair_pontos_operacoes e também:
+        - 'carregado': vetor (n,) com a distância de Manhattan entre origem e destino de cada operação.
+        - 'vazio': matriz (n, n) com a distância do destino da operação i até a origem da operação j (apenas com vazio=True).
+    """
+
+    pontos = extrair_pontos_operacoes(coordenadas)
+    origem = pontos['origem']
+    destino = pontos['destino']
+
+    pontos['carregado'] = np.abs(destino - origem).sum(axis=1).astype(dtype, copy=False)
+    if vazio:
+        pontos['vazio'] = matriz_distancias_vazio(origem, destino, dtype, tamanho_bloco)
+    return pontos
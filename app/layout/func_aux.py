@@ -1,92 +1,127 @@
-import matplotlib.pyplot as plt
-
-def plotar_todas_combinacoes(fig, ax, coordenadas_detalhadas, linewidth=3):
-    """
-    Função que plota os caminhos entre todas as operações de origem usando a distância de Manhattan.
-
-    Parâmetros:
-    fig : matplotlib.figure.Figure
-        A figura onde o gráfico será desenhado.
-    ax : matplotlib.axes._subplots.AxesSubplot
-        Eixo onde o layout e os caminhos serão desenhados.
-    coordenadas_detalhadas : dict
-        Dicionário contendo as operações como chave e suas coordenadas (x, y) como valor.
-        Exemplo: {'1o': (20, 30), '2o': (25, 35), '1d': (30, 40)}
-    """
-    # Filtrar apenas as operações de origem
-    operacoes_origem = {op: coord for op, coord in coordenadas_detalhadas.items() if op.endswith('o')}
-    
-    # Variável para armazenar a primeira linha traçada
-    primeira_linha = None
-    
-    # Plotar todos os caminhos de todas as combinações de operações de origem
-    for op1, (x1, y1) in operacoes_origem.items():
-        for op2, (x2, y2) in operacoes_origem.items():
-            if op1 != op2:  # Evitar traçar um caminho para si mesmo
-                # Caminho em marrom usando a distância de Manhattan
-                # Caminho horizontal
-                linha_horizontal, = ax.plot([x1, x2], [y1, y1], 'brown', linestyle='--', linewidth=linewidth)
-                # Caminho vertical
-                linha_vertical, = ax.plot([x2, x2], [y1, y2], 'brown', linestyle='--', linewidth=linewidth)
-                
-                # Armazenar a primeira linha traçada para a legenda
-                if primeira_linha is None:
-                    primeira_linha = linha_horizontal
-    
-    # Adicionar título para o gráfico
-    ax.set_title('Caminhos entre todas as operações de origem usando Manhattan')
-    
-    # Adicionar legenda, se alguma linha foi traçada
-    if primeira_linha:
-        ax.legend([primeira_linha], ['Deslocamento setup'], loc='best')
-    
-    return fig, ax
-
-def plotar_caminhos_picking(fig, ax, coordenadas_por_area, linewidth=2):
-    """
-    Plota todos os caminhos entre as operações no Picking usando a distância de Manhattan.
-
-    Parâmetros:
-    fig : matplotlib.figure.Figure
-        A figura onde o gráfico será desenhado.
-    ax : matplotlib.axes._subplots.AxesSubplot
-        Eixo onde o layout e os caminhos serão desenhados.
-    coordenadas_por_area : dict
-        Dicionário contendo as áreas e as coordenadas de cada operação.
-    linewidth : int, optional
-        Espessura das linhas dos caminhos (default: 2).
-    """
-
-    # Filtrar as coordenadas das operações no Picking
-    operacoes_picking = coordenadas_por_area.get('Picking', {})
-
-    # Verificar se há operações suficientes no Picking para calcular caminhos
-    if len(operacoes_picking) < 2:
-        print("Não há operações suficientes no Picking para traçar caminhos.")
-        return fig, ax
-
-    # Variável para armazenar a primeira linha traçada
-    primeira_linha = None
-
-    # Plotar todos os caminhos entre as operações no Picking
-    for op1, coord1 in operacoes_picking.items():
-        for op2, coord2 in operacoes_picking.items():
-            if op1 != op2:  # Evitar traçar um caminho para a mesma operação
-                # Caminho em marrom usando a distância de Manhattan
-                # Caminho horizontal
-                linha_horizontal, = ax.plot([coord1[0], coord2[0]], [coord1[1], coord1[1]], 'brown', linestyle='--', linewidth=linewidth)
-                # Caminho vertical
-                linha_vertical, = ax.plot([coord2[0], coord2[0]], [coord1[1], coord2[1]], 'brown', linestyle='--', linewidth=linewidth)
-                
-                # Armazenar a primeira linha traçada para a legenda
-                if primeira_linha is None:
-                    primeira_linha = linha_horizontal
-
-    # Adicionar título para o gráfico
-    ax.set_title('Caminhos entre operações no Picking (Distância Manhattan)')
-
-    # Adicionar legenda, se alguma linha foi traçada
-    if primeira_linha:
-        ax.legend([primeira_linha], ['Deslocamento setup'], loc='best')
-
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+def segmentos_manhattan(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray) -> np.ndarray:
+    """
+    Monta os segmentos dos caminhos de Manhattan de (x1, y1) até (x2, y2): primeiro na horizontal e depois na vertical.
+
+    Retorno:
+    --------
+    np.ndarray
+        Array (2 * k, 2, 2) com os segmentos horizontais seguidos dos verticais, no formato de LineCollection.
+    """
+
+    horizontais = np.stack([np.column_stack([x1, y1]), np.column_stack([x2, y1])], axis=1)
+    verticais = np.stack([np.column_stack([x2, y1]), np.column_stack([x2, y2])], axis=1)
+    return np.concatenate([horizontais, verticais]).astype(np.float64)
+
+def adicionar_segmentos(ax, segmentos: np.ndarray, cor: str, linestyle: str = '--', linewidth: float = 3,
+                        largura_maxima: float = 4) -> LineCollection:
+    """
+    Desenha os segmentos em uma única LineCollection. Segmentos repetidos (nos dois sentidos) são desenhados uma vez,
+    com a espessura crescendo com o logaritmo da multiplicidade, até largura_maxima vezes linewidth. Segmentos de
+    comprimento zero são descartados.
+
+    Parâmetros:
+    -----------
+    ax : matplotlib.axes.Axes
+        Eixo onde os segmentos serão desenhados.
+    segmentos : np.ndarray
+        Array (k, 2, 2) com os pontos inicial e final de cada segmento (veja segmentos_manhattan).
+    cor, linestyle : str
+        Cor e estilo das linhas.
+    linewidth : float, opcional
+        Espessura de um segmento que aparece uma vez (padrão = 3).
+    largura_maxima : float, opcional
+        Espessura máxima, em múltiplos de linewidth (padrão = 4).
+
+    Retorno:
+    --------
+    LineCollection
+        A coleção adicionada ao eixo (útil como item da legenda).
+    """
+
+    # Mesmo segmento nos dois sentidos: ordena os pontos de cada segmento antes de agrupar
+    pontos = segmentos.reshape(-1, 2, 2)
+    invertido = (pontos[:, 1, 0] < pontos[:, 0, 0]) | ((pontos[:, 1, 0] == pontos[:, 0, 0]) & (pontos[:, 1, 1] < pontos[:, 0, 1]))
+    pontos = np.where(invertido[:, None, None], pontos[:, ::-1], pontos)
+    pontos = pontos[(pontos[:, 0] != pontos[:, 1]).any(axis=1)]
+
+    unicos, multiplicidade = np.unique(pontos.reshape(-1, 4), axis=0, return_counts=True)
+    # Sem segmentos, a coleção fica com a espessura base (usada pela legenda)
+    larguras = linewidth * np.minimum(1 + np.log(multiplicidade), largura_maxima) if len(unicos) else linewidth
+
+    colecao = LineCollection(unicos.reshape(-1, 2, 2), colors=cor, linestyles=linestyle, linewidths=larguras)
+    ax.add_collection(colecao, autolim=True)
+    ax.autoscale_view()
+    return colecao
+
+def plotar_todas_combinacoes(fig, ax, coordenadas_detalhadas, linewidth=3):
+    """
+    Função que plota os caminhos entre todas as operações de origem usando a distância de Manhattan.
+
+    Parâmetros:
+    fig : matplotlib.figure.Figure
+        A figura onde o gráfico será desenhado.
+    ax : matplotlib.axes._subplots.AxesSubplot
+        Eixo onde o layout e os caminhos serão desenhados.
+    coordenadas_detalhadas : dict
+        Dicionário contendo as operações como chave e suas coordenadas (x, y) como valor.
+        Exemplo: {'1o': (20, 30), '2o': (25, 35), '1d': (30, 40)}
+    """
+    # Filtrar apenas as operações de origem
+    origens = np.array([coord for op, coord in coordenadas_detalhadas.items() if op.endswith('o')], dtype=np.float64).reshape(-1, 2)
+
+    # Todos os pares ordenados de operações de origem distintas
+    i, j = np.nonzero(~np.eye(len(origens), dtype=bool))
+
+    # Caminhos em marrom usando a distância de Manhattan, em uma única coleção
+    if len(i):
+        segmentos = segmentos_manhattan(origens[i, 0], origens[i, 1], origens[j, 0], origens[j, 1])
+        colecao = adicionar_segmentos(ax, segmentos, 'brown', '--', linewidth)
+
+    # Adicionar título para o gráfico
+    ax.set_title('Caminhos entre todas as operações de origem usando Manhattan')
+
+    # Adicionar legenda, se alguma linha foi traçada
+    if len(i):
+        ax.legend([colecao], ['Deslocamento setup'], loc='best')
+
+    return fig, ax
+
+def plotar_caminhos_picking(fig, ax, coordenadas, linewidth=2):
+    """
+    Plota todos os caminhos entre as operações no Picking usando a distância de Manhattan.
+
+    Parâmetros:
+    fig : matplotlib.figure.Figure
+        A figura onde o gráfico será desenhado.
+    ax : matplotlib.axes._subplots.AxesSubplot
+        Eixo onde o layout e os caminhos serão desenhados.
+    coordenadas : dict
+        Coordenadas das operações retornadas por alocar_pontos_operacoes (o ponto de Picking é o destino das operações ímpares).
+    linewidth : int, optional
+        Espessura das linhas dos caminhos (default: 2).
+    """
+
+    # Filtrar as coordenadas das operações no Picking
+    x = coordenadas['destino_x'][::2]
+    y = coordenadas['destino_y'][::2]
+
+    # Verificar se há operações suficientes no Picking para calcular caminhos
+    if len(x) < 2:
+        print("Não há operações suficientes no Picking para traçar caminhos.")
+        return fig, ax
+
+    # Todos os caminhos entre pares ordenados de operações distintas no Picking, em uma única coleção
+    i, j = np.nonzero(~np.eye(len(x), dtype=bool))
+    colecao = adicionar_segmentos(ax, segmentos_manhattan(x[i], y[i], x[j], y[j]), 'brown', '--', linewidth)
+
+    # Adicionar título para o gráfico
+    ax.set_title('Caminhos entre operações no Picking (Distância Manhattan)')
+
+    # Adicionar legenda
+    ax.legend([colecao], ['Deslocamento setup'], loc='best')
+
     return fig, ax
\ No newline at end of file
@@ -1,82 +1,233 @@
-from layout import pipeline_gerar_layout_e_caminhos_processamento
-from prints import pipeline_gerar_prints_parametros
-from parametros_basicos import pipeline_gerar_todas_tarefas_e_operacoes
-from parametros_avancados import pipeline_parametros_avancados
-
-def main(num_estoques, 
-         n_tarefas_estoque,
-         n_tarefas_docas,
-         num_docas, 
-         picking_width_units, 
-         n_caminhoes, 
-         mesmo_ponto_picking, 
-         n_maquinas,  
-         n_operacoes_por_tarefa, 
-         proporcao_maquinas, 
-         proporcao_areas,
-         proporcao_rapidas,
-         deterministico,
-         vel_min_emp_rapida, 
-         vel_max_emp_rapida, 
-         vel_min_emp_lenta, 
-         vel_max_emp_lenta, 
-         t_min_block, 
-         t_max_block, 
-         t_min_setup, 
-         t_max_setup, 
-         todos_caminhoes_atrasados, 
-         todos_caminhoes_adiantados,
-         pasta = '../data/instancias/',
-         grid_spacing = 5):
-
-     parametros_basicos = pipeline_gerar_todas_tarefas_e_operacoes(num_estoques,
-                                                                   n_tarefas_estoque,
-                                                                   n_tarefas_docas,
-                                                                   n_caminhoes, 
-                                                                   n_operacoes_por_tarefa)     
-     
-     
-     coordenadas_por_area, area_indices, coordenadas_detalhadas = pipeline_gerar_layout_e_caminhos_processamento(num_estoques, 
-                                                                           parametros_basicos['operacoes_por_area_final'], 
-                                                                           num_docas, 
-                                                                           picking_width_units, 
-                                                                           n_caminhoes, 
-                                                                           parametros_basicos['operacoes_por_caminhao'], 
-                                                                           mesmo_ponto_picking, 
-                                                                           grid_spacing)
-
-     elegibilidade, datas_entrega, tempos_setup, tempos_bloqueios, tempos_processamento = pipeline_parametros_avancados(n_maquinas, 
-                                                                                                  parametros_basicos['operacoes_por_area_final'], 
-                                                                                                  parametros_basicos['operacoes_por_caminhao'], 
-                                                                                                  proporcao_maquinas, 
-                                                                                                  proporcao_rapidas, 
-                                                                                                  proporcao_areas, 
-                                                                                                  coordenadas_por_area, 
-                                                                                                  deterministico, 
-                                                                                                  vel_min_emp_rapida, 
-                                                                                                  vel_max_emp_rapida, 
-                                                                                                  vel_min_emp_lenta, 
-                                                                                                  vel_max_emp_lenta, 
-                                                                                                  t_min_block, 
-                                                                                                  t_max_block, 
-                                                                                                  t_min_setup, 
-                                                                                                  t_max_setup, 
-                                                                                                  todos_caminhoes_atrasados, 
-                                                                                                  todos_caminhoes_adiantados)
-
-     pipeline_gerar_prints_parametros(n_maquinas,
-                                      n_tarefas_docas,
-                                      n_tarefas_estoque,
-                                      parametros_basicos, 
-                                      elegibilidade, 
-                                      tempos_processamento, 
-                                      datas_entrega, 
-                                      n_operacoes_por_tarefa, 
-                                      tempos_bloqueios, 
-                                      n_caminhoes, 
-                                      tempos_setup,
-                                      todos_caminhoes_atrasados,
-                                      todos_caminhoes_adiantados, 
-                                      pasta)
-     
-     return area_indices, coordenadas_detalhadas, elegibilidade
\ No newline at end of file
+import time
+import tracemalloc
+from layout import pipeline_gerar_layout_e_caminhos_processamento
+from prints import pipeline_gerar_prints_parametros, pipeline_gerar_prints_cenarios, estimar_instancia, ajustar_modelo_custo, aplicar_politica, formatar_estimativa
+from parametros_basicos import pipeline_gerar_todas_tarefas_e_operacoes
+from parametros_avancados import etapas_parametros_avancados, amostrar_cenarios
+from simulacao import parametros_simulacao
+from etapas import etapa, executar_etapas
+
+# Valores padrão dos parâmetros opcionais de main() usados como entradas das etapas
+PARAMETROS_PADRAO = {'grid_spacing': 5, 'modo_setup': 'aleatorio', 'pasta_temporaria': None, 'limite_memoria': None}
+
+def etapas_layout() -> list[dict]:
+     """
+     Retorna as etapas que definem o armazém de uma instância (tarefas, operações e layout), que não dependem
+     das empilhadeiras nem dos tempos.
+     """
+
+     return [
+          # Gera tarefas, operações, predecessores e a distribuição das operações por área e por caminhão
+          etapa('parametros_basicos',
+                lambda num_estoques, n_tarefas_estoque, n_tarefas_docas, n_caminhoes, n_operacoes_por_tarefa:
+                     _parametros_basicos(num_estoques, n_tarefas_estoque, n_tarefas_docas, n_caminhoes, n_operacoes_por_tarefa),
+                ['num_estoques', 'n_tarefas_estoque', 'n_tarefas_docas', 'n_caminhoes', 'n_operacoes_por_tarefa'],
+                ['parametros_basicos', 'operacoes_por_area', 'operacoes_por_caminhao']),
+
+          # Gera o layout, as coordenadas das operações e as distâncias entre elas
+          etapa('layout',
+                lambda num_estoques, operacoes_por_area, num_docas, picking_width_units, n_caminhoes, operacoes_por_caminhao, mesmo_ponto_picking, grid_spacing:
+                     pipeline_gerar_layout_e_caminhos_processamento(num_estoques, operacoes_por_area, num_docas, picking_width_units, n_caminhoes, operacoes_por_caminhao, mesmo_ponto_picking, grid_spacing),
+                ['num_estoques', 'operacoes_por_area', 'num_docas', 'picking_width_units', 'n_caminhoes', 'operacoes_por_caminhao', 'mesmo_ponto_picking', 'grid_spacing'],
+                ['coordenadas', 'area_indices', 'distancias']),
+     ]
+
+def etapas_instancia(modo_setup: str = 'aleatorio') -> list[dict]:
+     """
+     Retorna o grafo de etapas completo da geração de uma instância: tarefas, layout e parâmetros avançados.
+
+     As entradas externas esperadas são os parâmetros de main(), com 'num_maquinas' no lugar de 'n_maquinas'.
+     """
+
+     return [*etapas_layout(), *etapas_parametros_avancados(modo_setup)]
+
+def _parametros_basicos(num_estoques, n_tarefas_estoque, n_tarefas_docas, n_caminhoes, n_operacoes_por_tarefa):
+     parametros_basicos = pipeline_gerar_todas_tarefas_e_operacoes(num_estoques,
+                                                                   n_tarefas_estoque,
+                                                                   n_tarefas_docas,
+                                                                   n_caminhoes, 
+                                                                   n_operacoes_por_tarefa)
+     return parametros_basicos, parametros_basicos['operacoes_por_area_final'], parametros_basicos['operacoes_por_caminhao']
+
+def gerar_instancia(parametros: dict, seed: int = None, cache: dict = None) -> dict:
+     """
+     Gera todos os dados de uma instância, sem escrevê-la em disco.
+
+     Parâmetros:
+     -----------
+     parametros : dict
+          Parâmetros de main() (sem 'pasta', 'seed' e 'cache'), indexados pelo nome.
+     seed : int, opcional
+          Semente global. Quando informada junto com `cache`, as etapas cujas entradas não mudaram desde a última
+          chamada são reaproveitadas, e apenas as etapas a jusante dos parâmetros alterados são recalculadas.
+     cache : dict, opcional
+          Dicionário mantido pelo chamador entre chamadas, onde as saídas das etapas são memorizadas.
+
+     Retorno:
+     --------
+     dict
+          A instância: as saídas de todas as etapas (parametros_basicos, coordenadas, area_indices,
+          distancias, elegibilidade, tempos_processamento, tempos_setup, tempos_bloqueios,
+          datas_entrega, ...) e, em 'parametros', os parâmetros usados.
+     """
+
+     parametros = dict(PARAMETROS_PADRAO, **parametros)
+
+     valores = dict(parametros, num_maquinas=parametros['n_maquinas'])
+     instancia = executar_etapas(etapas_instancia(parametros['modo_setup']), valores, seed, cache)
+     instancia['parametros'] = parametros
+     return instancia
+
+def escrever_instancia(instancia: dict, pasta: str = '../data/instancias/', formato: str = 'denso', podar_elegibilidade: bool = False,
+                       limites: bool = False) -> str:
+     """
+     Escreve uma instância gerada por gerar_instancia no formato AMPL (ou binário, veja pipeline_gerar_prints_parametros)
+     e retorna o caminho do arquivo gerado.
+     """
+
+     parametros = instancia['parametros']
+     return pipeline_gerar_prints_parametros(parametros['n_maquinas'],
+                                      parametros['n_tarefas_docas'],
+                                      parametros['n_tarefas_estoque'],
+                                      instancia['parametros_basicos'], 
+                                      instancia['elegibilidade'], 
+                                      instancia['tempos_processamento'], 
+                                      instancia['datas_entrega'], 
+                                      parametros['n_operacoes_por_tarefa'], 
+                                      instancia['tempos_bloqueios'], 
+                                      parametros['n_caminhoes'], 
+                                      instancia['tempos_setup'],
+                                      parametros['todos_caminhoes_atrasados'],
+                                      parametros['todos_caminhoes_adiantados'], 
+                                      pasta,
+                                      formato,
+                                      podar_elegibilidade,
+                                      limites)
+
+def escrever_cenarios(instancia: dict,
+                      n_cenarios: int,
+                      pasta: str = '../data/instancias/',
+                      formato: str = 'denso',
+                      podar_elegibilidade: bool = False,
+                      seed: int = None) -> str:
+     """
+     Sorteia n_cenarios cenários de tempos de processamento e datas de saída sobre o layout, a elegibilidade e as
+     precedências de uma instância gerada por gerar_instancia, e os escreve em um único arquivo
+     (veja pipeline_gerar_prints_cenarios). Retorna o caminho do arquivo gerado.
+     """
+
+     parametros = instancia['parametros']
+     simulacao = parametros_simulacao(instancia)
+     cenarios = amostrar_cenarios(simulacao['distancia'], simulacao['vel_min'], simulacao['vel_max'],
+                                  instancia['operacoes_por_caminhao'], n_cenarios,
+                                  parametros['todos_caminhoes_atrasados'], parametros['todos_caminhoes_adiantados'], seed)
+     return pipeline_gerar_prints_cenarios(parametros['n_maquinas'],
+                                           parametros['n_tarefas_docas'],
+                                           parametros['n_tarefas_estoque'],
+                                           instancia['parametros_basicos'],
+                                           instancia['elegibilidade'],
+                                           cenarios,
+                                           parametros['n_operacoes_por_tarefa'],
+                                           instancia['tempos_bloqueios'],
+                                           parametros['n_caminhoes'],
+                                           instancia['tempos_setup'],
+                                           parametros['todos_caminhoes_atrasados'],
+                                           parametros['todos_caminhoes_adiantados'],
+                                           pasta,
+                                           formato,
+                                           podar_elegibilidade)
+
+def calibrar_modelo_custo(parametros: dict, pasta: str, formato: str = 'denso', modelo: dict = None) -> dict:
+     """
+     Gera e escreve uma instância de referência (de preferência pequena), medindo tempo e memória, e ajusta
+     o modelo de custo usado por estimar_instancia.
+
+     A geração é executada duas vezes: uma para medir o tempo e outra, com tracemalloc, para medir o pico de memória.
+     """
+
+     parametros = dict(PARAMETROS_PADRAO, **parametros)
+
+     inicio = time.perf_counter()
+     instancia = gerar_instancia(parametros)
+     segundos_geracao = time.perf_counter() - inicio
+
+     inicio = time.perf_counter()
+     escrever_instancia(instancia, pasta, formato)
+     segundos_escrita = time.perf_counter() - inicio
+
+     del instancia
+     tracemalloc.start()
+     gerar_instancia(parametros)
+     _, pico_memoria = tracemalloc.get_traced_memory()
+     tracemalloc.stop()
+
+     estimativa = estimar_instancia(parametros, formato, modelo)
+     return ajustar_modelo_custo(estimativa, segundos_geracao, segundos_escrita, pico_memoria, modelo)
+
+def main(num_estoques, 
+         n_tarefas_estoque,
+         n_tarefas_docas,
+         num_docas, 
+         picking_width_units, 
+         n_caminhoes, 
+         mesmo_ponto_picking, 
+         n_maquinas,  
+         n_operacoes_por_tarefa, 
+         proporcao_maquinas, 
+         proporcao_areas,
+         proporcao_rapidas,
+         deterministico,
+         vel_min_emp_rapida, 
+         vel_max_emp_rapida, 
+         vel_min_emp_lenta, 
+         vel_max_emp_lenta, 
+         t_min_block, 
+         t_max_block, 
+         t_min_setup, 
+         t_max_setup, 
+         todos_caminhoes_atrasados, 
+         todos_caminhoes_adiantados,
+         pasta = '../data/instancias/',
+         grid_spacing = 5,
+         modo_setup = 'aleatorio',
+         seed = None,
+         cache = None,
+         formato = 'denso',
+         dry_run = False,
+         politica = None,
+         modelo_custo = None,
+         podar_elegibilidade = False,
+         limites = False,
+         n_cenarios = None,
+         pasta_temporaria = None,
+         limite_memoria = None):
+
+     parametros = {nome: valor for nome, valor in locals().items()
+                   if nome not in ('pasta', 'seed', 'cache', 'formato', 'dry_run', 'politica', 'modelo_custo', 'podar_elegibilidade',
+                                     'limites', 'n_cenarios')}
+
+     # Os limites (H, ES, LS, M_op, A_max) dependem de p e d, que mudam de um cenário para outro
+     if limites and n_cenarios is not None:
+          raise ValueError("Os limites não podem ser escritos em um arquivo de cenários: use limites ou n_cenarios.")
+
+     # Estima tamanho, memória e tempo antes de gerar; a política pode trocar o formato de saída ou recusar a instância
+     if dry_run or politica is not None:
+          estimativa = estimar_instancia(parametros, formato, modelo_custo, podar_elegibilidade, n_cenarios)
+          if politica is not None:
+               formato = aplicar_politica(estimativa, politica)
+               if formato != estimativa['formato']:
+                    estimativa = estimar_instancia(parametros, formato, modelo_custo, podar_elegibilidade, n_cenarios)
+          if dry_run:
+               print(formatar_estimativa(estimativa))
+               return estimativa
+
+     # Gera a instância pelo grafo de etapas; com seed e cache, só as etapas afetadas por parâmetros alterados são recalculadas
+     instancia = gerar_instancia(parametros, seed, cache)
+
+     # Com n_cenarios, escreve um único arquivo com os cenários sorteados em vez da instância
+     if n_cenarios is not None:
+          escrever_cenarios(instancia, n_cenarios, pasta, formato, podar_elegibilidade, seed)
+     else:
+          escrever_instancia(instancia, pasta, formato, podar_elegibilidade, limites)
+     
+     return instancia['area_indices'], instancia['coordenadas'], instancia['elegibilidade']
\ No newline at end of file
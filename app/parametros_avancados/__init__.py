@@ -1 +1,6 @@
-from .pipeline_av import pipeline_parametros_avancados
\ No newline at end of file
+from .pipeline_av import pipeline_parametros_avancados, etapas_parametros_avancados
+from .armazenamento import MatrizTriangular, TemposConstantes
+from .elegibilidade import matriz_elegibilidade
+from .horizonte import calcular_limites
+from .empilhadeiras import faixas_velocidades_empilhadeiras
+from .cenarios import amostrar_cenarios
\ No newline at end of file
@@ -0,0 +1,278 @@
+import os
+import shutil
+import tempfile
+import weakref
+import numpy as np
+
+# Memória temporária por par sorteado de uma vez (lista de floats do random, vetor float64, máscara e arredondamento),
+# usada para escolher o tamanho dos blocos a partir de um limite de memória
+BYTES_POR_PAR_SORTEADO = 110
+
+# Memória temporária por par (i, j) de um bloco de linhas do setup geométrico (distância float64, divisão e arredondamento)
+BYTES_POR_PAR_GEOMETRICO = 24
+
+def _memmap_temporario(pasta: str, forma: tuple, dtype: type) -> np.memmap:
+    """
+    Cria um np.memmap zerado em um arquivo de um diretório temporário próprio dentro da pasta.
+
+    O diretório é removido quando o mapeamento é liberado (quando o array e todas as suas fatias deixam de ser usados)
+    ou, no mais tardar, ao fim do processo. O arquivo não é removido enquanto está mapeado, o que falharia no Windows.
+    """
+
+    diretorio = tempfile.mkdtemp(dir=pasta, prefix='mmap_')
+    try:
+        tensor = np.memmap(os.path.join(diretorio, 'valores.mmap'), dtype=dtype, mode='w+', shape=forma)
+    except BaseException:
+        shutil.rmtree(diretorio, ignore_errors=True)
+        raise
+    weakref.finalize(tensor._mmap, shutil.rmtree, diretorio, True)
+    return tensor
+
+class MatrizTriangular:
+    """
+    Armazena, para cada máquina, os tempos entre pares de operações simétricos (tempo(i, j) == tempo(j, i)) guardando
+    apenas o triângulo superior estrito, linha a linha, em um único vetor por máquina.
+
+    O par (i, j), com i < j, de n operações ocupa a posição inicio[i] + (j - i - 1) (índices a partir de zero), onde
+    inicio[i] = i * n - i * (i + 1) / 2. A ordem dos pares é a mesma de dois laços `for i`, `for j > i`.
+
+    Atributos:
+    ----------
+    n_maquinas : int
+        Número de máquinas.
+    n_operacoes : int
+        Número de operações (numeradas de 1 a n_operacoes).
+    valores : np.ndarray
+        Matriz (n_maquinas, n_operacoes * (n_operacoes - 1) / 2) com os tempos de cada par. Quando a matriz é criada
+        com pasta_temporaria, é um np.memmap em disco e só as páginas em uso ficam na memória.
+    pasta_temporaria : str ou None
+        Pasta dos arquivos temporários (também usada para expandir o tensor em disco, veja tensor). Uma cópia
+        serializada com pickle mantém a pasta, mas os valores passam a ficar na memória.
+    """
+
+    def __init__(self, n_maquinas: int, n_operacoes: int, dtype: type = np.int32, pasta_temporaria: str = None):
+        self.n_maquinas = n_maquinas
+        self.n_operacoes = n_operacoes
+        self.pasta_temporaria = pasta_temporaria
+        forma = (n_maquinas, n_operacoes * (n_operacoes - 1) // 2)
+        if pasta_temporaria is None:
+            self.valores = np.zeros(forma, dtype=dtype)
+        else:
+            self.valores = _memmap_temporario(pasta_temporaria, forma, dtype)
+        linhas = np.arange(n_operacoes + 1, dtype=np.int64)
+        self.inicio = linhas * n_operacoes - linhas * (linhas + 1) // 2
+
+    def indice(self, i, j):
+        """
+        Retorna a posição do par (i, j) no vetor de cada máquina. Operações a partir de 1, em qualquer ordem (i != j).
+        Aceita inteiros ou arrays.
+        """
+
+        a = np.minimum(i, j) - 1
+        b = np.maximum(i, j) - 1
+        return self.inicio[a] + (b - a - 1)
+
+    def valor(self, maquina: int, i: int, j: int):
+        """
+        Retorna o tempo entre as operações i e j na máquina (todos a partir de 1). A diagonal vale zero.
+        """
+
+        if i == j:
+            return 0
+        return self.valores[maquina - 1, self.indice(i, j)]
+
+    def linha(self, maquina: int, i: int) -> np.ndarray:
+        """
+        Retorna o vetor (n_operacoes,) com os tempos entre a operação i e todas as operações, com zero na diagonal.
+        """
+
+        n = self.n_operacoes
+        i0 = i - 1
+        valores = self.valores[maquina - 1]
+        linha = np.zeros(n, dtype=self.valores.dtype)
+        # Colunas j > i: trecho contíguo da própria linha; colunas j < i: elemento i de cada linha anterior
+        linha[i0 + 1:] = valores[self.inicio[i0]:self.inicio[i0 + 1]]
+        anteriores = np.arange(i0, dtype=np.int64)
+        linha[:i0] = valores[self.inicio[anteriores] + (i0 - anteriores - 1)]
+        return linha
+
+    def matriz(self, maquina: int) -> np.ndarray:
+        """
+        Expande os tempos de uma máquina em uma matriz (n_operacoes, n_operacoes) simétrica, com zero na diagonal.
+        """
+
+        n = self.n_operacoes
+        matriz = np.zeros((n, n), dtype=self.valores.dtype)
+        linhas, colunas = np.triu_indices(n, k=1)
+        matriz[linhas, colunas] = self.valores[maquina - 1]
+        matriz[colunas, linhas] = self.valores[maquina - 1]
+        return matriz
+
+    def blocos_linhas(self, limite_memoria: float = None):
+        """
+        Divide as linhas i (a partir de zero) em blocos consecutivos [inicio, fim) cujos pares (i, j > i) cabem no limite
+        de memória de um sorteio (veja BYTES_POR_PAR_SORTEADO). Os pares de um bloco ocupam o trecho contíguo
+        self.inicio[inicio]:self.inicio[fim] do vetor de cada máquina. Sem limite, há um único bloco.
+        """
+
+        n = self.n_operacoes
+        if limite_memoria is None:
+            yield 0, n
+            return
+        pares_por_bloco = max(int(limite_memoria // BYTES_POR_PAR_SORTEADO), n)
+        comeco = 0
+        while comeco < n:
+            fim = int(np.searchsorted(self.inicio, self.inicio[comeco] + pares_por_bloco, side='right')) - 1
+            fim = min(max(fim, comeco + 1), n)
+            yield comeco, fim
+            comeco = fim
+
+    def tensor(self, pasta_temporaria: str = None) -> np.ndarray:
+        """
+        Expande o armazenamento em um tensor (n_maquinas, n_operacoes, n_operacoes) simétrico, com zero na diagonal.
+        Com pasta_temporaria, o tensor é um np.memmap preenchido uma máquina por vez.
+        """
+
+        n = self.n_operacoes
+        if pasta_temporaria is not None:
+            tensor = _memmap_temporario(pasta_temporaria, (self.n_maquinas, n, n), self.valores.dtype)
+            for maquina in range(1, self.n_maquinas + 1):
+                tensor[maquina - 1] = self.matriz(maquina)
+            return tensor
+
+        tensor = np.zeros((self.n_maquinas, n, n), dtype=self.valores.dtype)
+        linhas, colunas = np.triu_indices(n, k=1)
+        tensor[:, linhas, colunas] = self.valores
+        tensor[:, colunas, linhas] = self.valores
+        return tensor
+
+    def para_dicionario(self) -> dict[str, dict[str, int]]:
+        """
+        Converte para o formato {'Empilhadeira k': {'i,j': tempo, ...}} (apenas i < j) usado anteriormente.
+        """
+
+        linhas, colunas = np.triu_indices(self.n_operacoes, k=1)
+        chaves = [f'{i},{j}' for i, j in zip((linhas + 1).tolist(), (colunas + 1).tolist())]
+        return {f'Empilhadeira {maquina}': dict(zip(chaves, self.valores[maquina - 1].tolist()))
+                for maquina in range(1, self.n_maquinas + 1)}
+
+    @property
+    def nbytes(self) -> int:
+        return self.valores.nbytes
+
+
+class TemposConstantes:
+    """
+    Tempos entre pares de operações que valem uma mesma constante em todas as máquinas, exceto nos pares de operações
+    da mesma área (tempo zero, quando as áreas são informadas) e em um pequeno conjunto de pares de exceção.
+
+    É a forma fechada dos tempos do modo determinístico: guarda O(n_operacoes) valores em vez de um por par, com a
+    mesma interface de leitura da MatrizTriangular (valor, linha, matriz, tensor e para_dicionario).
+
+    Atributos:
+    ----------
+    n_maquinas : int
+        Número de máquinas.
+    n_operacoes : int
+        Número de operações (numeradas de 1 a n_operacoes).
+    constante : int
+        Tempo dos pares que não são exceção.
+    areas : np.ndarray ou None
+        Área de cada operação (vetor (n_operacoes,)); pares da mesma área têm tempo zero. Se None, não há essa regra.
+    excecoes : dict[tuple[int, int], int]
+        Tempo de pares (i, j), com i < j e operações de áreas diferentes, que não valem a constante.
+    """
+
+    def __init__(self, n_maquinas: int, n_operacoes: int, constante: int, areas: np.ndarray = None,
+                 excecoes: dict[tuple[int, int], int] = None, dtype: type = np.int32):
+        self.n_maquinas = n_maquinas
+        self.n_operacoes = n_operacoes
+        self.dtype = np.dtype(dtype)
+        self.constante = int(constante)
+        self.areas = None if areas is None else np.asarray(areas)[:n_operacoes]
+        self.excecoes = {}
+        for (i, j), tempo in (excecoes or {}).items():
+            i, j = min(i, j), max(i, j)
+            # A regra da mesma área prevalece; pares fora das operações são ignorados
+            if j <= n_operacoes and i != j and not self._mesma_area(i, j):
+                self.excecoes[(i, j)] = int(tempo)
+
+    def _mesma_area(self, i: int, j: int) -> bool:
+        return self.areas is not None and self.areas[i - 1] == self.areas[j - 1]
+
+    def valor(self, maquina: int, i: int, j: int):
+        """
+        Retorna o tempo entre as operações i e j na máquina (todos a partir de 1). A diagonal vale zero.
+        """
+
+        if i == j or self._mesma_area(i, j):
+            return 0
+        return self.excecoes.get((min(i, j), max(i, j)), self.constante)
+
+    def linha(self, maquina: int, i: int) -> np.ndarray:
+        """
+        Retorna o vetor (n_operacoes,) com os tempos entre a operação i e todas as operações, com zero na diagonal.
+        """
+
+        linha = np.full(self.n_operacoes, self.constante, dtype=self.dtype)
+        if self.areas is not None:
+            linha[self.areas == self.areas[i - 1]] = 0
+        for (a, b), tempo in self.excecoes.items():
+            if a == i or b == i:
+                linha[a + b - i - 1] = tempo
+        linha[i - 1] = 0
+        return linha
+
+    def matriz(self, maquina: int) -> np.ndarray:
+        """
+        Expande os tempos (iguais em todas as máquinas) em uma matriz (n_operacoes, n_operacoes) simétrica, com zero na diagonal.
+        """
+
+        n = self.n_operacoes
+        matriz = np.full((n, n), self.constante, dtype=self.dtype)
+        if self.areas is not None:
+            matriz[self.areas[:, None] == self.areas[None, :]] = 0
+        for (i, j), tempo in self.excecoes.items():
+            matriz[i - 1, j - 1] = matriz[j - 1, i - 1] = tempo
+        np.fill_diagonal(matriz, 0)
+        return matriz
+
+    def blocos_mesma_area(self) -> list[np.ndarray]:
+        """
+        Retorna as operações (a partir de 1) de cada área com mais de uma operação: os blocos de pares com tempo zero.
+        """
+
+        if self.areas is None:
+            return []
+        ordem = np.argsort(self.areas, kind='stable')
+        _, inicios, contagens = np.unique(self.areas[ordem], return_index=True, return_counts=True)
+        return [ordem[inicio:inicio + contagem] + 1 for inicio, contagem in zip(inicios, contagens) if contagem > 1]
+
+    def tensor(self, pasta_temporaria: str = None) -> np.ndarray:
+        """
+        Expande os tempos em um tensor (n_maquinas, n_operacoes, n_operacoes) simétrico, com zero na diagonal.
+        Com pasta_temporaria, o tensor é um np.memmap preenchido uma máquina por vez.
+        """
+
+        n = self.n_operacoes
+        matriz = self.matriz(1)
+        if pasta_temporaria is not None:
+            tensor = _memmap_temporario(pasta_temporaria, (self.n_maquinas, n, n), self.dtype)
+            for maquina in range(self.n_maquinas):
+                tensor[maquina] = matriz
+            return tensor
+        return np.repeat(matriz[None], self.n_maquinas, axis=0)
+
+    def para_dicionario(self) -> dict[str, dict[str, int]]:
+        """
+        Converte para o formato {'Empilhadeira k': {'i,j': tempo, ...}} (apenas i < j) usado anteriormente.
+        """
+
+        linhas, colunas = np.triu_indices(self.n_operacoes, k=1)
+        chaves = [f'{i},{j}' for i, j in zip((linhas + 1).tolist(), (colunas + 1).tolist())]
+        pares = dict(zip(chaves, self.matriz(1)[linhas, colunas].tolist()))
+        return {f'Empilhadeira {maquina}': dict(pares) for maquina in range(1, self.n_maquinas + 1)}
+
+    @property
+    def nbytes(self) -> int:
+        return (0 if self.areas is None else self.areas.nbytes) + 16 * len(self.excecoes)
@@ -0,0 +1,81 @@
+import numpy as np
+
+def amostrar_cenarios(distancia: np.ndarray,
+                      vel_min: np.ndarray,
+                      vel_max: np.ndarray,
+                      operacoes_por_caminhao: dict,
+                      n_cenarios: int,
+                      todos_caminhoes_atrasados: bool = False,
+                      todos_caminhoes_adiantados: bool = False,
+                      seed: int = None) -> dict[str, np.ndarray]:
+    """
+    Sorteia de uma vez os tempos de processamento e as datas de saída de n_cenarios cenários sobre o mesmo layout.
+
+    Os tempos seguem calcular_tempo_processamento: em cada cenário, cada par (operação, empilhadeira) sorteia uma
+    velocidade uniforme na faixa da empilhadeira e leva round(2 * distância / velocidade) segundos. As datas seguem
+    calcular_datas_entrega (caso não determinístico), aplicadas aos tempos de cada cenário: um alfa e um sorteio
+    entre a soma mínima e a máxima dos tempos do caminhão nas empilhadeiras.
+
+    Parâmetros:
+    -----------
+    distancia : np.ndarray
+        Vetor (n,) com a distância (só ida) de cada operação.
+    vel_min, vel_max : np.ndarray
+        Vetores (n_maquinas,) com a faixa de velocidades de cada empilhadeira, em km/h.
+    operacoes_por_caminhao : dict
+        Operações de cada caminhão ({'Caminhão c': [operações]}).
+    n_cenarios : int
+        Número de cenários.
+    todos_caminhoes_atrasados, todos_caminhoes_adiantados : bool, opcional
+        Faixa dos alfas, como em calcular_datas_entrega.
+    seed : int, opcional
+        Semente do gerador de números aleatórios do numpy. Se None, a semente é sorteada do gerador global
+        (np.random), de modo que np.random.seed também fixa os cenários.
+
+    Retorno:
+    --------
+    dict[str, np.ndarray]
+        Dicionário contendo:
+        - 'p': tensor (n_cenarios, n, n_maquinas) com os tempos de processamento de todas as operações
+          em todas as empilhadeiras (a elegibilidade é aplicada na escrita).
+        - 'd': matriz (n_cenarios, n_caminhoes) com as datas de saída; a coluna c - 1 é o 'Caminhão c'.
+    """
+
+    if n_cenarios < 1:
+        raise ValueError("O número de cenários deve ser pelo menos 1.")
+
+    gerador = np.random.default_rng(seed if seed is not None else np.random.randint(2**32, dtype=np.int64))
+    n_operacoes = len(distancia)
+    n_maquinas = len(vel_min)
+
+    velocidade = (vel_min + (vel_max - vel_min) * gerador.random((n_cenarios, n_operacoes, n_maquinas))) * 1000 / 3600
+    p = np.rint(2 * distancia[None, :, None] / velocidade)
+
+    # Incidência caminhão x operação e soma dos tempos de cada caminhão em cada empilhadeira: (n_cenarios, n_caminhoes, n_maquinas)
+    incidencia = np.zeros((len(operacoes_por_caminhao), n_operacoes))
+    for c, operacoes in enumerate(operacoes_por_caminhao.values()):
+        operacoes = [operacao for operacao in operacoes if operacao <= n_operacoes]
+        incidencia[c, np.array(operacoes, dtype=np.int64) - 1] = 1
+    tempos_totais = np.matmul(incidencia, p)
+
+    validos = tempos_totais > 0
+    if not validos.any(axis=2).all():
+        raise ValueError("Há caminhões sem tempos de processamento válidos.")
+    tempo_minimo = np.where(validos, tempos_totais, np.inf).min(axis=2)
+    tempo_maximo = np.where(validos, tempos_totais, 0).max(axis=2)
+
+    if todos_caminhoes_adiantados:
+        alfa_min, alfa_max = 0.1, 0.9
+    elif todos_caminhoes_atrasados:
+        alfa_min, alfa_max = 1.1, 2
+    else:
+        alfa_min, alfa_max = 0.1, 2
+    forma = tempo_minimo.shape
+    alfa = alfa_min + (alfa_max - alfa_min) * gerador.random(forma)
+    datas = (tempo_minimo + (tempo_maximo - tempo_minimo) * gerador.random(forma)) * alfa
+
+    d = np.zeros(forma, dtype=np.int64)
+    numeros = np.array([int(caminhao.split()[1]) for caminhao in operacoes_por_caminhao], dtype=np.int64)
+    d[:, numeros - 1] = np.rint(datas)
+
+    return {'p': p.astype(np.int64), 'd': d}
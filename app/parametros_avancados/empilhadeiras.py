@@ -1,76 +1,127 @@
-import random
-
-def classificar_empilhadeiras(n_maquinas: int, proporcao_rapidas: float) -> dict:
-    """
-    Retorna um dicionário classificando empilhadeiras como rápidas ou lentas,
-    de acordo com a proporção fornecida.
-
-    Parâmetros:
-    n_maquinas (int): Número total de empilhadeiras.
-    proporcao_rapidas (float): Proporção de empilhadeiras rápidas (em percentual, de 0 a 100).
-
-    Retorno:
-    dict: Dicionário com a classificação das empilhadeiras.
-    """
-    # Validar se a proporção está entre 0 e 100
-    if proporcao_rapidas < 0 or proporcao_rapidas > 100:
-        raise ValueError("A proporção de empilhadeiras rápidas deve estar entre 0 e 100%.")
-
-    # Calcular a quantidade de empilhadeiras rápidas e lentas
-    n_rapidas = int(round(n_maquinas * (proporcao_rapidas / 100)))
-    n_lentas = n_maquinas - n_rapidas
-
-    # Criar uma lista de empilhadeiras com base na classificação
-    classificacao = ['rápida'] * n_rapidas + ['lenta'] * n_lentas
-
-    # Embaralhar a lista para que a distribuição seja aleatória
-    random.shuffle(classificacao)
-
-    # Criar o dicionário resultante com as classificações
-    empilhadeiras = {f"Empilhadeira {i + 1}": classificacao[i] for i in range(n_maquinas)}
-
-    return empilhadeiras
-
-def classificar_empilhadeiras_por_areas(num_maquinas: int, proporcao_areas: dict) -> dict:
-    """
-    Classifica as empilhadeiras quanto ao número de áreas em que elas podem atuar.
-    
-    Parâmetros:
-    num_maquinas (int): Número total de empilhadeiras.
-    proporcao_areas (dict): Dicionário com as proporções de empilhadeiras que atuam em 1, 2 ou 3 áreas.
-
-    Retorno:
-    dict: Dicionário com a classificação das empilhadeiras e a quantidade de áreas em que cada uma pode atuar.
-    """
-    
-    # Definir quantas empilhadeiras atuarão em 1, 2 ou 3 áreas, com base nas proporções
-    num_empilhadeiras_1_area = max(1, int(proporcao_areas['1_area'] * num_maquinas))
-    num_empilhadeiras_2_areas = max(1, int(proporcao_areas['2_areas'] * num_maquinas))
-    num_empilhadeiras_3_areas = num_maquinas - num_empilhadeiras_1_area - num_empilhadeiras_2_areas
-
-    # Ajuste para garantir que a soma das empilhadeiras seja igual ao total
-    if num_empilhadeiras_3_areas < 0:
-        num_empilhadeiras_2_areas += num_empilhadeiras_3_areas
-        num_empilhadeiras_3_areas = 0
-
-    # Inicializar a classificação das empilhadeiras
-    classificacao_empilhadeiras = {}
-
-    # Sortear empilhadeiras para 1 área
-    empilhadeiras_disponiveis = list(range(1, num_maquinas + 1))
-    empilhadeiras_1_area = random.sample(empilhadeiras_disponiveis, num_empilhadeiras_1_area)
-    for emp in empilhadeiras_1_area:
-        classificacao_empilhadeiras[f'Empilhadeira {emp}'] = 1
-    empilhadeiras_disponiveis = [emp for emp in empilhadeiras_disponiveis if emp not in empilhadeiras_1_area]
-
-    # Sortear empilhadeiras para 2 áreas
-    empilhadeiras_2_areas = random.sample(empilhadeiras_disponiveis, num_empilhadeiras_2_areas)
-    for emp in empilhadeiras_2_areas:
-        classificacao_empilhadeiras[f'Empilhadeira {emp}'] = 2
-    empilhadeiras_disponiveis = [emp for emp in empilhadeiras_disponiveis if emp not in empilhadeiras_2_areas]
-
-    # As empilhadeiras restantes atuarão em 3 áreas
-    for emp in empilhadeiras_disponiveis:
-        classificacao_empilhadeiras[f'Empilhadeira {emp}'] = 3
-
-    return classificacao_empilhadeiras
\ No newline at end of file
+import random
+import numpy as np
+
+def classificar_empilhadeiras(n_maquinas: int, proporcao_rapidas: float) -> dict:
+    """
+    Retorna um dicionário classificando empilhadeiras como rápidas ou lentas,
+    de acordo com a proporção fornecida.
+
+    Parâmetros:
+    n_maquinas (int): Número total de empilhadeiras.
+    proporcao_rapidas (float): Proporção de empilhadeiras rápidas (em percentual, de 0 a 100).
+
+    Retorno:
+    dict: Dicionário com a classificação das empilhadeiras.
+    """
+    # Validar se a proporção está entre 0 e 100
+    if proporcao_rapidas < 0 or proporcao_rapidas > 100:
+        raise ValueError("A proporção de empilhadeiras rápidas deve estar entre 0 e 100%.")
+
+    # Calcular a quantidade de empilhadeiras rápidas e lentas
+    n_rapidas = int(round(n_maquinas * (proporcao_rapidas / 100)))
+    n_lentas = n_maquinas - n_rapidas
+
+    # Criar uma lista de empilhadeiras com base na classificação
+    classificacao = ['rápida'] * n_rapidas + ['lenta'] * n_lentas
+
+    # Embaralhar a lista para que a distribuição seja aleatória
+    random.shuffle(classificacao)
+
+    # Criar o dicionário resultante com as classificações
+    empilhadeiras = {f"Empilhadeira {i + 1}": classificacao[i] for i in range(n_maquinas)}
+
+    return empilhadeiras
+
+def classificar_empilhadeiras_por_areas(num_maquinas: int, proporcao_areas: dict) -> dict:
+    """
+    Classifica as empilhadeiras quanto ao número de áreas em que elas podem atuar.
+    
+    Parâmetros:
+    num_maquinas (int): Número total de empilhadeiras.
+    proporcao_areas (dict): Dicionário com as proporções de empilhadeiras que atuam em 1, 2 ou 3 áreas.
+
+    Retorno:
+    dict: Dicionário com a classificação das empilhadeiras e a quantidade de áreas em que cada uma pode atuar.
+    """
+    
+    # Definir quantas empilhadeiras atuarão em 1, 2 ou 3 áreas, com base nas proporções
+    num_empilhadeiras_1_area = max(1, int(proporcao_areas['1_area'] * num_maquinas))
+    num_empilhadeiras_2_areas = max(1, int(proporcao_areas['2_areas'] * num_maquinas))
+    num_empilhadeiras_3_areas = num_maquinas - num_empilhadeiras_1_area - num_empilhadeiras_2_areas
+
+    # Ajuste para garantir que a soma das empilhadeiras seja igual ao total
+    if num_empilhadeiras_3_areas < 0:
+        num_empilhadeiras_2_areas += num_empilhadeiras_3_areas
+        num_empilhadeiras_3_areas = 0
+
+    # Inicializar a classificação das empilhadeiras
+    classificacao_empilhadeiras = {}
+
+    # Sortear empilhadeiras para 1 área
+    empilhadeiras_disponiveis = list(range(1, num_maquinas + 1))
+    empilhadeiras_1_area = random.sample(empilhadeiras_disponiveis, num_empilhadeiras_1_area)
+    for emp in empilhadeiras_1_area:
+        classificacao_empilhadeiras[f'Empilhadeira {emp}'] = 1
+    empilhadeiras_disponiveis = [emp for emp in empilhadeiras_disponiveis if emp not in empilhadeiras_1_area]
+
+    # Sortear empilhadeiras para 2 áreas
+    empilhadeiras_2_areas = random.sample(empilhadeiras_disponiveis, num_empilhadeiras_2_areas)
+    for emp in empilhadeiras_2_areas:
+        classificacao_empilhadeiras[f'Empilhadeira {emp}'] = 2
+    empilhadeiras_disponiveis = [emp for emp in empilhadeiras_disponiveis if emp not in empilhadeiras_2_areas]
+
+    # As empilhadeiras restantes atuarão em 3 áreas
+    for emp in empilhadeiras_disponiveis:
+        classificacao_empilhadeiras[f'Empilhadeira {emp}'] = 3
+
+    return classificacao_empilhadeiras
+
+def calcular_velocidades_empilhadeiras(tipo_empilhadeiras: dict, 
+                                       vel_min_emp_rapida: float, 
+                                       vel_max_emp_rapida: float,
+                                       vel_min_emp_lenta: float, 
+                                       vel_max_emp_lenta: float, 
+                                       deterministico: bool = False) -> np.ndarray:
+    """
+    Retorna o vetor de velocidades (em m/s) de cada empilhadeira, conforme sua classificação em rápida ou lenta.
+
+    Parâmetros:
+    tipo_empilhadeiras (dict): Dicionário com o tipo da empilhadeira ('rápida' ou 'lenta') para cada empilhadeira.
+    vel_min_emp_rapida (float): Velocidade mínima de uma empilhadeira rápida (em km/h).
+    vel_max_emp_rapida (float): Velocidade máxima de uma empilhadeira rápida (em km/h).
+    vel_min_emp_lenta (float): Velocidade mínima de uma empilhadeira lenta (em km/h).
+    vel_max_emp_lenta (float): Velocidade máxima de uma empilhadeira lenta (em km/h).
+    deterministico (bool): Se True, usa a média entre mínima e máxima. Se False, sorteia uma velocidade por empilhadeira.
+
+    Retorno:
+    np.ndarray: Vetor (n_maquinas,) com a velocidade da 'Empilhadeira k' na posição k - 1.
+    """
+    velocidades = np.empty(len(tipo_empilhadeiras), dtype=np.float64)
+    for emp, tipo in tipo_empilhadeiras.items():
+        if tipo == 'rápida':
+            vel_min, vel_max = vel_min_emp_rapida, vel_max_emp_rapida
+        else:
+            vel_min, vel_max = vel_min_emp_lenta, vel_max_emp_lenta
+
+        velocidade_kmh = (vel_min + vel_max) / 2 if deterministico else random.uniform(vel_min, vel_max)
+        velocidades[int(emp.split()[1]) - 1] = velocidade_kmh * 1000 / 3600  # Converte para m/s
+
+    return velocidades
+
+def faixas_velocidades_empilhadeiras(tipo_empilhadeiras: dict,
+                                     vel_min_emp_rapida: float,
+                                     vel_max_emp_rapida: float,
+                                     vel_min_emp_lenta: float,
+                                     vel_max_emp_lenta: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Retorna os vetores (n_maquinas,) com a velocidade mínima e máxima (em km/h) de cada empilhadeira, conforme o tipo.
+    """
+    vel_min = np.empty(len(tipo_empilhadeiras), dtype=np.float64)
+    vel_max = np.empty(len(tipo_empilhadeiras), dtype=np.float64)
+    for emp, tipo in tipo_empilhadeiras.items():
+        k = int(emp.split()[1]) - 1
+        if tipo == 'rápida':
+            vel_min[k], vel_max[k] = vel_min_emp_rapida, vel_max_emp_rapida
+        else:
+            vel_min[k], vel_max[k] = vel_min_emp_lenta, vel_max_emp_lenta
+    return vel_min, vel_max
@@ -0,0 +1,129 @@
+import numpy as np
+from .armazenamento import MatrizTriangular, TemposConstantes
+
+def _matriz_maquina(tempos, maquina: int, n_operacoes: int) -> np.ndarray:
+    # Tempos entre pares de uma máquina como matriz (n_operacoes, n_operacoes), para qualquer formato de armazenamento
+    if isinstance(tempos, (MatrizTriangular, TemposConstantes)):
+        return tempos.matriz(maquina)[:n_operacoes, :n_operacoes]
+    if isinstance(tempos, np.ndarray):
+        return np.rint(tempos[maquina - 1, :n_operacoes, :n_operacoes])
+
+    matriz = np.zeros((n_operacoes, n_operacoes))
+    for chave, tempo in tempos.get(f'Empilhadeira {maquina}', {}).items():
+        i, j = map(int, chave.split(','))
+        if i <= n_operacoes and j <= n_operacoes:
+            matriz[i - 1, j - 1] = matriz[j - 1, i - 1] = round(float(tempo))
+    return matriz
+
+def _propagar(predecessor: np.ndarray, valores: np.ndarray, para_frente: bool) -> np.ndarray:
+    """
+    Acumula valores ao longo das cadeias de precedência, um nível por iteração (vetorizado em cada nível).
+
+    Para frente: acumulado[i] = acumulado[pr(i)] + valores[pr(i)] (soma dos predecessores).
+    Para trás: acumulado[i] = max sobre os sucessores s de (acumulado[s] + valores[s]) (soma dos sucessores).
+    """
+
+    n = len(predecessor)
+    acumulado = np.zeros(n)
+    tem_predecessor = predecessor > 0
+    indices_predecessor = predecessor[tem_predecessor] - 1
+    for _ in range(n):
+        if para_frente:
+            novo = np.zeros(n)
+            novo[tem_predecessor] = acumulado[indices_predecessor] + valores[indices_predecessor]
+        else:
+            novo = np.zeros(n)
+            np.maximum.at(novo, indices_predecessor, acumulado[tem_predecessor] + valores[tem_predecessor])
+        if np.array_equal(novo, acumulado):
+            return acumulado
+        acumulado = novo
+    raise ValueError("Os predecessores das operações formam um ciclo.")
+
+def calcular_limites(elegibilidade: dict[int, dict],
+                     tempos_processamento: dict[str, dict],
+                     tempos_setup,
+                     tempos_bloqueios,
+                     predecessores: dict[int, int],
+                     datas_entrega: dict[str, float],
+                     n_maquinas: int) -> dict:
+    """
+    Calcula um horizonte de programação válido e limites por operação para as restrições do tipo big-M.
+
+    O horizonte H soma, para cada operação, o maior tempo de processamento entre as máquinas elegíveis e o maior
+    setup + bloqueio que pode precedê-la em uma dessas máquinas (apenas de operações elegíveis na mesma máquina).
+    Uma programação sem ociosidade desnecessária (e existe uma ótima assim) termina antes de H, pois o seu caminho
+    crítico passa no máximo uma vez por cada operação.
+
+    Parâmetros:
+    -----------
+    elegibilidade : dict[int, dict]
+        Elegibilidade das operações (veja elegibilidade_maquinas).
+    tempos_processamento : dict[str, dict]
+        Tempos de processamento por máquina e operação.
+    tempos_setup, tempos_bloqueios : MatrizTriangular, dict ou np.ndarray
+        Tempos de setup e de bloqueio entre pares de operações por máquina.
+    predecessores : dict[int, int]
+        Predecessor de cada operação (0 quando não há).
+    datas_entrega : dict[str, float]
+        Data de saída de cada caminhão ({'Caminhão c': data}).
+    n_maquinas : int
+        Número de máquinas.
+
+    Retorno:
+    --------
+    dict
+        Dicionário contendo:
+        - 'H': horizonte de programação.
+        - 'ES': vetor (n,) com o início mais cedo de cada operação (soma dos menores tempos dos predecessores).
+        - 'LS': vetor (n,) com o início mais tarde de cada operação (H menos os menores tempos da operação e dos sucessores).
+        - 'M_op': vetor (n,) com o big-M das restrições de sequenciamento que partem de cada operação:
+          LS + o maior p + setup + bloqueio até outra operação elegível na mesma máquina.
+        - 'A_max': vetor (n_caminhoes,) com o maior atraso possível de cada caminhão, max(0, H - d).
+    """
+
+    n_operacoes = len(elegibilidade)
+
+    # Tempos de processamento (arredondados como no arquivo AMPL), com NaN nas máquinas não elegíveis
+    p = np.full((n_operacoes, n_maquinas), np.nan)
+    for operacao, dados in elegibilidade.items():
+        for maquina in dados['maquinas']:
+            p[operacao - 1, maquina - 1] = round(tempos_processamento[f'Empilhadeira {maquina}'][operacao]['tempo'])
+    elegiveis = ~np.isnan(p)
+    if not elegiveis.any(axis=1).all():
+        raise ValueError("Há operações sem máquinas elegíveis; não é possível calcular os limites.")
+
+    # Maior setup + bloqueio antes (entrada) e depois (saída) de cada operação, entre operações elegíveis na mesma máquina
+    intervalo_entrada = np.zeros(n_operacoes)
+    saida = np.zeros(n_operacoes)
+    for maquina in range(1, n_maquinas + 1):
+        elegivel = elegiveis[:, maquina - 1]
+        if not elegivel.any():
+            continue
+        intervalo = _matriz_maquina(tempos_setup, maquina, n_operacoes) + _matriz_maquina(tempos_bloqueios, maquina, n_operacoes)
+        intervalo = np.where(elegivel[:, None] & elegivel[None, :], intervalo, 0)
+        np.fill_diagonal(intervalo, 0)
+        intervalo_entrada = np.where(elegivel, np.maximum(intervalo_entrada, intervalo.max(axis=0)), intervalo_entrada)
+        saida = np.where(elegivel, np.maximum(saida, p[:, maquina - 1] + intervalo.max(axis=1)), saida)
+
+    p_max = np.nanmax(p, axis=1)
+    p_min = np.nanmin(p, axis=1)
+    H = float(np.sum(p_max + intervalo_entrada))
+
+    predecessor = np.zeros(n_operacoes, dtype=np.int64)
+    for operacao, anterior in predecessores.items():
+        if operacao <= n_operacoes:
+            predecessor[operacao - 1] = anterior
+
+    inicio_cedo = _propagar(predecessor, p_min, para_frente=True)
+    cauda = _propagar(predecessor, p_min, para_frente=False)
+    inicio_tarde = H - p_min - cauda
+
+    d = np.array([data for _, data in sorted(datas_entrega.items(), key=lambda item: int(item[0].split()[1]))], dtype=np.float64)
+
+    return {
+        'H': H,
+        'ES': inicio_cedo,
+        'LS': inicio_tarde,
+        'M_op': inicio_tarde + saida,
+        'A_max': np.maximum(H - np.rint(d), 0),
+    }
@@ -1,73 +1,142 @@
-from .datas_entrega import calcular_datas_entrega
-from. elegibilidade import elegibilidade_maquinas
-from .empilhadeiras import classificar_empilhadeiras, classificar_empilhadeiras_por_areas
-from .tempo_blocking import calcular_bloqueio
-from .tempo_processamento import calcular_tempo_processamento
-from .tempo_setup import calcular_setup
-
-def pipeline_parametros_avancados(num_maquinas: int, 
-                                  operacoes_por_area: dict[str, list[int]], 
-                                  operacoes_por_caminhao: dict[str, list[int]], 
-                                  proporcao_maquinas: dict[str, float], 
-                                  proporcao_rapidas: float, 
-                                  proporcao_areas: dict[str, float], 
-                                  coordenadas_por_area: dict[str, dict[int, tuple[float, float]]], 
-                                  deterministico: bool, 
-                                  vel_min_emp_rapida: float, 
-                                  vel_max_emp_rapida: float, 
-                                  vel_min_emp_lenta: float, 
-                                  vel_max_emp_lenta: float, 
-                                  t_min_block: float, 
-                                  t_max_block: float, 
-                                  t_min_setup: float, 
-                                  t_max_setup: float, 
-                                  todos_caminhoes_atrasados: bool, 
-                                  todos_caminhoes_adiantados: bool) -> tuple[dict, dict, dict, dict]:
-
-    # Classifica as empilhadeiras em rápidas ou lentas, com base na proporção de empilhadeiras rápidas
-    classificacao_empilhadeiras_velocidade = classificar_empilhadeiras(num_maquinas, 
-                                                                       proporcao_rapidas)
-
-    # Define a alocação de empilhadeiras para diferentes áreas, com base nas proporções fornecidas
-    classificacao_empilhadeiras_areas = classificar_empilhadeiras_por_areas(num_maquinas, 
-                                                                            proporcao_areas)
-    
-    # Calcula a elegibilidade das máquinas para operar em determinadas áreas e associar operações aos caminhões
-    elegibilidade = elegibilidade_maquinas(num_maquinas, 
-                                           operacoes_por_area, 
-                                           operacoes_por_caminhao, 
-                                           proporcao_maquinas, 
-                                           classificacao_empilhadeiras_areas)
-
-
-    # Calcula os tempos de bloqueio entre operações com base nas áreas e nas máquinas envolvidas
-    tempos_bloqueios = calcular_bloqueio(coordenadas_por_area, 
-                                         deterministico, 
-                                         t_min_block, 
-                                         t_max_block, 
-                                         num_maquinas)
-    
-    # Calcula os tempos de processamento das operações, considerando a velocidade das empilhadeiras rápidas e lentas
-    tempos_processamento = calcular_tempo_processamento(classificacao_empilhadeiras_velocidade, 
-                                                        coordenadas_por_area, 
-                                                        vel_min_emp_rapida, 
-                                                        vel_max_emp_rapida,
-                                                        vel_min_emp_lenta, 
-                                                        vel_max_emp_lenta, 
-                                                        deterministico)
-    
-    # Calcula os tempos de setup entre as operações, considerando a localização e a ordem das operações
-    tempos_setup = calcular_setup(coordenadas_por_area, 
-                                  deterministico, 
-                                  t_min_setup, 
-                                  t_max_setup, 
-                                  num_maquinas)
-
-    # Calcula as datas de entrega estimadas para as operações com base nos tempos de processamento e parâmetros de caminhões
-    datas_entrega = calcular_datas_entrega(tempos_processamento, 
-                                           operacoes_por_caminhao, 
-                                           deterministico, 
-                                           todos_caminhoes_atrasados,
-                                           todos_caminhoes_adiantados)
-    
-    return elegibilidade, datas_entrega, tempos_setup, tempos_bloqueios, tempos_processamento
\ No newline at end of file
+from etapas import etapa, executar_etapas
+from .datas_entrega import calcular_datas_entrega
+from. elegibilidade import elegibilidade_maquinas
+from .empilhadeiras import classificar_empilhadeiras, classificar_empilhadeiras_por_areas, calcular_velocidades_empilhadeiras
+from .tempo_blocking import calcular_bloqueio
+from .tempo_processamento import calcular_tempo_processamento
+from .tempo_setup import calcular_setup, calcular_setup_geometrico
+
+def etapas_parametros_avancados(modo_setup: str = 'aleatorio') -> list[dict]:
+    """
+    Retorna as etapas do cálculo dos parâmetros avançados como um grafo de dependências (veja etapas.executar_etapas).
+
+    As entradas externas esperadas são os parâmetros de pipeline_parametros_avancados, com os mesmos nomes.
+
+    Parâmetros:
+    -----------
+    modo_setup : str
+        'aleatorio' para sortear os tempos de setup entre t_min_setup e t_max_setup, ou 'geometrico' para calculá-los
+        a partir do deslocamento em vazio entre as operações.
+
+    Retorno:
+    --------
+    list[dict]
+        Lista de etapas em ordem topológica.
+    """
+
+    if modo_setup not in ('aleatorio', 'geometrico'):
+        raise ValueError(f"Modo de setup desconhecido: {modo_setup}. Use 'aleatorio' ou 'geometrico'.")
+
+    vel = ['vel_min_emp_rapida', 'vel_max_emp_rapida', 'vel_min_emp_lenta', 'vel_max_emp_lenta']
+
+    etapas = [
+        # Classifica as empilhadeiras em rápidas ou lentas, com base na proporção de empilhadeiras rápidas
+        etapa('classificacao_empilhadeiras_velocidade',
+              lambda num_maquinas, proporcao_rapidas: classificar_empilhadeiras(num_maquinas, proporcao_rapidas),
+              ['num_maquinas', 'proporcao_rapidas']),
+
+        # Define a alocação de empilhadeiras para diferentes áreas, com base nas proporções fornecidas
+        etapa('classificacao_empilhadeiras_areas',
+              lambda num_maquinas, proporcao_areas: classificar_empilhadeiras_por_areas(num_maquinas, proporcao_areas),
+              ['num_maquinas', 'proporcao_areas']),
+
+        # Calcula a elegibilidade das máquinas para operar em determinadas áreas e associar operações aos caminhões
+        etapa('elegibilidade',
+              lambda num_maquinas, operacoes_por_area, operacoes_por_caminhao, proporcao_maquinas, classificacao_empilhadeiras_areas:
+                  elegibilidade_maquinas(num_maquinas, operacoes_por_area, operacoes_por_caminhao, proporcao_maquinas, classificacao_empilhadeiras_areas),
+              ['num_maquinas', 'operacoes_por_area', 'operacoes_por_caminhao', 'proporcao_maquinas', 'classificacao_empilhadeiras_areas']),
+
+        # Calcula os tempos de bloqueio entre operações com base nas áreas e nas máquinas envolvidas
+        etapa('tempos_bloqueios',
+              lambda coordenadas, deterministico, t_min_block, t_max_block, num_maquinas, pasta_temporaria, limite_memoria:
+                  calcular_bloqueio(coordenadas, deterministico, t_min_block, t_max_block, num_maquinas, pasta_temporaria, limite_memoria),
+              ['coordenadas', 'deterministico', 't_min_block', 't_max_block', 'num_maquinas', 'pasta_temporaria', 'limite_memoria']),
+
+        # Calcula os tempos de processamento das operações, considerando a velocidade das empilhadeiras rápidas e lentas
+        etapa('tempos_processamento',
+              lambda classificacao_empilhadeiras_velocidade, coordenadas, vel_min_emp_rapida, vel_max_emp_rapida, vel_min_emp_lenta, vel_max_emp_lenta, deterministico, distancias:
+                  calcular_tempo_processamento(classificacao_empilhadeiras_velocidade, coordenadas, vel_min_emp_rapida, vel_max_emp_rapida, vel_min_emp_lenta, vel_max_emp_lenta, deterministico, distancias),
+              ['classificacao_empilhadeiras_velocidade', 'coordenadas', *vel, 'deterministico', 'distancias']),
+    ]
+
+    # Calcula os tempos de setup entre as operações, considerando a localização e a ordem das operações
+    if modo_setup == 'geometrico':
+        # Setup como deslocamento em vazio do destino de uma operação à origem da seguinte, na velocidade de cada empilhadeira
+        etapas.append(etapa('velocidades_empilhadeiras',
+                            lambda classificacao_empilhadeiras_velocidade, vel_min_emp_rapida, vel_max_emp_rapida, vel_min_emp_lenta, vel_max_emp_lenta, deterministico:
+                                calcular_velocidades_empilhadeiras(classificacao_empilhadeiras_velocidade, vel_min_emp_rapida, vel_max_emp_rapida, vel_min_emp_lenta, vel_max_emp_lenta, deterministico),
+                            ['classificacao_empilhadeiras_velocidade', *vel, 'deterministico']))
+        etapas.append(etapa('tempos_setup',
+                            lambda distancias, velocidades_empilhadeiras, pasta_temporaria, limite_memoria:
+                                calcular_setup_geometrico(distancias, velocidades_empilhadeiras, pasta_temporaria, limite_memoria),
+                            ['distancias', 'velocidades_empilhadeiras', 'pasta_temporaria', 'limite_memoria']))
+    else:
+        etapas.append(etapa('tempos_setup',
+                            lambda coordenadas, deterministico, t_min_setup, t_max_setup, num_maquinas, pasta_temporaria, limite_memoria:
+                                calcular_setup(coordenadas, deterministico, t_min_setup, t_max_setup, num_maquinas, pasta_temporaria, limite_memoria),
+                            ['coordenadas', 'deterministico', 't_min_setup', 't_max_setup', 'num_maquinas', 'pasta_temporaria', 'limite_memoria']))
+
+    # Calcula as datas de entrega estimadas para as operações com base nos tempos de processamento e parâmetros de caminhões
+    etapas.append(etapa('datas_entrega',
+                        lambda tempos_processamento, operacoes_por_caminhao, deterministico, todos_caminhoes_atrasados, todos_caminhoes_adiantados:
+                            calcular_datas_entrega(tempos_processamento, operacoes_por_caminhao, deterministico, todos_caminhoes_atrasados, todos_caminhoes_adiantados),
+                        ['tempos_processamento', 'operacoes_por_caminhao', 'deterministico', 'todos_caminhoes_atrasados', 'todos_caminhoes_adiantados']))
+
+    return etapas
+
+def pipeline_parametros_avancados(num_maquinas: int, 
+                                  operacoes_por_area: dict[str, list[int]], 
+                                  operacoes_por_caminhao: dict[str, list[int]], 
+                                  proporcao_maquinas: dict[str, float], 
+                                  proporcao_rapidas: float, 
+                                  proporcao_areas: dict[str, float], 
+                                  coordenadas: dict, 
+                                  deterministico: bool, 
+                                  vel_min_emp_rapida: float, 
+                                  vel_max_emp_rapida: float, 
+                                  vel_min_emp_lenta: float, 
+                                  vel_max_emp_lenta: float, 
+                                  t_min_block: float, 
+                                  t_max_block: float, 
+                                  t_min_setup: float, 
+                                  t_max_setup: float, 
+                                  todos_caminhoes_atrasados: bool, 
+                                  todos_caminhoes_adiantados: bool,
+                                  distancias: dict = None,
+                                  modo_setup: str = 'aleatorio',
+                                  seed: int = None,
+                                  cache: dict = None,
+                                  pasta_temporaria: str = None,
+                                  limite_memoria: float = None) -> tuple[dict, dict, dict, dict]:
+
+    if modo_setup == 'geometrico' and distancias is None:
+        raise ValueError("O modo de setup geométrico requer as distâncias pré-calculadas do layout.")
+
+    valores = {
+        'num_maquinas': num_maquinas,
+        'operacoes_por_area': operacoes_por_area,
+        'operacoes_por_caminhao': operacoes_por_caminhao,
+        'proporcao_maquinas': proporcao_maquinas,
+        'proporcao_rapidas': proporcao_rapidas,
+        'proporcao_areas': proporcao_areas,
+        'coordenadas': coordenadas,
+        'deterministico': deterministico,
+        'vel_min_emp_rapida': vel_min_emp_rapida,
+        'vel_max_emp_rapida': vel_max_emp_rapida,
+        'vel_min_emp_lenta': vel_min_emp_lenta,
+        'vel_max_emp_lenta': vel_max_emp_lenta,
+        't_min_block': t_min_block,
+        't_max_block': t_max_block,
+        't_min_setup': t_min_setup,
+        't_max_setup': t_max_setup,
+        'todos_caminhoes_atrasados': todos_caminhoes_atrasados,
+        'todos_caminhoes_adiantados': todos_caminhoes_adiantados,
+        'distancias': distancias,
+        'pasta_temporaria': pasta_temporaria,
+        'limite_memoria': limite_memoria,
+    }
+
+    # Executa as etapas, recalculando apenas as que dependem de parâmetros alterados desde a última chamada com o mesmo cache
+    resultados = executar_etapas(etapas_parametros_avancados(modo_setup), valores, seed, cache)
+
+    return resultados['elegibilidade'], resultados['datas_entrega'], resultados['tempos_setup'], resultados['tempos_bloqueios'], resultados['tempos_processamento']
@@ -1,59 +1,58 @@
-import random
-
-def calcular_bloqueio(coordenadas_por_area: dict[str, dict], deterministico: bool, t_min: float, t_max: float, n_maquinas: int) -> dict:
-    """
-    Calcula o tempo de bloqueio entre combinações de operações, levando em consideração diferentes áreas (excluindo a área de 'Picking') e uma quantidade de máquinas, como empilhadeiras.
-
-    Parâmetros:
-    -----------
-    coordenadas_por_area : dict[str, dict]
-        Dicionário contendo áreas como chaves e operações associadas a essas áreas como valores.
-        O formato esperado é {'Area': {'Operacao': valor, ...}}.
-    deterministico : bool
-        Define se o cálculo do tempo de bloqueio será determinístico (média entre t_min e t_max) ou aleatório (valor gerado dentro do intervalo entre t_min e t_max).
-    t_min : float
-        Tempo mínimo de bloqueio, usado como limite inferior no cálculo.
-    t_max : float
-        Tempo máximo de bloqueio, usado como limite superior no cálculo.
-    n_maquinas : int
-        Número de máquinas (empilhadeiras, por exemplo) que serão consideradas no cálculo de bloqueio.
-
-    Retorno:
-    --------
-    dict
-        Dicionário onde cada chave representa uma máquina e cada valor é um dicionário de combinações de operações com seus respectivos tempos de bloqueio.
-        O formato retornado é {'Empilhadeira 1': {'Operacao1,Operacao2': tempo_bloqueio, ...}, ...}.
-    """
-    # Mapeia cada operação à sua área correspondente, excluindo 'Picking'
-    operacoes = []
-    for area, ops in coordenadas_por_area.items():
-        if area != 'Picking':
-            operacoes.extend(ops.keys())
-
-    # Ordena as operações para garantir combinações consistentes
-    operacoes = sorted(set(operacoes))
-
-    # Gera todas as combinações possíveis de operações (do menor para o maior)
-    combinacoes = []
-    for i in range(len(operacoes)):
-        for j in range(i+1, len(operacoes)):
-            op1 = operacoes[i]
-            op2 = operacoes[j]
-            combinacoes.append((op1, op2))
-
-    tempos_bloqueios = {}
-    for maquina in range(1, n_maquinas + 1):
-        bloqueios = {}
-        for op1, op2 in combinacoes:
-            chave = f'{op1},{op2}'
-
-            # Calcula o tempo de bloqueio
-            if deterministico:
-                tempo_bloqueio = (t_min + t_max) / 2
-            else:
-                tempo_bloqueio = random.uniform(t_min, t_max)
-            bloqueios[chave] = round(tempo_bloqueio)
-
-        tempos_bloqueios[f'Empilhadeira {maquina}'] = bloqueios
-
+import random
+import numpy as np
+from .armazenamento import MatrizTriangular, TemposConstantes
+
+def calcular_bloqueio(coordenadas: dict[str, np.ndarray],
+                      deterministico: bool,
+                      t_min: float,
+                      t_max: float,
+                      n_maquinas: int,
+                      pasta_temporaria: str = None,
+                      limite_memoria: float = None) -> MatrizTriangular | TemposConstantes:
+    """
+    Calcula o tempo de bloqueio entre combinações de operações, levando em consideração diferentes áreas (excluindo a área de 'Picking') e uma quantidade de máquinas, como empilhadeiras.
+
+    Parâmetros:
+    -----------
+    coordenadas : dict[str, np.ndarray]
+        Coordenadas das operações retornadas por alocar_pontos_operacoes; apenas o número de operações é usado.
+    deterministico : bool
+        Define se o cálculo do tempo de bloqueio será determinístico (média entre t_min e t_max) ou aleatório (valor gerado dentro do intervalo entre t_min e t_max).
+    t_min : float
+        Tempo mínimo de bloqueio, usado como limite inferior no cálculo.
+    t_max : float
+        Tempo máximo de bloqueio, usado como limite superior no cálculo.
+    n_maquinas : int
+        Número de máquinas (empilhadeiras, por exemplo) que serão consideradas no cálculo de bloqueio.
+    pasta_temporaria : str, opcional
+        Se informada, os tempos ficam em um np.memmap nessa pasta em vez de na memória (veja MatrizTriangular).
+    limite_memoria : float, opcional
+        Memória máxima (em bytes) usada pelos sorteios de uma vez; os pares são sorteados em blocos de linhas,
+        na mesma ordem (o resultado não depende do limite).
+
+    Retorno:
+    --------
+    MatrizTriangular ou TemposConstantes
+        Tempos de bloqueio de cada máquina para cada par de operações (simétricos), guardados apenas uma vez por par.
+        No modo determinístico, todos os pares valem a média, e os tempos são guardados em forma fechada
+        (TemposConstantes, sem memória por par); pasta_temporaria e limite_memoria não são usados.
+        Use tempos_bloqueios.valor(maquina, op1, op2) ou, para o formato {'Empilhadeira 1': {'Operacao1,Operacao2': tempo_bloqueio, ...}, ...},
+        tempos_bloqueios.para_dicionario().
+    """
+    # Operações de todas as áreas, excluindo 'Picking' (numeradas de 1 a n)
+    n_operacoes = len(coordenadas['operacoes'])
+    if deterministico:
+        return TemposConstantes(n_maquinas, n_operacoes, np.rint((t_min + t_max) / 2))
+
+    tempos_bloqueios = MatrizTriangular(n_maquinas, n_operacoes, pasta_temporaria=pasta_temporaria)
+    inicio = tempos_bloqueios.inicio
+    blocos = list(tempos_bloqueios.blocos_linhas(limite_memoria))
+
+    for maquina in range(1, n_maquinas + 1):
+        # Calcula o tempo de bloqueio de todos os pares, na mesma ordem em que eram percorridos (máquina, i, j > i)
+        for comeco, fim in blocos:
+            n_pares = inicio[fim] - inicio[comeco]
+            tempo_bloqueio = np.array([random.uniform(t_min, t_max) for _ in range(n_pares)])
+            tempos_bloqueios.valores[maquina - 1, inicio[comeco]:inicio[fim]] = np.rint(tempo_bloqueio)
+
     return tempos_bloqueios
\ No newline at end of file
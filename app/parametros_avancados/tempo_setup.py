@@ -1,80 +1,132 @@
-import random
-
-def calcular_setup(coordenadas_por_area: dict[str, dict[int, tuple[float, float]]], 
-                   deterministico: bool, 
-                   t_min: float, 
-                   t_max: float, 
-                   n_maquinas: int) -> dict:
-    """
-    Calcula os tempos de setup entre combinações de operações, levando em consideração as áreas correspondentes das operações e se são subsequentes ou ocorrem na mesma área.
-
-    Parâmetros:
-    -----------
-    coordenadas_por_area : dict[str, dict[int, tuple[float, float]]]
-        Dicionário contendo áreas como chaves e operações associadas a essas áreas como valores, onde as operações são mapeadas a suas coordenadas.
-        O formato esperado é {'Area': {operacao: (x, y), ...}}.
-    deterministico : bool
-        Define se o cálculo do tempo de setup será determinístico (média entre t_min e t_max) ou aleatório (valor gerado dentro do intervalo entre t_min e t_max).
-    t_min : float
-        Tempo mínimo de setup, usado como limite inferior no cálculo.
-    t_max : float
-        Tempo máximo de setup, usado como limite superior no cálculo.
-    n_maquinas : int
-        Número de máquinas (empilhadeiras, por exemplo) que serão consideradas no cálculo de setup.
-
-    Retorno:
-    --------
-    dict
-        Dicionário onde cada chave representa uma máquina e cada valor é um dicionário de combinações de operações com seus respectivos tempos de setup.
-        O formato retornado é {'Empilhadeira 1': {'Operacao1,Operacao2': tempo_setup, ...}, ...}.
-    """
-
-    # Mapeia cada operação à sua área correspondente
-    operacao_para_area = {}
-    for area, operacoes in coordenadas_por_area.items():
-        if area != 'Picking':
-            for operacao in operacoes.keys():
-                operacao_para_area[operacao] = area
-
-    # Lista de operações excluindo as do 'Picking'
-    operacoes = sorted(operacao_para_area.keys())
-
-    # Pares de operações com setup zero por serem subsequentes
-    pares_zero = [(1, 2), (3, 4), (5, 6)]
-
-    # Gera todas as combinações possíveis de operações (do menor para o maior)
-    combinacoes = []
-    for i in range(len(operacoes)):
-        for j in range(i+1, len(operacoes)):
-            op1 = operacoes[i]
-            op2 = operacoes[j]
-            combinacoes.append((op1, op2))
-
-    tempos_setup = {}
-    for maquina in range(1, n_maquinas + 1):
-        setups = {}
-        for op1, op2 in combinacoes:
-            chave = f'{op1},{op2}'
-
-            # Verifica se as operações são subsequentes de 2 em 2
-            if (op1, op2) in pares_zero:
-                setups[chave] = 0
-                continue
-
-            # Verifica se as operações estão na mesma área
-            area_op1 = operacao_para_area.get(op1)
-            area_op2 = operacao_para_area.get(op2)
-            if area_op1 == area_op2:
-                setups[chave] = 0
-                continue
-
-            # Caso contrário, calcula o setup
-            if deterministico:
-                tempo_setup = (t_min + t_max) / 2
-            else:
-                tempo_setup = random.uniform(t_min, t_max)
-            setups[chave] = round(tempo_setup)
-
-        tempos_setup[f'Empilhadeira {maquina}'] = setups
-
-    return tempos_setup
\ No newline at end of file
+import random
+import numpy as np
+from layout.distancias import matriz_distancias_vazio
+from .armazenamento import MatrizTriangular, TemposConstantes, BYTES_POR_PAR_GEOMETRICO, _memmap_temporario
+
+def calcular_setup(coordenadas: dict[str, np.ndarray], 
+                   deterministico: bool, 
+                   t_min: float, 
+                   t_max: float, 
+                   n_maquinas: int,
+                   pasta_temporaria: str = None,
+                   limite_memoria: float = None) -> MatrizTriangular | TemposConstantes:
+    """
+    Calcula os tempos de setup entre combinações de operações, levando em consideração as áreas correspondentes das operações e se são subsequentes ou ocorrem na mesma área.
+
+    Parâmetros:
+    -----------
+    coordenadas : dict[str, np.ndarray]
+        Coordenadas das operações retornadas por alocar_pontos_operacoes; apenas a área de cada operação ('area') é usada.
+    deterministico : bool
+        Define se o cálculo do tempo de setup será determinístico (média entre t_min e t_max) ou aleatório (valor gerado dentro do intervalo entre t_min e t_max).
+    t_min : float
+        Tempo mínimo de setup, usado como limite inferior no cálculo.
+    t_max : float
+        Tempo máximo de setup, usado como limite superior no cálculo.
+    n_maquinas : int
+        Número de máquinas (empilhadeiras, por exemplo) que serão consideradas no cálculo de setup.
+    pasta_temporaria : str, opcional
+        Se informada, os tempos ficam em um np.memmap nessa pasta em vez de na memória (veja MatrizTriangular).
+    limite_memoria : float, opcional
+        Memória máxima (em bytes) usada pelos sorteios de uma vez. Os pares são sorteados em blocos de linhas que
+        respeitam o limite, na mesma ordem (o resultado não depende do limite).
+
+    Retorno:
+    --------
+    MatrizTriangular ou TemposConstantes
+        Tempos de setup de cada máquina para cada par de operações (simétricos), guardados apenas uma vez por par.
+        No modo determinístico, todos os pares valem a média (ou zero), e os tempos são guardados em forma fechada
+        (TemposConstantes, com memória O(n_operacoes)); pasta_temporaria e limite_memoria não são usados.
+        Use tempos_setup.valor(maquina, op1, op2) ou, para o formato {'Empilhadeira 1': {'Operacao1,Operacao2': tempo_setup, ...}, ...},
+        tempos_setup.para_dicionario().
+    """
+
+    # Área de cada operação (operações numeradas de 1 a n)
+    areas = coordenadas['area']
+    n_operacoes = len(areas)
+
+    # Pares de operações com setup zero por serem subsequentes
+    pares_zero = [(1, 2), (3, 4), (5, 6)]
+
+    if deterministico:
+        return TemposConstantes(n_maquinas, n_operacoes, np.rint((t_min + t_max) / 2), areas,
+                                {par: 0 for par in pares_zero})
+
+    tempos_setup = MatrizTriangular(n_maquinas, n_operacoes, pasta_temporaria=pasta_temporaria)
+
+    inicio = tempos_setup.inicio
+
+    def sorteados_bloco(comeco: int, fim: int) -> np.ndarray:
+        # Posições (relativas ao início do bloco) dos pares sorteados: exclui os pares com setup zero,
+        # de operações na mesma área ou subsequentes
+        nulos = np.empty(inicio[fim] - inicio[comeco], dtype=bool)
+        for i in range(comeco, fim):
+            nulos[inicio[i] - inicio[comeco]:inicio[i + 1] - inicio[comeco]] = areas[i + 1:] == areas[i]
+        for op1, op2 in pares_zero:
+            if op2 <= n_operacoes and comeco <= op1 - 1 < fim:
+                nulos[tempos_setup.indice(op1, op2) - inicio[comeco]] = True
+        return np.flatnonzero(~nulos)
+
+    blocos = list(tempos_setup.blocos_linhas(limite_memoria))
+    sorteados_unico = sorteados_bloco(*blocos[0]) if len(blocos) == 1 else None
+
+    for maquina in range(1, n_maquinas + 1):
+        # Sorteia os setups dos demais pares, na mesma ordem em que eram percorridos (máquina, i, j > i)
+        for comeco, fim in blocos:
+            sorteados = sorteados_unico if sorteados_unico is not None else sorteados_bloco(comeco, fim)
+            tempo_setup = np.array([random.uniform(t_min, t_max) for _ in range(len(sorteados))])
+            tempos_setup.valores[maquina - 1, inicio[comeco] + sorteados] = np.rint(tempo_setup)
+
+    return tempos_setup
+
+def calcular_setup_geometrico(distancias: dict,
+                              velocidades: np.ndarray,
+                              pasta_temporaria: str = None,
+                              limite_memoria: float = None) -> np.ndarray:
+    """
+    Calcula os tempos de setup como o tempo de deslocamento em vazio entre o destino de uma operação e a origem da seguinte.
+
+    O tempo s[k, i, j] é a distância de Manhattan do destino da operação i até a origem da operação j dividida pela
+    velocidade da empilhadeira k. Pares subsequentes (destino de i igual à origem de j) resultam naturalmente em setup zero.
+    As distâncias são calculadas a partir dos pontos de origem e destino, um bloco de linhas i por vez, sem montar a
+    matriz (n, n) de distâncias inteira.
+
+    Parâmetros:
+    -----------
+    distancias : dict
+        Distâncias pré-calculadas por calcular_distancias_operacoes ('operacoes', 'origem' e 'destino'), indexadas
+        pelas operações 1..n, nessa ordem.
+    velocidades : np.ndarray
+        Vetor (n_maquinas,) com a velocidade de cada empilhadeira em m/s.
+    pasta_temporaria : str, opcional
+        Se informada, o tensor é um np.memmap nessa pasta, preenchido um bloco de linhas por vez.
+    limite_memoria : float, opcional
+        Memória temporária máxima (em bytes) de um bloco de linhas (veja BYTES_POR_PAR_GEOMETRICO). O resultado não
+        depende do limite. Sem limite, há um único bloco.
+
+    Retorno:
+    --------
+    np.ndarray
+        Tensor int32 (n_maquinas, n, n) de tempos de setup em segundos, arredondados para inteiros. O elemento [k - 1, i - 1, j - 1]
+        corresponde ao setup da operação i para a operação j na 'Empilhadeira k'.
+    """
+
+    operacoes = distancias['operacoes']
+    if not np.array_equal(operacoes, np.arange(1, len(operacoes) + 1)):
+        raise ValueError("As operações devem estar numeradas de 1 a n para o cálculo do setup geométrico.")
+
+    velocidades = np.asarray(velocidades, dtype=np.float64)
+    n = len(operacoes)
+    forma = (len(velocidades), n, n)
+    if pasta_temporaria is not None:
+        tensor = _memmap_temporario(pasta_temporaria, forma, np.int32)
+    else:
+        tensor = np.empty(forma, dtype=np.int32)
+
+    linhas_por_bloco = n if limite_memoria is None else max(int(limite_memoria // (BYTES_POR_PAR_GEOMETRICO * max(n, 1))), 1)
+    for comeco in range(0, n, linhas_por_bloco):
+        fim = min(comeco + linhas_por_bloco, n)
+        vazio = matriz_distancias_vazio(distancias['origem'], distancias['destino'][comeco:fim])
+        for k, velocidade in enumerate(velocidades):
+            tensor[k, comeco:fim] = np.rint(vazio / velocidade)
+    return tensor
@@ -1 +1,3 @@
-from .pipeline_print import pipeline_gerar_prints_parametros
\ No newline at end of file
+from .pipeline_print import pipeline_gerar_prints_parametros, pipeline_gerar_prints_cenarios
+from .pipeline_print import FORMATOS_SAIDA, nome_arquivo_instancia
+from .estimativa import estimar_instancia, ajustar_modelo_custo, aplicar_politica, formatar_estimativa, MODELO_CUSTO_PADRAO
\ No newline at end of file
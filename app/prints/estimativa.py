@@ -0,0 +1,383 @@
+import math
+from itertools import combinations
+
+from parametros_avancados.armazenamento import BYTES_POR_PAR_GEOMETRICO
+from .pipeline_print import FORMATOS_SAIDA
+
+# Modelo de custo padrão, calibrado com ajustar_modelo_custo em instâncias de referência:
+# - segundos_por_par: tempo de geração por par (i, j, k) de setup ou bloqueio;
+# - segundos_por_byte: tempo de escrita por byte do arquivo de saída;
+# - bytes_por_par: memória ocupada por par no armazenamento triangular de setup e bloqueio (MatrizTriangular, int32);
+# - bytes_por_sorteio: memória temporária por valor sorteado para uma máquina (lista de floats antes da conversão);
+# - bytes_base: memória do processo antes da geração (interpretador, numpy, matplotlib).
+MODELO_CUSTO_PADRAO = {
+    'segundos_por_par': 3.5e-7,
+    'segundos_por_byte': 8e-8,
+    'bytes_por_par': 4.0,
+    'bytes_por_sorteio': 85.0,
+    'bytes_base': 70e6,
+}
+
+# Limiares padrão da política de tamanho: acima de qualquer um deles a ação da política é aplicada
+POLITICA_PADRAO = {
+    'max_bytes': 2e9,
+    'max_memoria': 8e9,
+    'max_segundos': 3600.0,
+    'acao': 'binario',
+}
+
+def _soma_digitos(n: int) -> int:
+    """
+    Retorna a soma do número de dígitos de todos os inteiros de 1 a n, sem percorrê-los.
+    """
+
+    total = 0
+    inicio = 1
+    digitos = 1
+    while inicio <= n:
+        fim = min(n, inicio * 10 - 1)
+        total += (fim - inicio + 1) * digitos
+        inicio *= 10
+        digitos += 1
+    return total
+
+def _digitos(valor: float) -> int:
+    return len(str(int(round(max(valor, 0)))))
+
+def _digitos_medios(minimo: float, maximo: float) -> float:
+    """
+    Número médio de dígitos dos inteiros de round(minimo) a round(maximo), sorteados uniformemente.
+    """
+
+    a, b = max(int(round(minimo)), 0), max(int(round(maximo)), 0)
+    if b < a:
+        a, b = b, a
+    return (_soma_digitos(b) - _soma_digitos(a - 1) + (a == 0)) / (b - a + 1)
+
+def _fracao_mesma_area(n_tarefas_estoque: int, n_tarefas_docas: int, num_estoques: int) -> float:
+    """
+    Fração esperada dos pares de operações na mesma área (que têm setup e bloqueio nulos).
+
+    As operações ímpares estão distribuídas entre os estoques e as docas de entrada; as pares estão todas nas docas de saída.
+    """
+
+    n_tarefas = n_tarefas_estoque + n_tarefas_docas
+    n = 2 * n_tarefas
+    if n == 0:
+        return 0.0
+    # Cada tarefa de estoque cai em um estoque sorteado: E[n_area^2] = n_t/e + n_t*(n_t-1)/e^2 por estoque
+    pares_estoque = n_tarefas_estoque + n_tarefas_estoque * (n_tarefas_estoque - 1) / max(num_estoques, 1)
+    return (pares_estoque + n_tarefas_docas ** 2 + n_tarefas ** 2) / n ** 2
+
+def _fracoes_elegiveis(parametros: dict) -> tuple[float, float]:
+    """
+    Retorna a média e a média do quadrado da fração de operações elegíveis em uma máquina.
+
+    Cada empilhadeira atua em 1, 2 ou 3 áreas sorteadas (segundo proporcao_areas) entre docas de entrada, estoque e
+    picking; as operações pares (docas de saída) são tratadas como picking.
+    """
+
+    n_tarefas = parametros['n_tarefas_estoque'] + parametros['n_tarefas_docas']
+    if n_tarefas == 0:
+        return 1.0, 1.0
+    pesos = [parametros['n_tarefas_docas'] / (2 * n_tarefas), parametros['n_tarefas_estoque'] / (2 * n_tarefas), 0.5]
+
+    total = sum(parametros['proporcao_areas'].values())
+    if total <= 0:
+        return 1.0, 1.0
+    media = media_quadrado = 0.0
+    for chave, proporcao in parametros['proporcao_areas'].items():
+        subconjuntos = list(combinations(pesos, min(int(chave.split('_')[0]), 3)))
+        fracoes = [sum(subconjunto) for subconjunto in subconjuntos]
+        media += proporcao / total * sum(fracoes) / len(fracoes)
+        media_quadrado += proporcao / total * sum(f ** 2 for f in fracoes) / len(fracoes)
+    return media, media_quadrado
+
+def estimar_instancia(parametros: dict,
+                      formato: str = 'denso',
+                      modelo: dict = None,
+                      podar_elegibilidade: bool = False,
+                      n_cenarios: int = None) -> dict:
+    """
+    Estima o tamanho e os recursos necessários para gerar e escrever uma instância, sem gerá-la.
+
+    As contagens de linhas e bytes seguem exatamente a estrutura escrita pelas funções de print_parametros; os valores
+    numéricos (tempos e datas) são aproximados pelo número de dígitos dos seus limites. Tempo e memória vêm do modelo
+    de custo (veja ajustar_modelo_custo).
+
+    Parâmetros:
+    -----------
+    parametros : dict
+        Parâmetros de main(), indexados pelo nome.
+    formato : str, opcional
+        Formato de saída ('denso', 'esparso', 'binario' ou 'tabela'). Padrão é 'denso'.
+    modelo : dict, opcional
+        Modelo de custo. Se None, usa MODELO_CUSTO_PADRAO.
+    podar_elegibilidade : bool, opcional
+        Considera s e bk escritos apenas para os pares de operações elegíveis em cada máquina.
+    n_cenarios : int, opcional
+        Estima o arquivo de cenários (veja pipeline_gerar_prints_cenarios), em que p e d são escritos para cada um
+        dos n_cenarios cenários. Se None, estima o arquivo de uma instância.
+
+    Retorno:
+    --------
+    dict
+        Dicionário contendo:
+        - 'n_tarefas', 'n_operacoes', 'n_maquinas', 'n_caminhoes': dimensões da instância.
+        - 'pares': número de pares (i, j, k) de setup e de bloqueio gerados (sorteados ou calculados) um a um; os tempos
+          em forma fechada do modo determinístico não entram.
+        - 'secoes': {secao: {'linhas', 'bytes'}} para cada parâmetro do arquivo de saída.
+        - 'linhas', 'bytes': totais do arquivo de saída.
+        - 'memoria': pico de memória estimado, em bytes.
+        - 'segundos': tempo estimado de geração e escrita.
+        - 'formato': o formato considerado.
+    """
+
+    modelo = dict(MODELO_CUSTO_PADRAO, **(modelo or {}))
+
+    n_tarefas = parametros['n_tarefas_estoque'] + parametros['n_tarefas_docas']
+    n_por_tarefa = parametros['n_operacoes_por_tarefa']
+    n = n_tarefas * n_por_tarefa
+    m = parametros['n_maquinas']
+    c = parametros['n_caminhoes']
+    pares = m * n * (n - 1) // 2
+
+    d_n = _soma_digitos(n) / max(n, 1)
+    d_m = _soma_digitos(m) / max(m, 1)
+    d_c = _soma_digitos(c) / max(c, 1)
+
+    # Largura dos valores: tempos de setup/bloqueio pelo limite superior, processamento e datas por uma ordem de grandeza típica
+    d_setup = _digitos(parametros['t_max_setup']) if parametros.get('modo_setup', 'aleatorio') == 'aleatorio' else 3
+    d_bloqueio = _digitos(parametros['t_max_block'])
+    d_processamento = 3
+    d_data = 4
+
+    fracao_zero = _fracao_mesma_area(parametros['n_tarefas_estoque'], parametros['n_tarefas_docas'], parametros['num_estoques'])
+    fracao_elegivel, fracao_elegivel_quadrado = _fracoes_elegiveis(parametros)
+    esparso = formato == 'esparso'
+    tabela = formato == 'tabela'
+
+    secoes = {}
+    secoes['n_jobs'] = {'linhas': 3, 'bytes': 20 + len(f"param n_jobs := {n_tarefas};\n\n")}
+    secoes['n_machines'] = {'linhas': 3, 'bytes': 26 + len(f"param n_machines := {m};\n\n")}
+    secoes['n_caminhoes'] = {'linhas': 3, 'bytes': 28 + len(f"param n_caminhoes := {c};\n\n")}
+    secoes['n_operations'] = {'linhas': n_tarefas + 3,
+                              'bytes': 22 + _soma_digitos(n_tarefas) + n_tarefas * (len(str(n_por_tarefa)) + 2) + 3}
+    secoes['d'] = {'linhas': c + 4, 'bytes': 50 + _soma_digitos(c) + c * (d_data + 2) + 3}
+    secoes['pr'] = {'linhas': n + 4, 'bytes': 59 + _soma_digitos(n) + n * 2 + round((n // 2) * (1 + d_n)) + 3}
+
+    if tabela:
+        # Uma linha por operação em cada tabela: o número da operação e um valor por coluna
+        cabecalho = _soma_digitos(m) + m
+        secoes['Ri'] = {'linhas': c * (n + 1) + 3,
+                        'bytes': 71 + round(c * (len(f"[*,{c},*]:  :=\n") + cabecalho + _soma_digitos(n) + n * (2 * m + 1))) + 3}
+        secoes['p'] = {'linhas': n + 3,
+                       'bytes': 66 + cabecalho + _soma_digitos(n)
+                                + round(n * (1 + m * (2 + fracao_elegivel * (d_processamento - 1)))) + 3}
+    elif esparso:
+        linhas_ri = round(n * m * fracao_elegivel)
+        secoes['Ri'] = {'linhas': linhas_ri + 4, 'bytes': 79 + round(linhas_ri * (d_n + d_c + d_m + 5)) + 3}
+        secoes['p'] = {'linhas': linhas_ri + 4, 'bytes': 66 + round(linhas_ri * (d_n + d_m + d_processamento + 3)) + 3}
+    else:
+        linhas_ri = n * c * m
+        secoes['Ri'] = {'linhas': linhas_ri + n + 3,
+                        'bytes': 71 + round(linhas_ri * (d_n + d_c + d_m + 5)) + n + 2}
+        linhas_p = n * m
+        secoes['p'] = {'linhas': linhas_p + 4,
+                       'bytes': 66 + round(linhas_p * (d_n + d_m + 3 + fracao_elegivel * (d_processamento - 1))) + 3}
+
+    if n_cenarios is not None:
+        # Arquivo de cenários: n_scenarios e SCENARIOS, e p e d com uma linha 'cenario ...' por valor em cada cenário,
+        # em qualquer formato de texto
+        d_k = _soma_digitos(n_cenarios) / max(n_cenarios, 1)
+        secoes['n_scenarios'] = {'linhas': 5,
+                                 'bytes': 31 + len(f"param n_scenarios := {n_cenarios};\n\n") + 20
+                                          + _soma_digitos(n_cenarios) + n_cenarios - 1}
+        secoes['d'] = {'linhas': n_cenarios * c + 4,
+                       'bytes': 67 + round(n_cenarios * c * (d_k + d_c + d_data + 3)) + 3}
+        linhas_p = round(n * m * fracao_elegivel) if esparso else n * m
+        valor_p = d_processamento if esparso else 1 + fracao_elegivel * (d_processamento - 1)
+        secoes['p'] = {'linhas': n_cenarios * linhas_p + 4,
+                       'bytes': 82 + round(n_cenarios * linhas_p * (d_k + d_n + d_m + 4 + valor_p)) + 3}
+
+    # Cada linha i de uma fatia [*,*,k] contém os tripletos "i j valor" de todas as operações j. Só o setup aleatório
+    # tem pares nulos (operações na mesma área), que ocupam um dígito no formato denso e são omitidos no esparso
+    fracoes_zero = {'s': fracao_zero if parametros.get('modo_setup', 'aleatorio') == 'aleatorio' else 0.0, 'bk': 0.0}
+    # Com a poda por elegibilidade, cada máquina só tem as linhas e colunas das operações elegíveis
+    fracao_linhas, fracao_pares = (fracao_elegivel, fracao_elegivel_quadrado) if podar_elegibilidade else (1.0, 1.0)
+    # No modo determinístico, o bloqueio e o setup aleatório ficam em forma fechada (TemposConstantes). Sem a poda, a
+    # constante é o valor padrão e só as tabelas de zeros das operações da mesma área e a diagonal (como tripletos,
+    # quando não há tabelas) são escritas, em qualquer formato de texto; com a poda, a escrita é a usual
+    constantes = set()
+    if parametros.get('deterministico'):
+        constantes = {'s', 'bk'} if parametros.get('modo_setup', 'aleatorio') == 'aleatorio' else {'bk'}
+    for secao, d_valor in (('s', d_setup), ('bk', d_bloqueio)):
+        if secao in constantes and not podar_elegibilidade:
+            if fracoes_zero[secao] > 0:
+                n_blocos = parametros['num_estoques'] + 2
+                bytes_fatia = n_blocos * len(f"\n[*,*,{m}]:  :=\n") + 2 * n * (d_n + 1) + 2 * n * n * fracoes_zero[secao]
+                linhas_fatia = n + n_blocos
+            else:
+                bytes_fatia = len(f"\n[*,*,{m}]\n") + n * (2 * d_n + 4)
+                linhas_fatia = n + 2
+            secoes[secao] = {'linhas': round(m * linhas_fatia) + 3, 'bytes': 60 + round(m * bytes_fatia) + 3}
+            continue
+        if tabela:
+            # Cabeçalho com as colunas e, em cada linha, o número da operação e um valor por coluna; como o valor ocupa
+            # a maior parte da linha, usa a largura média dos sorteios em vez da do limite superior
+            if secao == 'bk' or parametros.get('modo_setup', 'aleatorio') == 'aleatorio':
+                limites = ('t_min_block', 't_max_block') if secao == 'bk' else ('t_min_setup', 't_max_setup')
+                d_valor = _digitos_medios(parametros[limites[0]], parametros[limites[1]])
+            n_linhas = n * fracao_linhas
+            bytes_tabela = m * (len(f"\n[*,*,{m}]:  :=\n") + 2 * (_soma_digitos(n) + n) * fracao_linhas
+                                + n * n * fracao_pares * (d_valor + 1 - fracoes_zero[secao] * (d_valor - 1)))
+            secoes[secao] = {'linhas': round(m * (n_linhas + 2)) + 4, 'bytes': 60 + round(bytes_tabela) + 3}
+            continue
+        if esparso:
+            bytes_tripletos = m * (1 - fracoes_zero[secao]) * (2 * n * _soma_digitos(n) + n * n * (d_valor + 3))
+        else:
+            bytes_tripletos = m * (2 * n * _soma_digitos(n) + n * n * (d_valor + 3 - fracoes_zero[secao] * (d_valor - 1)))
+        secoes[secao] = {'linhas': round(m * n * fracao_linhas) + 2 * m + 4,
+                         'bytes': 60 + m * (len(f"\n[*,*,{m}]\n")) + round(bytes_tripletos * fracao_pares) + 3}
+
+    # Memória: armazenamento triangular de setup e bloqueio (ou tensores do modo geométrico), os sorteios de uma máquina
+    # e a base do processo
+    # Com limite_memoria, os sorteios são feitos em blocos que respeitam o limite; com pasta_temporaria, os tempos ficam
+    # em disco (np.memmap) e não entram no pico de memória
+    # Os tempos em forma fechada não têm sorteios nem armazenamento por par
+    memoria = modelo['bytes_por_sorteio'] * pares / max(m, 1) * (not constantes)
+    if parametros.get('limite_memoria') is not None:
+        memoria = min(memoria, parametros['limite_memoria'])
+    em_disco = parametros.get('pasta_temporaria') is not None
+    if parametros.get('modo_setup', 'aleatorio') == 'geometrico':
+        # Tensor int32 do setup e um bloco de linhas das distâncias em vazio (limitado por limite_memoria)
+        bloco = BYTES_POR_PAR_GEOMETRICO * n * n
+        if parametros.get('limite_memoria') is not None:
+            bloco = min(bloco, max(parametros['limite_memoria'], BYTES_POR_PAR_GEOMETRICO * n))
+        memoria += 4 * m * n * n * (not em_disco) + bloco
+        memoria += modelo['bytes_por_par'] * pares * (not em_disco) * ('bk' not in constantes)
+    else:
+        memoria += (2 - len(constantes)) * modelo['bytes_por_par'] * pares * (not em_disco)
+    pares_gerados = (2 - len(constantes)) * pares
+    k = n_cenarios or 1
+    if n_cenarios is not None:
+        # Velocidades e tempos (float64 e int64) sorteados de todos os cenários e, na escrita em texto, a lista de p
+        memoria += 24 * k * n * m + 36 * k * n * m * (formato != 'binario')
+    if formato == 'binario':
+        # Tensores int32 de s e bk, Ri em int8 e p em float64 (p e d com um eixo de cenários no arquivo de cenários)
+        bytes_saida = 4 * 2 * m * n * n + n * c * m + 8 * k * n * m + 8 * (n_tarefas + k * c + 2 * n) + 11 * 256
+        memoria += bytes_saida if not em_disco else bytes_saida - 4 * 2 * m * n * n
+        linhas = 0
+    else:
+        bytes_saida = sum(secao['bytes'] for secao in secoes.values())
+        linhas = sum(secao['linhas'] for secao in secoes.values())
+
+    return {
+        'n_tarefas': n_tarefas,
+        'n_operacoes': n,
+        'n_maquinas': m,
+        'n_caminhoes': c,
+        'pares': pares_gerados,
+        'secoes': secoes,
+        'linhas': linhas,
+        'bytes': int(bytes_saida),
+        'memoria': int(modelo['bytes_base'] + memoria),
+        'segundos': modelo['segundos_por_par'] * pares_gerados + modelo['segundos_por_byte'] * bytes_saida,
+        'formato': formato,
+    }
+
+def ajustar_modelo_custo(estimativa: dict,
+                         segundos_geracao: float,
+                         segundos_escrita: float,
+                         pico_memoria: float,
+                         modelo: dict = None) -> dict:
+    """
+    Ajusta os coeficientes do modelo de custo a partir de uma execução medida.
+
+    Parâmetros:
+    -----------
+    estimativa : dict
+        Estimativa (estimar_instancia) da instância executada.
+    segundos_geracao : float
+        Tempo medido de geração da instância.
+    segundos_escrita : float
+        Tempo medido de escrita do arquivo.
+    pico_memoria : float
+        Pico de memória alocada durante a geração, em bytes (e.g., com tracemalloc), sem a memória base do processo.
+    modelo : dict, opcional
+        Modelo de partida, cujos coeficientes não ajustáveis são mantidos. Se None, usa MODELO_CUSTO_PADRAO.
+
+    Retorno:
+    --------
+    dict
+        O modelo de custo ajustado.
+    """
+
+    modelo = dict(MODELO_CUSTO_PADRAO, **(modelo or {}))
+    if estimativa['pares'] > 0:
+        modelo['segundos_por_par'] = segundos_geracao / estimativa['pares']
+        sorteios_por_maquina = estimativa['pares'] / (2 * max(estimativa['n_maquinas'], 1))
+        modelo['bytes_por_sorteio'] = max(pico_memoria - modelo['bytes_por_par'] * estimativa['pares'], 0) / sorteios_por_maquina
+    if estimativa['bytes'] > 0:
+        modelo['segundos_por_byte'] = segundos_escrita / estimativa['bytes']
+    return modelo
+
+def aplicar_politica(estimativa: dict, politica: dict) -> str:
+    """
+    Decide o formato de saída a partir da estimativa e dos limiares da política.
+
+    Parâmetros:
+    -----------
+    estimativa : dict
+        Estimativa (estimar_instancia) no formato pretendido.
+    politica : dict
+        Limiares 'max_bytes', 'max_memoria' e 'max_segundos' (os ausentes usam POLITICA_PADRAO) e a 'acao' tomada
+        quando algum deles é excedido: um dos formatos de FORMATOS_SAIDA (e.g. 'esparso', 'tabela' ou 'binario')
+        ou 'recusar'.
+
+    Retorno:
+    --------
+    str
+        O formato a ser usado: o da estimativa, se nenhum limiar for excedido, ou o formato da ação.
+
+    Exceções:
+    ---------
+    ValueError
+        Se a ação for 'recusar' e algum limiar for excedido, ou se a ação for desconhecida.
+    """
+
+    politica = dict(POLITICA_PADRAO, **politica)
+    acoes = (*FORMATOS_SAIDA, 'recusar')
+    if politica['acao'] not in acoes:
+        raise ValueError(f"Ação de política desconhecida: {politica['acao']}. Use uma de {acoes}.")
+
+    excedidos = [f"{nome} = {estimativa[chave]:.3g} > {politica[limite]:.3g}"
+                 for nome, chave, limite in (('bytes', 'bytes', 'max_bytes'),
+                                             ('memória', 'memoria', 'max_memoria'),
+                                             ('tempo', 'segundos', 'max_segundos'))
+                 if not math.isinf(politica[limite]) and estimativa[chave] > politica[limite]]
+    if not excedidos:
+        return estimativa['formato']
+
+    if politica['acao'] == 'recusar':
+        raise ValueError(f"Instância recusada pela política de tamanho: {', '.join(excedidos)}.")
+
+    print(f"Limiares excedidos ({', '.join(excedidos)}); usando o formato '{politica['acao']}'.")
+    return politica['acao']
+
+def formatar_estimativa(estimativa: dict) -> str:
+    """
+    Formata a estimativa como um relatório legível, com uma linha por seção do arquivo.
+    """
+
+    linhas = [f"Instância: {estimativa['n_tarefas']} tarefas, {estimativa['n_operacoes']} operações, "
+              f"{estimativa['n_maquinas']} máquinas, {estimativa['n_caminhoes']} caminhões "
+              f"({estimativa['pares']} pares de setup/bloqueio)",
+              f"Formato: {estimativa['formato']}"]
+    if estimativa['formato'] != 'binario':
+        for secao, valores in estimativa['secoes'].items():
+            linhas.append(f"  {secao:<13}{valores['linhas']:>14,} linhas {valores['bytes']:>16,} bytes")
+    linhas.append(f"Total: {estimativa['linhas']:,} linhas, {estimativa['bytes'] / 1e6:,.1f} MB")
+    linhas.append(f"Memória de pico estimada: {estimativa['memoria'] / 1e6:,.0f} MB")
+    linhas.append(f"Tempo estimado: {estimativa['segundos']:,.1f} s")
+    return '\n'.join(linhas)
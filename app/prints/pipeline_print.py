@@ -1,41 +1,174 @@
-from .print_parametros import print_tarefas, print_maquinas, print_n_operations
-from .print_parametros import print_datas_saida, print_predecessores
-from .print_parametros import print_elegibilidade, print_tempo_processamento
-from .print_parametros import print_tempo_setup, print_tempo_bloqueio
-from .print_parametros import print_caminhoes
-
-# Função principal que utiliza as funções acima
-def pipeline_gerar_prints_parametros(n_maquinas: int, 
-                                     n_tarefas_docas : int,
-                                     n_tarefas_estoque: int,
-                                     resultados: dict[str, any], 
-                                     elegibilidade: dict[int, dict], 
-                                     tempos_processamento: dict[str, dict], 
-                                     datas_saida: dict[str, float], 
-                                     n_operacoes_por_tarefa: int, 
-                                     tempos_bloqueios: dict[str, dict[str, int]], 
-                                     n_caminhoes: int, 
-                                     tempos_setup: dict[str, dict[str, int]],
-                                     todos_caminhoes_atrasados: bool,
-                                     todos_caminhoes_adiantados: bool,
-                                     pasta) -> None:
-
-    
-    if todos_caminhoes_atrasados:
-        nome_arquivo = f"{pasta}{n_tarefas_docas}_{n_tarefas_estoque}_{n_maquinas}_{n_caminhoes}_at_AMPL.txt"
-    elif todos_caminhoes_adiantados:
-        nome_arquivo = f"{pasta}{n_tarefas_docas}_{n_tarefas_estoque}_{n_maquinas}_{n_caminhoes}_ad_AMPL.txt"
-    else:
-        nome_arquivo = f"{pasta}{n_tarefas_docas}_{n_tarefas_estoque}_{n_maquinas}_{n_caminhoes}_AMPL.txt"
-    
-    with open(nome_arquivo, 'w') as f:
-        print_tarefas(resultados, f)
-        print_maquinas(n_maquinas, f)
-        print_caminhoes(n_caminhoes, f)
-        print_n_operations(resultados['n_total_tarefas'], n_operacoes_por_tarefa, f)
-        print_datas_saida(datas_saida, f)
-        print_predecessores(resultados, f)
-        print_elegibilidade(elegibilidade, n_caminhoes, n_maquinas, f)
-        print_tempo_processamento(elegibilidade, tempos_processamento, n_maquinas, f)
-        print_tempo_setup(tempos_setup, resultados['n_total_operacoes'], n_maquinas, f)
-        print_tempo_bloqueio(tempos_bloqueios, resultados['n_total_operacoes'], n_maquinas, f)
+import numpy as np
+from .print_parametros import print_tarefas, print_maquinas, print_n_operations
+from .print_parametros import print_datas_saida, print_predecessores
+from .print_parametros import print_elegibilidade, print_tempo_processamento
+from .print_parametros import print_tempo_setup, print_tempo_bloqueio
+from .print_parametros import print_caminhoes, print_limites
+from .print_parametros import print_cenarios, print_datas_saida_cenarios, print_tempo_processamento_cenarios
+from instancia import montar_arrays_instancia, salvar_arrays_instancia
+from parametros_avancados import matriz_elegibilidade, calcular_limites
+
+# Formatos de saída aceitos por pipeline_gerar_prints_parametros
+FORMATOS_SAIDA = ('denso', 'esparso', 'binario', 'tabela')
+
+def nome_arquivo_instancia(pasta: str,
+                           n_tarefas_docas: int,
+                           n_tarefas_estoque: int,
+                           n_maquinas: int,
+                           n_caminhoes: int,
+                           todos_caminhoes_atrasados: bool,
+                           todos_caminhoes_adiantados: bool) -> str:
+    """
+    Retorna o caminho do arquivo AMPL de uma instância, no formato {docas}_{estoque}_{maquinas}_{caminhoes}[_at|_ad]_AMPL.txt.
+    """
+
+    if todos_caminhoes_atrasados:
+        return f"{pasta}{n_tarefas_docas}_{n_tarefas_estoque}_{n_maquinas}_{n_caminhoes}_at_AMPL.txt"
+    elif todos_caminhoes_adiantados:
+        return f"{pasta}{n_tarefas_docas}_{n_tarefas_estoque}_{n_maquinas}_{n_caminhoes}_ad_AMPL.txt"
+    else:
+        return f"{pasta}{n_tarefas_docas}_{n_tarefas_estoque}_{n_maquinas}_{n_caminhoes}_AMPL.txt"
+
+# Função principal que utiliza as funções acima
+def pipeline_gerar_prints_parametros(n_maquinas: int, 
+                                     n_tarefas_docas : int,
+                                     n_tarefas_estoque: int,
+                                     resultados: dict[str, any], 
+                                     elegibilidade: dict[int, dict], 
+                                     tempos_processamento: dict[str, dict], 
+                                     datas_saida: dict[str, float], 
+                                     n_operacoes_por_tarefa: int, 
+                                     tempos_bloqueios: dict[str, dict[str, int]], 
+                                     n_caminhoes: int, 
+                                     tempos_setup: dict[str, dict[str, int]],
+                                     todos_caminhoes_atrasados: bool,
+                                     todos_caminhoes_adiantados: bool,
+                                     pasta,
+                                     formato: str = 'denso',
+                                     podar_elegibilidade: bool = False,
+                                     limites: bool = False) -> str:
+    """
+    Escreve todos os parâmetros de uma instância em um arquivo e retorna o caminho do arquivo gerado.
+
+    O formato 'denso' é o arquivo AMPL completo; 'esparso' escreve Ri, p, s e bk apenas com os valores não nulos
+    (usando `default 0` no AMPL); 'tabela' escreve Ri, p, s e bk com a sintaxe de tabela do AMPL (`: 1 2 ... :=`),
+    uma linha de valores por operação em cada fatia, sem repetir os índices; 'binario' salva os arrays da instância (veja instancia.montar_arrays_instancia)
+    em um arquivo .npz, com o mesmo nome do arquivo AMPL.
+
+    Com podar_elegibilidade, os parâmetros s e bk dos formatos texto trazem apenas os pares em que as duas operações
+    são elegíveis na máquina; os demais ficam com o valor padrão 0, já que nenhuma programação viável os utiliza.
+    Sem a poda, os tempos constantes do modo determinístico são escritos com a constante como valor padrão e apenas
+    os pares que diferem dela (a diagonal, os pares da mesma área e as exceções, todos explícitos), de modo que o
+    arquivo descreve o mesmo tensor do formato 'binario'.
+
+    Com limites, o arquivo também traz o horizonte de programação H e os limites ES, LS, M_op e A_max
+    (veja parametros_avancados.calcular_limites); no formato 'binario' eles são salvos como arrays de mesmo nome.
+    O modelo AMPL precisa declarar esses parâmetros, por isso eles só são escritos quando pedidos.
+    """
+
+    if formato not in FORMATOS_SAIDA:
+        raise ValueError(f"Formato de saída desconhecido: {formato}. Use um dos formatos {FORMATOS_SAIDA}.")
+
+    
+    nome_arquivo = nome_arquivo_instancia(pasta, n_tarefas_docas, n_tarefas_estoque, n_maquinas, n_caminhoes,
+                                          todos_caminhoes_atrasados, todos_caminhoes_adiantados)
+
+    if limites:
+        valores_limites = calcular_limites(elegibilidade, tempos_processamento, tempos_setup, tempos_bloqueios,
+                                           resultados['predecessores'], datas_saida, n_maquinas)
+
+    if formato == 'binario':
+        arrays = montar_arrays_instancia(n_maquinas, n_caminhoes, resultados, elegibilidade, tempos_processamento,
+                                         datas_saida, n_operacoes_por_tarefa, tempos_bloqueios, tempos_setup)
+        if limites:
+            arrays.update({nome: np.asarray(valor) for nome, valor in valores_limites.items()})
+        nome_arquivo = nome_arquivo[:-len('.txt')] + '.npz'
+        salvar_arrays_instancia(arrays, nome_arquivo)
+        return nome_arquivo
+
+    esparso = formato == 'esparso'
+    tabela = formato == 'tabela'
+    elegiveis = matriz_elegibilidade(elegibilidade, resultados['n_total_operacoes'], n_maquinas) if podar_elegibilidade else None
+    with open(nome_arquivo, 'w') as f:
+        print_tarefas(resultados, f)
+        print_maquinas(n_maquinas, f)
+        print_caminhoes(n_caminhoes, f)
+        print_n_operations(resultados['n_total_tarefas'], n_operacoes_por_tarefa, f)
+        print_datas_saida(datas_saida, f)
+        print_predecessores(resultados, f)
+        print_elegibilidade(elegibilidade, n_caminhoes, n_maquinas, f, esparso, tabela)
+        print_tempo_processamento(elegibilidade, tempos_processamento, n_maquinas, f, esparso, tabela)
+        print_tempo_setup(tempos_setup, resultados['n_total_operacoes'], n_maquinas, f, esparso, elegiveis, tabela)
+        print_tempo_bloqueio(tempos_bloqueios, resultados['n_total_operacoes'], n_maquinas, f, esparso, elegiveis, tabela)
+        if limites:
+            print_limites(valores_limites, f)
+
+    return nome_arquivo
+
+
+def pipeline_gerar_prints_cenarios(n_maquinas: int,
+                                   n_tarefas_docas: int,
+                                   n_tarefas_estoque: int,
+                                   resultados: dict[str, any],
+                                   elegibilidade: dict[int, dict],
+                                   cenarios: dict[str, np.ndarray],
+                                   n_operacoes_por_tarefa: int,
+                                   tempos_bloqueios,
+                                   n_caminhoes: int,
+                                   tempos_setup,
+                                   todos_caminhoes_atrasados: bool,
+                                   todos_caminhoes_adiantados: bool,
+                                   pasta,
+                                   formato: str = 'denso',
+                                   podar_elegibilidade: bool = False) -> str:
+    """
+    Escreve uma instância com vários cenários (veja parametros_avancados.amostrar_cenarios) em um único arquivo
+    e retorna o caminho do arquivo gerado ({nome da instância}_{K}cen_AMPL.txt).
+
+    Layout, elegibilidade, precedências, setup e bloqueio são escritos uma só vez, como em
+    pipeline_gerar_prints_parametros; p e d ganham o índice do cenário como primeira dimensão
+    (p[cenario, operacao, maquina] e d[cenario, caminhao]) e o arquivo traz param n_scenarios e set SCENARIOS.
+    No formato 'binario', os arrays p (n_cenarios, n, n_maquinas) e d (n_cenarios, n_caminhoes) substituem os da instância.
+    """
+
+    if formato not in FORMATOS_SAIDA:
+        raise ValueError(f"Formato de saída desconhecido: {formato}. Use um dos formatos {FORMATOS_SAIDA}.")
+
+    n_cenarios = len(cenarios['p'])
+    n_operacoes = resultados['n_total_operacoes']
+    nome_arquivo = nome_arquivo_instancia(pasta, n_tarefas_docas, n_tarefas_estoque, n_maquinas, n_caminhoes,
+                                          todos_caminhoes_atrasados, todos_caminhoes_adiantados)
+    nome_arquivo = nome_arquivo.replace('_AMPL.txt', f'_{n_cenarios}cen_AMPL.txt')
+    elegiveis = matriz_elegibilidade(elegibilidade, n_operacoes, n_maquinas)
+
+    if formato == 'binario':
+        # Os tempos do cenário 1 só servem para montar os arrays comuns; p e d são substituídos pelos de todos os cenários
+        tempos_processamento = {f'Empilhadeira {maquina}': {operacao: {'tempo': cenarios['p'][0, operacao - 1, maquina - 1]}
+                                                             for operacao in range(1, n_operacoes + 1)}
+                                for maquina in range(1, n_maquinas + 1)}
+        datas_saida = {f'Caminhão {c}': data for c, data in enumerate(cenarios['d'][0].tolist(), start=1)}
+        arrays = montar_arrays_instancia(n_maquinas, n_caminhoes, resultados, elegibilidade, tempos_processamento,
+                                         datas_saida, n_operacoes_por_tarefa, tempos_bloqueios, tempos_setup)
+        arrays['n_scenarios'] = np.array(n_cenarios)
+        arrays['p'] = np.where(elegiveis.T[None], cenarios['p'], np.nan)
+        arrays['d'] = cenarios['d']
+        nome_arquivo = nome_arquivo[:-len('.txt')] + '.npz'
+        salvar_arrays_instancia(arrays, nome_arquivo)
+        return nome_arquivo
+
+    esparso = formato == 'esparso'
+    tabela = formato == 'tabela'
+    with open(nome_arquivo, 'w') as f:
+        print_tarefas(resultados, f)
+        print_maquinas(n_maquinas, f)
+        print_caminhoes(n_caminhoes, f)
+        print_cenarios(n_cenarios, f)
+        print_n_operations(resultados['n_total_tarefas'], n_operacoes_por_tarefa, f)
+        print_datas_saida_cenarios(cenarios['d'], f)
+        print_predecessores(resultados, f)
+        print_elegibilidade(elegibilidade, n_caminhoes, n_maquinas, f, esparso, tabela)
+        print_tempo_processamento_cenarios(elegibilidade, cenarios['p'], n_maquinas, f, esparso)
+        print_tempo_setup(tempos_setup, n_operacoes, n_maquinas, f, esparso, elegiveis if podar_elegibilidade else None, tabela)
+        print_tempo_bloqueio(tempos_bloqueios, n_operacoes, n_maquinas, f, esparso, elegiveis if podar_elegibilidade else None, tabela)
+
+    return nome_arquivo
\ No newline at end of file
@@ -1,305 +1,544 @@
-# Função auxiliar para escrever no arquivo e também imprimir no console
-def escrever_arquivo(f, conteudo: str) -> None:
-    f.write(conteudo + '\n')
-
-def print_datas_saida(datas_saida: dict[str, float], f) -> None:
-    """
-    Imprime os dados de saída dos caminhões no formato necessário para um modelo AMPL.
-
-    Parâmetros:
-    -----------
-    datas_saida : dict[str, float]
-        Dicionário onde as chaves são os caminhões (e.g., 'Caminhão 1') e os valores são as datas de saída.
-
-    Retorno:
-    --------
-    None
-    """
-
-    escrever_arquivo(f, "# Parametro data de saida dos caminhoes")
-    escrever_arquivo(f, "param d :=")
-    for caminhao, data_saida in datas_saida.items():
-        numero_caminhao = int(caminhao.split()[1])
-        escrever_arquivo(f, f"{numero_caminhao} {round(data_saida)}")
-    escrever_arquivo(f, ";\n")
-
-def print_tempo_processamento(elegibilidade: dict[int, dict], 
-                              tempos_processamento: dict[str, dict], 
-                              n_maquinas: int, 
-                              f) -> None:
-    """
-    Imprime o tempo de processamento de cada operação para cada máquina no formato AMPL.
-
-    Parâmetros:
-    -----------
-    elegibilidade : dict[int, dict]
-        Dicionário que mapeia as operações às suas máquinas elegíveis e caminhões.
-    tempos_processamento : dict[str, dict]
-        Dicionário que mapeia o tempo de processamento para cada operação e máquina.
-    n_maquinas : int
-        Número total de máquinas.
-
-    Retorno:
-    --------
-    None
-    """
-
-    escrever_arquivo(f, "# Parametro do tempo de processamento de cada operacao")
-    escrever_arquivo(f, "param p :=")
-    for operacao in sorted(elegibilidade.keys()):
-        for maquina in range(1, n_maquinas + 1):
-            if maquina in elegibilidade[operacao]['maquinas']:
-                tempo = tempos_processamento[f'Empilhadeira {maquina}'][operacao]['tempo']
-                escrever_arquivo(f, f"{operacao} {maquina} {round(tempo)}")
-            else:
-                escrever_arquivo(f, f"{operacao} {maquina} .")
-    escrever_arquivo(f, ";\n")
-
-def print_elegibilidade(elegibilidade: dict[int, dict], 
-                        n_caminhoes: int, 
-                        n_maquinas: int, 
-                        f) -> None:
-    """
-    Imprime a elegibilidade de cada operação para cada máquina no formato AMPL.
-
-    Parâmetros:
-    -----------
-    elegibilidade : dict[int, dict]
-        Dicionário que mapeia as operações às suas máquinas elegíveis e caminhões.
-    n_caminhoes : int
-        Número total de caminhões.
-    n_maquinas : int
-        Número total de máquinas.
-
-    Retorno:
-    --------
-    None
-    """
-
-    escrever_arquivo(f, "# Parametro de elegibilidade das operacoes para cada maquina")
-    escrever_arquivo(f, "param Ri :=")
-    for idx, operacao in enumerate(sorted(elegibilidade.keys())):
-        for caminhao in range(1, n_caminhoes + 1):
-            for maquina in range(1, n_maquinas + 1):
-                if elegibilidade[operacao]['caminhao'] == caminhao and maquina in elegibilidade[operacao]['maquinas']:
-                    escrever_arquivo(f, f"{operacao} {caminhao} {maquina} 1")
-                else:
-                    escrever_arquivo(f, f"{operacao} {caminhao} {maquina} 0")
-        if idx == len(elegibilidade) - 1:
-            escrever_arquivo(f, ";\n")
-        else:
-            escrever_arquivo(f, "")
-
-def print_predecessores(resultados: dict[str, dict[int, int]], f) -> None:
-    """
-    Imprime os predecessores de cada operação no formato AMPL.
-
-    Parâmetros:
-    -----------
-    resultados : dict[str, dict[int, int]]
-        Dicionário contendo os predecessores de cada operação.
-
-    Retorno:
-    --------
-    None
-    """
-
-    predecessores = resultados["predecessores"]
-    escrever_arquivo(f, "# Parametro dos predecessores de cada operacao")
-    escrever_arquivo(f, "param pr :=")
-    for operacao, predecessor in predecessores.items():
-        escrever_arquivo(f, f"{operacao} {predecessor}")
-    escrever_arquivo(f, ";\n")
-
-def print_maquinas(n_maquinas: int, f) -> None:
-    """
-    Imprime a quantidade de máquinas no formato AMPL.
-
-    Parâmetros:
-    -----------
-    n_maquinas : int
-        Número total de máquinas.
-
-    Retorno:
-    --------
-    None
-    """
-
-    escrever_arquivo(f, "# Quantidade de máquinas")
-    escrever_arquivo(f, f"param n_machines := {n_maquinas};\n")
-
-def print_caminhoes(n_caminhoes: int, f) -> None:
-    """
-    Imprime a quantidade de caminhões no formato AMPL.
-
-    Parâmetros:
-    -----------
-    n_maquinas : int
-        Número total de caminhões.
-
-    Retorno:
-    --------
-    None
-    """
-
-    escrever_arquivo(f, "# Quantidade de caminhões")
-    escrever_arquivo(f, f"param n_caminhoes := {n_caminhoes};\n")
-
-def print_tarefas(resultados: dict[str, int], f) -> None:
-    """
-    Imprime a quantidade de jobs (tarefas) no formato AMPL.
-
-    Parâmetros:
-    -----------
-    resultados : dict[str, int]
-        Dicionário contendo o número total de tarefas.
-
-    Retorno:
-    --------
-    None
-    """
-
-    n_jobs = resultados["n_total_tarefas"]
-    escrever_arquivo(f, "# Quantidade de jobs")
-    escrever_arquivo(f, f"param n_jobs := {n_jobs};\n")
-
-def print_tempo_setup(tempos_setup: dict[str, dict[str, int]], 
-                      n_operacoes: int, 
-                      n_maquinas: int, 
-                      f) -> None:
-    """
-    Imprime o tempo de setup entre operações para cada máquina no formato AMPL.
-
-    Parâmetros:
-    -----------
-    tempos_setup : dict[str, dict[str, int]]
-        Dicionário que contém os tempos de setup entre pares de operações por máquina.
-    n_operacoes : int
-        Número total de operações.
-    n_maquinas : int
-        Número total de máquinas.
-
-    Retorno:
-    --------
-    None
-    """
-
-    escrever_arquivo(f, '# Parametro tempo de setup entre operacoes')
-    escrever_arquivo(f, "param s :=")
-    for machine in range(1, n_maquinas + 1):
-            machine_key = f'Empilhadeira {machine}'
-            if machine_key not in tempos_setup:
-                escrever_arquivo(f, f"[*,*,{machine}]")
-                for i in range(1, n_operacoes + 1):
-                    line = []
-                    for j in range(1, n_operacoes + 1):
-                        setup_time = '.' if i == j else 0
-                        line.extend([i, j, setup_time])
-                    escrever_arquivo(f, ' '.join(map(str, line)))
-            else:
-                escrever_arquivo(f, f"\n[*,*,{machine}]")
-                for i in range(1, n_operacoes + 1):
-                    line = []
-                    for j in range(1, n_operacoes + 1):
-                        if i == j:
-                            setup_time = '.'
-                        else:
-                            pair_key_1 = f"{i},{j}"
-                            pair_key_2 = f"{j},{i}"
-                            setup_time = tempos_setup[machine_key].get(pair_key_1, tempos_setup[machine_key].get(pair_key_2, 0))
-                            
-                            # Garantir que setup_time é numérico
-                            if isinstance(setup_time, str):
-                                try:
-                                    setup_time = float(setup_time)  # Tenta converter para float
-                                except ValueError:
-                                    setup_time = 0  # Valor padrão se não puder converter
-                            
-                            setup_time = int(round(setup_time))  # Garantir que é inteiro
-                        line.extend([i, j, setup_time])
-                    escrever_arquivo(f, ' '.join(map(str, line)))
-    
-    escrever_arquivo(f, ";\n")
-
-def print_tempo_bloqueio(tempos_bloqueios: dict[str, dict[str, int]], 
-                         n_operacoes: int, 
-                         n_maquinas: int, 
-                         f) -> None:
-
-    """
-    Imprime o tempo de bloqueio entre operações para cada máquina no formato AMPL.
-
-    Parâmetros:
-    -----------
-    tempos_bloqueios : dict[str, dict[str, int]]
-        Dicionário que contém os tempos de bloqueio entre pares de operações por máquina.
-    n_operacoes : int
-        Número total de operações.
-    n_maquinas : int
-        Número total de máquinas.
-
-    Retorno:
-    --------
-    None
-    """
-
-    escrever_arquivo(f, '# Parametro tempo de bloqueio entre operacoes')
-    escrever_arquivo(f, "param bk :=")
-    for machine in range(1, n_maquinas + 1):
-        machine_key = f'Empilhadeira {machine}'
-        if machine_key not in tempos_bloqueios:
-            escrever_arquivo(f, f"[*,*,{machine}]")
-            for i in range(1, n_operacoes + 1):
-                line = []
-                for j in range(1, n_operacoes + 1):
-                    setup_time = '.' if i == j else 0
-                    line.extend([i, j, setup_time])
-                escrever_arquivo(f, ' '.join(map(str, line)))
-        else:
-            escrever_arquivo(f, f"\n[*,*,{machine}]")
-            for i in range(1, n_operacoes + 1):
-                line = []
-                for j in range(1, n_operacoes + 1):
-                    if i == j:
-                        setup_time = '.'
-                    else:
-                        pair_key_1 = f"{i},{j}"
-                        pair_key_2 = f"{j},{i}"
-                        setup_time = tempos_bloqueios[machine_key].get(pair_key_1, tempos_bloqueios[machine_key].get(pair_key_2, 0))
-                        
-                        # Garantir que setup_time é numérico
-                        if isinstance(setup_time, str):
-                            try:
-                                setup_time = float(setup_time)  # Tenta converter para float
-                            except ValueError:
-                                setup_time = 0  # Valor padrão se não puder converter
-                        
-                        setup_time = int(round(setup_time))  # Garantir que é inteiro
-                    line.extend([i, j, setup_time])
-                escrever_arquivo(f, ' '.join(map(str, line)))
-    
-    escrever_arquivo(f, ";\n")
-
-def print_n_operations(n_total_tarefas: int, n_operacoes_por_tarefa: int, f) -> None:
-    """
-    Imprime o número de operações por tarefa no formato AMPL.
-
-    Parâmetros:
-    -----------
-    n_total_tarefas : int
-        Número total de tarefas.
-    n_operacoes_por_tarefa : int
-        Número de operações associadas a cada tarefa.
-
-    Retorno:
-    --------
-    None
-    """
-
-    escrever_arquivo(f, "param n_operations :=")
-    for tarefa in range(1, n_total_tarefas + 1):
-        escrever_arquivo(f, f"{tarefa} {n_operacoes_por_tarefa}")
-    escrever_arquivo(f, ";\n")
-
-
-
+import numpy as np
+from parametros_avancados import MatrizTriangular, TemposConstantes
+
+# Função auxiliar para escrever no arquivo e também imprimir no console
+def escrever_arquivo(f, conteudo: str) -> None:
+    f.write(conteudo + '\n')
+
+def print_datas_saida(datas_saida: dict[str, float], f) -> None:
+    """
+    Imprime os dados de saída dos caminhões no formato necessário para um modelo AMPL.
+
+    Parâmetros:
+    -----------
+    datas_saida : dict[str, float]
+        Dicionário onde as chaves são os caminhões (e.g., 'Caminhão 1') e os valores são as datas de saída.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, "# Parametro data de saida dos caminhoes")
+    escrever_arquivo(f, "param d :=")
+    for caminhao, data_saida in datas_saida.items():
+        numero_caminhao = int(caminhao.split()[1])
+        escrever_arquivo(f, f"{numero_caminhao} {round(data_saida)}")
+    escrever_arquivo(f, ";\n")
+
+def print_tempo_processamento(elegibilidade: dict[int, dict], 
+                              tempos_processamento: dict[str, dict], 
+                              n_maquinas: int, 
+                              f,
+                              esparso: bool = False,
+                              tabela: bool = False) -> None:
+    """
+    Imprime o tempo de processamento de cada operação para cada máquina no formato AMPL.
+
+    Parâmetros:
+    -----------
+    elegibilidade : dict[int, dict]
+        Dicionário que mapeia as operações às suas máquinas elegíveis e caminhões.
+    tempos_processamento : dict[str, dict]
+        Dicionário que mapeia o tempo de processamento para cada operação e máquina.
+    n_maquinas : int
+        Número total de máquinas.
+    esparso : bool, opcional
+        Se True, omite as máquinas não elegíveis em vez de escrevê-las com '.' (padrão = False).
+    tabela : bool, opcional
+        Se True, escreve uma tabela operação x máquina (`param p: 1 2 ... :=`), com '.' nas máquinas não elegíveis.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, "# Parametro do tempo de processamento de cada operacao")
+    if tabela:
+        escrever_arquivo(f, f"param p: {' '.join(map(str, range(1, n_maquinas + 1)))} :=")
+        for operacao in sorted(elegibilidade.keys()):
+            valores = [round(tempos_processamento[f'Empilhadeira {maquina}'][operacao]['tempo'])
+                       if maquina in elegibilidade[operacao]['maquinas'] else '.' for maquina in range(1, n_maquinas + 1)]
+            escrever_arquivo(f, f"{operacao} {' '.join(map(str, valores))}")
+        escrever_arquivo(f, ";\n")
+        return
+
+    escrever_arquivo(f, "param p :=")
+    for operacao in sorted(elegibilidade.keys()):
+        for maquina in range(1, n_maquinas + 1):
+            if maquina in elegibilidade[operacao]['maquinas']:
+                tempo = tempos_processamento[f'Empilhadeira {maquina}'][operacao]['tempo']
+                escrever_arquivo(f, f"{operacao} {maquina} {round(tempo)}")
+            elif not esparso:
+                escrever_arquivo(f, f"{operacao} {maquina} .")
+    escrever_arquivo(f, ";\n")
+
+def print_elegibilidade(elegibilidade: dict[int, dict], 
+                        n_caminhoes: int, 
+                        n_maquinas: int, 
+                        f,
+                        esparso: bool = False,
+                        tabela: bool = False) -> None:
+    """
+    Imprime a elegibilidade de cada operação para cada máquina no formato AMPL.
+
+    Parâmetros:
+    -----------
+    elegibilidade : dict[int, dict]
+        Dicionário que mapeia as operações às suas máquinas elegíveis e caminhões.
+    n_caminhoes : int
+        Número total de caminhões.
+    n_maquinas : int
+        Número total de máquinas.
+    esparso : bool, opcional
+        Se True, escreve apenas as combinações elegíveis, declarando 0 como valor padrão das demais (padrão = False).
+    tabela : bool, opcional
+        Se True, escreve uma tabela operação x máquina por caminhão (`[*,c,*]: 1 2 ... :=`).
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, "# Parametro de elegibilidade das operacoes para cada maquina")
+    if tabela:
+        escrever_arquivo(f, "param Ri :=")
+        cabecalho = ' '.join(map(str, range(1, n_maquinas + 1)))
+        for caminhao in range(1, n_caminhoes + 1):
+            escrever_arquivo(f, f"[*,{caminhao},*]: {cabecalho} :=")
+            for operacao in sorted(elegibilidade.keys()):
+                dados = elegibilidade[operacao]
+                valores = [1 if dados['caminhao'] == caminhao and maquina in dados['maquinas'] else 0
+                           for maquina in range(1, n_maquinas + 1)]
+                escrever_arquivo(f, f"{operacao} {' '.join(map(str, valores))}")
+        escrever_arquivo(f, ";\n")
+        return
+
+    if esparso:
+        escrever_arquivo(f, "param Ri default 0 :=")
+        for operacao in sorted(elegibilidade.keys()):
+            caminhao = elegibilidade[operacao]['caminhao']
+            for maquina in sorted(elegibilidade[operacao]['maquinas']):
+                escrever_arquivo(f, f"{operacao} {caminhao} {maquina} 1")
+        escrever_arquivo(f, ";\n")
+        return
+
+    escrever_arquivo(f, "param Ri :=")
+    for idx, operacao in enumerate(sorted(elegibilidade.keys())):
+        for caminhao in range(1, n_caminhoes + 1):
+            for maquina in range(1, n_maquinas + 1):
+                if elegibilidade[operacao]['caminhao'] == caminhao and maquina in elegibilidade[operacao]['maquinas']:
+                    escrever_arquivo(f, f"{operacao} {caminhao} {maquina} 1")
+                else:
+                    escrever_arquivo(f, f"{operacao} {caminhao} {maquina} 0")
+        if idx == len(elegibilidade) - 1:
+            escrever_arquivo(f, ";\n")
+        else:
+            escrever_arquivo(f, "")
+
+def print_predecessores(resultados: dict[str, dict[int, int]], f) -> None:
+    """
+    Imprime os predecessores de cada operação no formato AMPL.
+
+    Parâmetros:
+    -----------
+    resultados : dict[str, dict[int, int]]
+        Dicionário contendo os predecessores de cada operação.
+
+    Retorno:
+    --------
+    None
+    """
+
+    predecessores = resultados["predecessores"]
+    escrever_arquivo(f, "# Parametro dos predecessores de cada operacao")
+    escrever_arquivo(f, "param pr :=")
+    for operacao, predecessor in predecessores.items():
+        escrever_arquivo(f, f"{operacao} {predecessor}")
+    escrever_arquivo(f, ";\n")
+
+def print_maquinas(n_maquinas: int, f) -> None:
+    """
+    Imprime a quantidade de máquinas no formato AMPL.
+
+    Parâmetros:
+    -----------
+    n_maquinas : int
+        Número total de máquinas.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, "# Quantidade de máquinas")
+    escrever_arquivo(f, f"param n_machines := {n_maquinas};\n")
+
+def print_caminhoes(n_caminhoes: int, f) -> None:
+    """
+    Imprime a quantidade de caminhões no formato AMPL.
+
+    Parâmetros:
+    -----------
+    n_maquinas : int
+        Número total de caminhões.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, "# Quantidade de caminhões")
+    escrever_arquivo(f, f"param n_caminhoes := {n_caminhoes};\n")
+
+def print_tarefas(resultados: dict[str, int], f) -> None:
+    """
+    Imprime a quantidade de jobs (tarefas) no formato AMPL.
+
+    Parâmetros:
+    -----------
+    resultados : dict[str, int]
+        Dicionário contendo o número total de tarefas.
+
+    Retorno:
+    --------
+    None
+    """
+
+    n_jobs = resultados["n_total_tarefas"]
+    escrever_arquivo(f, "# Quantidade de jobs")
+    escrever_arquivo(f, f"param n_jobs := {n_jobs};\n")
+
+def _valores_linha(tempos, maquina: int, i: int, n_operacoes: int) -> list:
+    """
+    Retorna os tempos entre a operação i e todas as operações 1..n_operacoes em uma máquina, com '.' na diagonal.
+
+    Aceita o dicionário {'Empilhadeira k': {'i,j': tempo}} (procurando os pares nos dois sentidos), a MatrizTriangular
+    gerada por calcular_setup e calcular_bloqueio, ou um tensor numpy (n_maquinas, n_operacoes, n_operacoes) indexado a partir de zero.
+
+    Parâmetros:
+    -----------
+    tempos : dict[str, dict[str, int]], MatrizTriangular, TemposConstantes ou np.ndarray
+        Tempos de setup ou de bloqueio entre pares de operações por máquina.
+    maquina : int
+        Número da máquina (a partir de 1).
+    i : int
+        Número da operação de origem (a partir de 1).
+    n_operacoes : int
+        Número total de operações.
+
+    Retorno:
+    --------
+    list
+        Lista com n_operacoes valores inteiros, com '.' na posição da própria operação i.
+    """
+
+    if isinstance(tempos, np.ndarray):
+        valores = np.rint(tempos[maquina - 1, i - 1, :n_operacoes]).astype(int).tolist()
+        valores[i - 1] = '.'
+        return valores
+
+    if isinstance(tempos, (MatrizTriangular, TemposConstantes)):
+        valores = tempos.linha(maquina, i)[:n_operacoes].tolist()
+        valores[i - 1] = '.'
+        return valores
+
+    machine_key = f'Empilhadeira {maquina}'
+    if machine_key not in tempos:
+        return ['.' if i == j else 0 for j in range(1, n_operacoes + 1)]
+
+    valores = []
+    for j in range(1, n_operacoes + 1):
+        if i == j:
+            valores.append('.')
+            continue
+
+        pair_key_1 = f"{i},{j}"
+        pair_key_2 = f"{j},{i}"
+        tempo = tempos[machine_key].get(pair_key_1, tempos[machine_key].get(pair_key_2, 0))
+
+        # Garantir que o tempo é numérico
+        if isinstance(tempo, str):
+            try:
+                tempo = float(tempo)  # Tenta converter para float
+            except ValueError:
+                tempo = 0  # Valor padrão se não puder converter
+
+        valores.append(int(round(tempo)))  # Garantir que é inteiro
+    return valores
+
+def _print_tempos_pares(tempos, n_operacoes: int, n_maquinas: int, f, esparso: bool = False, elegiveis: np.ndarray = None) -> None:
+    # Escreve as fatias [*,*,k] de um parâmetro indexado por (operação, operação, máquina)
+    if esparso or elegiveis is not None:
+        # Apenas os pares entre operações elegíveis na máquina e, no modo esparso, com tempo diferente de zero;
+        # os demais assumem o valor padrão do parâmetro
+        for machine in range(1, n_maquinas + 1):
+            if elegiveis is not None:
+                operacoes = (np.flatnonzero(elegiveis[machine - 1, :n_operacoes]) + 1).tolist()
+            else:
+                operacoes = range(1, n_operacoes + 1)
+            linhas = []
+            for i in operacoes:
+                valores = _valores_linha(tempos, machine, i, n_operacoes)
+                line = []
+                for j in operacoes:
+                    valor = valores[j - 1]
+                    if valor != '.' and not (esparso and valor == 0):
+                        line.extend([i, j, valor])
+                if line:
+                    linhas.append(' '.join(map(str, line)))
+            if linhas:
+                escrever_arquivo(f, f"\n[*,*,{machine}]")
+                escrever_arquivo(f, '\n'.join(linhas))
+        return
+
+    for machine in range(1, n_maquinas + 1):
+        if isinstance(tempos, dict) and f'Empilhadeira {machine}' not in tempos:
+            escrever_arquivo(f, f"[*,*,{machine}]")
+        else:
+            escrever_arquivo(f, f"\n[*,*,{machine}]")
+        for i in range(1, n_operacoes + 1):
+            line = []
+            for j, valor in enumerate(_valores_linha(tempos, machine, i, n_operacoes), start=1):
+                line.extend([i, j, valor])
+            escrever_arquivo(f, ' '.join(map(str, line)))
+
+def _print_tabela_pares(tempos, n_operacoes: int, n_maquinas: int, f, elegiveis: np.ndarray = None) -> None:
+    # Escreve cada fatia [*,*,k] como uma tabela operação x operação (`[*,*,k]: 1 2 ... :=`), com '.' na diagonal.
+    # Com elegiveis, a tabela de cada máquina só tem as linhas e colunas das operações elegíveis nela
+    for machine in range(1, n_maquinas + 1):
+        if elegiveis is not None:
+            operacoes = np.flatnonzero(elegiveis[machine - 1, :n_operacoes]) + 1
+            if not len(operacoes):
+                continue
+        else:
+            operacoes = np.arange(1, n_operacoes + 1)
+        colunas = (operacoes - 1).tolist()
+        escrever_arquivo(f, f"\n[*,*,{machine}]: {' '.join(map(str, operacoes.tolist()))} :=")
+        for i in operacoes.tolist():
+            valores = _valores_linha(tempos, machine, i, n_operacoes)
+            escrever_arquivo(f, f"{i} {' '.join(str(valores[j]) for j in colunas)}")
+
+def _print_tempos_constantes(tempos: TemposConstantes, n_operacoes: int, n_maquinas: int, f) -> None:
+    # Escreve apenas o que difere da constante (declarada como valor padrão do parâmetro): os blocos de operações da
+    # mesma área, como tabelas de zeros, os pares de exceção e a diagonal, que vale zero como no tensor da instância
+    blocos = [bloco[bloco <= n_operacoes].tolist() for bloco in tempos.blocos_mesma_area()]
+    blocos = [bloco for bloco in blocos if len(bloco) > 1]
+    excecoes = [f"{i} {j} {tempo} {j} {i} {tempo}" for (i, j), tempo in tempos.excecoes.items()
+                if j <= n_operacoes and tempo != tempos.constante]
+    # A diagonal das operações dos blocos já está nas tabelas
+    nos_blocos = {i for bloco in blocos for i in bloco}
+    diagonal = [f"{i} {i} 0" for i in range(1, n_operacoes + 1) if i not in nos_blocos]
+    for machine in range(1, n_maquinas + 1):
+        for bloco in blocos:
+            escrever_arquivo(f, f"\n[*,*,{machine}]: {' '.join(map(str, bloco))} :=")
+            for i in bloco:
+                escrever_arquivo(f, f"{i} {' '.join(['0'] * len(bloco))}")
+        if excecoes or diagonal:
+            escrever_arquivo(f, f"\n[*,*,{machine}]")
+            escrever_arquivo(f, '\n'.join(excecoes + diagonal))
+
+def _print_pares(nome: str, tempos, n_operacoes: int, n_maquinas: int, f, esparso: bool, elegiveis: np.ndarray, tabela: bool) -> None:
+    # Declaração de um parâmetro indexado por (operação, operação, máquina) no formato escolhido
+    if isinstance(tempos, TemposConstantes) and elegiveis is None:
+        # Forma fechada do modo determinístico: a constante é o valor padrão e só o que difere dela é escrito.
+        # Com a poda, os pares não elegíveis devem valer 0, e a escrita volta ao padrão 0 com os pares elegíveis
+        escrever_arquivo(f, f"param {nome} default {tempos.constante} :=")
+        _print_tempos_constantes(tempos, n_operacoes, n_maquinas, f)
+    else:
+        escrever_arquivo(f, f"param {nome} default 0 :=" if esparso or elegiveis is not None else f"param {nome} :=")
+        if tabela:
+            _print_tabela_pares(tempos, n_operacoes, n_maquinas, f, elegiveis)
+        else:
+            _print_tempos_pares(tempos, n_operacoes, n_maquinas, f, esparso, elegiveis)
+    escrever_arquivo(f, ";\n")
+
+def print_tempo_setup(tempos_setup: dict[str, dict[str, int]], 
+                      n_operacoes: int, 
+                      n_maquinas: int, 
+                      f,
+                      esparso: bool = False,
+                      elegiveis: np.ndarray = None,
+                      tabela: bool = False) -> None:
+    """
+    Imprime o tempo de setup entre operações para cada máquina no formato AMPL.
+
+    Parâmetros:
+    -----------
+    tempos_setup : MatrizTriangular, TemposConstantes, dict[str, dict[str, int]] ou np.ndarray
+        Tempos de setup entre pares de operações por máquina (veja calcular_setup), dicionário equivalente ou tensor
+        (n_maquinas, n_operacoes, n_operacoes) gerado no modo de setup geométrico. Sem a poda por
+        elegibilidade, os TemposConstantes (modo determinístico) são escritos com a constante como valor padrão e
+        apenas os pares que diferem dela (inclusive a diagonal, zero), qualquer que seja o formato.
+    n_operacoes : int
+        Número total de operações.
+    n_maquinas : int
+        Número total de máquinas.
+    esparso : bool, opcional
+        Se True, escreve apenas os pares com tempo diferente de zero, declarando 0 como valor padrão (padrão = False).
+    elegiveis : np.ndarray, opcional
+        Matriz booleana (n_maquinas, n_operacoes) de elegibilidade (veja matriz_elegibilidade). Se informada, escreve apenas
+        os pares em que as duas operações são elegíveis na máquina, declarando 0 como valor padrão dos demais.
+    tabela : bool, opcional
+        Se True, escreve cada máquina como uma tabela operação x operação (`[*,*,k]: 1 2 ... :=`) em vez de tripletos.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, '# Parametro tempo de setup entre operacoes')
+    _print_pares('s', tempos_setup, n_operacoes, n_maquinas, f, esparso, elegiveis, tabela)
+
+def print_tempo_bloqueio(tempos_bloqueios: dict[str, dict[str, int]], 
+                         n_operacoes: int, 
+                         n_maquinas: int, 
+                         f,
+                         esparso: bool = False,
+                         elegiveis: np.ndarray = None,
+                         tabela: bool = False) -> None:
+
+    """
+    Imprime o tempo de bloqueio entre operações para cada máquina no formato AMPL.
+
+    Parâmetros:
+    -----------
+    tempos_bloqueios : MatrizTriangular, TemposConstantes, dict[str, dict[str, int]] ou np.ndarray
+        Tempos de bloqueio entre pares de operações por máquina (veja calcular_bloqueio), dicionário equivalente ou tensor
+        (n_maquinas, n_operacoes, n_operacoes). Sem a poda por elegibilidade, os TemposConstantes (modo determinístico)
+        são escritos com a constante como valor padrão e apenas os pares que diferem dela (inclusive a diagonal, zero),
+        qualquer que seja o formato.
+    n_operacoes : int
+        Número total de operações.
+    n_maquinas : int
+        Número total de máquinas.
+    esparso : bool, opcional
+        Se True, escreve apenas os pares com tempo diferente de zero, declarando 0 como valor padrão (padrão = False).
+    elegiveis : np.ndarray, opcional
+        Matriz booleana (n_maquinas, n_operacoes) de elegibilidade (veja matriz_elegibilidade). Se informada, escreve apenas
+        os pares em que as duas operações são elegíveis na máquina, declarando 0 como valor padrão dos demais.
+    tabela : bool, opcional
+        Se True, escreve cada máquina como uma tabela operação x operação (`[*,*,k]: 1 2 ... :=`) em vez de tripletos.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, '# Parametro tempo de bloqueio entre operacoes')
+    _print_pares('bk', tempos_bloqueios, n_operacoes, n_maquinas, f, esparso, elegiveis, tabela)
+
+def print_n_operations(n_total_tarefas: int, n_operacoes_por_tarefa: int, f) -> None:
+    """
+    Imprime o número de operações por tarefa no formato AMPL.
+
+    Parâmetros:
+    -----------
+    n_total_tarefas : int
+        Número total de tarefas.
+    n_operacoes_por_tarefa : int
+        Número de operações associadas a cada tarefa.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, "param n_operations :=")
+    for tarefa in range(1, n_total_tarefas + 1):
+        escrever_arquivo(f, f"{tarefa} {n_operacoes_por_tarefa}")
+    escrever_arquivo(f, ";\n")
+
+
+
+
+def print_limites(limites: dict, f) -> None:
+    """
+    Imprime o horizonte de programação e os limites por operação (veja parametros_avancados.calcular_limites)
+    no formato AMPL: param H, ES, LS e M_op (por operação) e A_max (por caminhão).
+
+    Parâmetros:
+    -----------
+    limites : dict
+        Saída de calcular_limites.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, "# Parametro horizonte de programacao")
+    escrever_arquivo(f, f"param H := {round(limites['H'])};\n")
+    for nome, descricao in (('ES', 'inicio mais cedo'), ('LS', 'inicio mais tarde'), ('M_op', 'big-M')):
+        escrever_arquivo(f, f"# Parametro {descricao} de cada operacao")
+        escrever_arquivo(f, f"param {nome} :=")
+        for operacao, valor in enumerate(np.rint(limites[nome]).astype(np.int64).tolist(), start=1):
+            escrever_arquivo(f, f"{operacao} {valor}")
+        escrever_arquivo(f, ";\n")
+    escrever_arquivo(f, "# Parametro atraso maximo de cada caminhao")
+    escrever_arquivo(f, "param A_max :=")
+    for caminhao, valor in enumerate(np.rint(limites['A_max']).astype(np.int64).tolist(), start=1):
+        escrever_arquivo(f, f"{caminhao} {valor}")
+    escrever_arquivo(f, ";\n")
+
+def print_cenarios(n_cenarios: int, f) -> None:
+    """
+    Imprime o número de cenários e o conjunto SCENARIOS (1 a n_cenarios) no formato AMPL.
+    """
+
+    escrever_arquivo(f, "# Parametro numero de cenarios")
+    escrever_arquivo(f, f"param n_scenarios := {n_cenarios};\n")
+    escrever_arquivo(f, f"set SCENARIOS := {' '.join(map(str, range(1, n_cenarios + 1)))};\n")
+
+def print_datas_saida_cenarios(d: np.ndarray, f) -> None:
+    """
+    Imprime as datas de saída de cada caminhão em cada cenário (linhas 'cenario caminhao data') no formato AMPL.
+
+    Parâmetros:
+    -----------
+    d : np.ndarray
+        Matriz (n_cenarios, n_caminhoes) com as datas de saída.
+
+    Retorno:
+    --------
+    None
+    """
+
+    escrever_arquivo(f, "# Parametro data de saida dos caminhoes em cada cenario")
+    escrever_arquivo(f, "param d :=")
+    for cenario, datas in enumerate(d.tolist(), start=1):
+        f.write(''.join(f"{cenario} {caminhao} {data}\n" for caminhao, data in enumerate(datas, start=1)))
+    escrever_arquivo(f, ";\n")
+
+def print_tempo_processamento_cenarios(elegibilidade: dict[int, dict], p: np.ndarray, n_maquinas: int, f, esparso: bool = False) -> None:
+    """
+    Imprime o tempo de processamento de cada operação em cada máquina e cenário (linhas 'cenario operacao maquina tempo')
+    no formato AMPL. As máquinas não elegíveis ficam com '.' (ou são omitidas, se esparso).
+
+    Parâmetros:
+    -----------
+    elegibilidade : dict[int, dict]
+        Dicionário que mapeia as operações às suas máquinas elegíveis e caminhões.
+    p : np.ndarray
+        Tensor (n_cenarios, n_operacoes, n_maquinas) com os tempos de processamento.
+    n_maquinas : int
+        Número total de máquinas.
+    esparso : bool, opcional
+        Se True, omite as máquinas não elegíveis em vez de escrevê-las com '.' (padrão = False).
+
+    Retorno:
+    --------
+    None
+    """
+
+    pares = [(operacao, maquina, maquina in elegibilidade[operacao]['maquinas'])
+             for operacao in sorted(elegibilidade.keys()) for maquina in range(1, n_maquinas + 1)]
+    if esparso:
+        pares = [par for par in pares if par[2]]
+
+    escrever_arquivo(f, "# Parametro do tempo de processamento de cada operacao em cada cenario")
+    escrever_arquivo(f, "param p :=")
+    for cenario, tempos in enumerate(p.tolist(), start=1):
+        f.write(''.join(f"{cenario} {operacao} {maquina} {tempos[operacao - 1][maquina - 1] if elegivel else '.'}\n"
+                        for operacao, maquina, elegivel in pares))
+    escrever_arquivo(f, ";\n")
@@ -1 +1,2 @@
-from .pipeline_results import pipeline_graficos_resultados
\ No newline at end of file
+from .pipeline_results import pipeline_graficos_resultados, pipeline_graficos_resultados_lote
+from .validacao import validar_solucao, validar_diretorio, atribuicoes_da_solucao, RESTRICOES
\ No newline at end of file
@@ -1,56 +1,108 @@
-from .leitura_result import parse_log_file
-from .gantt import grafico_gantt_por_tarefas, grafico_gantt_empilhadeiras, grafico_gantt_caminhoes
-from .heatmap import plot_heatmap_caminhos_horizontal
-from .metricas import calculate_metrics
-
-def pipeline_graficos_resultados(file_path, area_indices, coordenadas_detalhadas):
-    try:
-        # Parse do arquivo de log
-        parametros = parse_log_file(file_path)
-    except Exception as e:
-        print(f"Erro ao analisar o arquivo de log: {e}")
-        return
-
-    try:
-        # Cálculo das métricas
-        result_metricas = calculate_metrics(parametros['n_caminhoes'], parametros['n_maquinas'], parametros['alpha'], parametros['p'], parametros['t'], parametros['d'])
-        
-        # Exibindo os resultados
-        print("Makespan:", result_metricas['makespan'])
-        print("Atraso máximo:", result_metricas['max_delay'])
-        print("Número de operações atrasadas:", result_metricas['num_delays'])
-        print("Soma dos atrasos:", result_metricas['sum_delays'])
-    
-    except Exception as e:
-        print(f"Erro ao calcular as métricas: {e}")
-
-    try:
-        # Gráfico de Gantt das empilhadeiras
-        grafico_gantt_empilhadeiras(parametros['alpha'], parametros['t'], parametros['p'], parametros['n_caminhoes'], parametros['n_maquinas'])
-    except Exception as e:
-        print(f"Erro ao gerar gráfico de Gantt das empilhadeiras: {e}")
-
-    try:
-        # Gráfico de Gantt dos caminhões
-        grafico_gantt_caminhoes(parametros['alpha'], parametros['t'], parametros['p'], parametros['d'], parametros['A'], parametros['n_caminhoes'], parametros['n_maquinas'])
-    except Exception as e:
-        print(f"Erro ao gerar gráfico de Gantt dos caminhões: {e}")
-
-    try:
-        # Gráfico de Gantt por tarefas
-        grafico_gantt_por_tarefas(parametros['alpha'], parametros['t'], parametros['p'], parametros['n_caminhoes'], parametros['n_maquinas'])
-    except Exception as e:
-        print(f"Erro ao gerar gráfico de Gantt por tarefas: {e}")
-
-    try:
-        # Mapa de calor dos caminhos percorridos pelas empilhadeiras
-        plot_heatmap_caminhos_horizontal(area_indices, coordenadas_detalhadas, parametros['alpha'])
-    except Exception as e:
-        print(f"Erro ao gerar o mapa de calor: {e}")
-
-    
-    
-    
-
-
-
+from .leitura_result import parse_log_file
+from .gantt import grafico_gantt_por_tarefas, grafico_gantt_empilhadeiras, grafico_gantt_caminhoes
+from .heatmap import plot_heatmap_caminhos_horizontal
+from .metricas import calculate_metrics
+from .renderizacao import argumentos_graficos, submeter_graficos, coletar_graficos, criar_executor_graficos
+import os
+
+def _imprimir_metricas(parametros):
+    try:
+        # Cálculo das métricas
+        result_metricas = calculate_metrics(parametros['n_caminhoes'], parametros['n_maquinas'], parametros['alpha'], parametros['p'], parametros['t'], parametros['d'])
+        
+        # Exibindo os resultados
+        print("Makespan:", result_metricas['makespan'])
+        print("Atraso máximo:", result_metricas['max_delay'])
+        print("Número de operações atrasadas:", result_metricas['num_delays'])
+        print("Soma dos atrasos:", result_metricas['sum_delays'])
+    
+    except Exception as e:
+        print(f"Erro ao calcular as métricas: {e}")
+
+def _prefixo_arquivo(file_path):
+    # Prefixo dos gráficos salvos: nome do log sem extensão
+    return os.path.splitext(os.path.basename(file_path))[0] + '_'
+
+def pipeline_graficos_resultados(file_path, area_indices, coordenadas, pasta_saida=None, n_workers=None):
+    """
+    Lê o log do solver, imprime as métricas e gera os gráficos de Gantt e o mapa de calor.
+
+    Parâmetros:
+    - file_path: Caminho do arquivo de log.
+    - area_indices: Dicionário com as coordenadas das áreas.
+    - coordenadas: Coordenadas das operações em vetores (veja layout.alocacao.alocar_pontos_operacoes).
+    - pasta_saida: Se informado, os gráficos são renderizados em paralelo (backend Agg) e salvos nesta pasta em vez de exibidos.
+    - n_workers: Número de processos usados na renderização em paralelo (padrão = número de núcleos).
+
+    Retorno:
+    - None no modo interativo; no modo com pasta_saida, dicionário {nome_do_grafico: caminho_do_arquivo}.
+    """
+    try:
+        # Parse do arquivo de log
+        parametros = parse_log_file(file_path)
+    except Exception as e:
+        print(f"Erro ao analisar o arquivo de log: {e}")
+        return
+
+    _imprimir_metricas(parametros)
+
+    if pasta_saida is not None:
+        # Renderiza todas as figuras ao mesmo tempo em processos separados
+        with criar_executor_graficos(n_workers) as executor:
+            tarefas = submeter_graficos(executor, argumentos_graficos(parametros, area_indices, coordenadas), pasta_saida, _prefixo_arquivo(file_path))
+            return coletar_graficos(tarefas)
+
+    try:
+        # Gráfico de Gantt das empilhadeiras
+        grafico_gantt_empilhadeiras(parametros['alpha'], parametros['t'], parametros['p'], parametros['n_caminhoes'], parametros['n_maquinas'])
+    except Exception as e:
+        print(f"Erro ao gerar gráfico de Gantt das empilhadeiras: {e}")
+
+    try:
+        # Gráfico de Gantt dos caminhões
+        grafico_gantt_caminhoes(parametros['alpha'], parametros['t'], parametros['p'], parametros['d'], parametros['A'], parametros['n_caminhoes'], parametros['n_maquinas'])
+    except Exception as e:
+        print(f"Erro ao gerar gráfico de Gantt dos caminhões: {e}")
+
+    try:
+        # Gráfico de Gantt por tarefas
+        grafico_gantt_por_tarefas(parametros['alpha'], parametros['t'], parametros['p'], parametros['n_caminhoes'], parametros['n_maquinas'])
+    except Exception as e:
+        print(f"Erro ao gerar gráfico de Gantt por tarefas: {e}")
+
+    try:
+        # Mapa de calor dos caminhos percorridos pelas empilhadeiras
+        plot_heatmap_caminhos_horizontal(area_indices, coordenadas, parametros['alpha'])
+    except Exception as e:
+        print(f"Erro ao gerar o mapa de calor: {e}")
+
+def pipeline_graficos_resultados_lote(logs, pasta_saida, n_workers=None):
+    """
+    Gera os gráficos de vários logs de uma vez, compartilhando um único pool de processos.
+
+    Parâmetros:
+    - logs: Lista de tuplas (file_path, area_indices, coordenadas).
+    - pasta_saida: Pasta onde os gráficos serão salvos, prefixados pelo nome de cada log.
+    - n_workers: Número de processos usados na renderização (padrão = número de núcleos).
+
+    Retorno:
+    - Dicionário {file_path: {nome_do_grafico: caminho_do_arquivo}}.
+    """
+    resultados = {}
+    with criar_executor_graficos(n_workers) as executor:
+        # Submete todos os gráficos de todos os logs antes de aguardar qualquer um
+        tarefas_por_log = {}
+        for file_path, area_indices, coordenadas in logs:
+            try:
+                parametros = parse_log_file(file_path)
+            except Exception as e:
+                print(f"Erro ao analisar o arquivo de log: {e}")
+                continue
+
+            _imprimir_metricas(parametros)
+            tarefas_por_log[file_path] = submeter_graficos(executor, argumentos_graficos(parametros, area_indices, coordenadas), pasta_saida, _prefixo_arquivo(file_path))
+
+        for file_path, tarefas in tarefas_por_log.items():
+            resultados[file_path] = coletar_graficos(tarefas)
+
+    return resultados
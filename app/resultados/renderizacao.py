@@ -0,0 +1,187 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from instancia import publicar_objeto, anexar_objeto, liberar_objeto
+from .gantt import grafico_gantt_por_tarefas, grafico_gantt_empilhadeiras, grafico_gantt_caminhoes
+from .heatmap import plot_heatmap_caminhos_horizontal
+
+# Gráficos disponíveis para renderização em paralelo: nome do arquivo -> (função, descrição usada nas mensagens de erro)
+GRAFICOS = {
+    'gantt_empilhadeiras': (grafico_gantt_empilhadeiras, 'gráfico de Gantt das empilhadeiras'),
+    'gantt_caminhoes': (grafico_gantt_caminhoes, 'gráfico de Gantt dos caminhões'),
+    'gantt_tarefas': (grafico_gantt_por_tarefas, 'gráfico de Gantt por tarefas'),
+    'mapa_calor': (plot_heatmap_caminhos_horizontal, 'o mapa de calor'),
+}
+
+def _inicializar_worker() -> None:
+    """
+    Configura o backend não interativo (Agg) do matplotlib em cada processo de renderização.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.switch_backend('Agg')
+
+def _renderizar_grafico(nome: str, descritor: dict, caminho_arquivo: str) -> str:
+    """
+    Renderiza um único gráfico dentro de um processo de trabalho e salva a figura em disco.
+
+    Parâmetros:
+    -----------
+    nome : str
+        Chave do gráfico no dicionário GRAFICOS.
+    descritor : dict
+        Descritor dos argumentos de todos os gráficos de um log, publicados em memória compartilhada
+        (veja instancia.publicar_objeto); o gráfico usa os argumentos posicionais da sua chave.
+    caminho_arquivo : str
+        Caminho onde a figura será salva.
+
+    Retorno:
+    --------
+    str
+        O caminho do arquivo gerado.
+    """
+
+    funcao, _ = GRAFICOS[nome]
+    try:
+        funcao(*anexar_objeto(descritor)[nome], caminho_arquivo=caminho_arquivo)
+    finally:
+        # O processo continua vivo para os próximos gráficos: fecha o segmento, que é removido pelo processo principal
+        liberar_objeto(descritor, remover=False)
+    return caminho_arquivo
+
+def argumentos_graficos(parametros: dict,
+                        area_indices: dict,
+                        coordenadas: dict) -> dict[str, tuple]:
+    """
+    Monta os argumentos de cada gráfico a partir dos parâmetros lidos do log do solver.
+
+    Parâmetros:
+    -----------
+    parametros : dict
+        Dicionário retornado por parse_log_file.
+    area_indices : dict
+        Coordenadas das áreas do layout.
+    coordenadas : dict
+        Coordenadas de origem e destino das operações em vetores (veja layout.alocacao.alocar_pontos_operacoes).
+
+    Retorno:
+    --------
+    dict[str, tuple]
+        Dicionário {nome_do_grafico: argumentos}. Gráficos cujos argumentos não puderam ser montados
+        recebem a exceção ocorrida no lugar da tupla, para que o erro seja reportado como nos demais.
+    """
+
+    montadores = {
+        'gantt_empilhadeiras': lambda: (parametros['alpha'], parametros['t'], parametros['p'], parametros['n_caminhoes'], parametros['n_maquinas']),
+        'gantt_caminhoes': lambda: (parametros['alpha'], parametros['t'], parametros['p'], parametros['d'], parametros['A'], parametros['n_caminhoes'], parametros['n_maquinas']),
+        'gantt_tarefas': lambda: (parametros['alpha'], parametros['t'], parametros['p'], parametros['n_caminhoes'], parametros['n_maquinas']),
+        'mapa_calor': lambda: (area_indices, coordenadas, parametros['alpha']),
+    }
+
+    argumentos = {}
+    for nome, montador in montadores.items():
+        try:
+            argumentos[nome] = montador()
+        except Exception as e:
+            argumentos[nome] = e
+    return argumentos
+
+def submeter_graficos(executor: ProcessPoolExecutor,
+                      argumentos: dict[str, tuple],
+                      pasta_saida: str,
+                      prefixo: str = '') -> list[tuple]:
+    """
+    Submete a renderização de todos os gráficos ao executor, sem aguardar o término.
+
+    Os argumentos são publicados uma única vez em memória compartilhada e cada processo lê só os do seu gráfico;
+    o segmento é removido quando a última renderização termina.
+
+    Parâmetros:
+    -----------
+    executor : ProcessPoolExecutor
+        Pool de processos (inicializado com _inicializar_worker) onde as figuras serão desenhadas.
+    argumentos : dict[str, tuple]
+        Saída de argumentos_graficos.
+    pasta_saida : str
+        Diretório onde as figuras serão gravadas.
+    prefixo : str, opcional
+        Prefixo dos nomes de arquivo, usado para distinguir os gráficos de logs diferentes de um mesmo lote.
+
+    Retorno:
+    --------
+    list[tuple]
+        Lista de tuplas (nome_do_grafico, future ou exceção).
+    """
+
+    os.makedirs(pasta_saida, exist_ok=True)
+    validos = {nome: args for nome, args in argumentos.items() if not isinstance(args, Exception)}
+    descritor = publicar_objeto(validos)
+    restantes = [len(validos)]
+    trava = threading.Lock()
+
+    def liberar_ao_terminar(_) -> None:
+        # Executado (na thread do executor) quando cada renderização termina; a última remove o segmento
+        with trava:
+            restantes[0] -= 1
+            ultima = restantes[0] == 0
+        if ultima:
+            liberar_objeto(descritor)
+
+    tarefas = []
+    for nome, args in argumentos.items():
+        if isinstance(args, Exception):
+            tarefas.append((nome, args))
+            continue
+        caminho = os.path.join(pasta_saida, f"{prefixo}{nome}.png")
+        tarefas.append((nome, executor.submit(_renderizar_grafico, nome, descritor, caminho)))
+    if not validos:
+        liberar_objeto(descritor)
+    for _, tarefa in tarefas:
+        if not isinstance(tarefa, Exception):
+            tarefa.add_done_callback(liberar_ao_terminar)
+    return tarefas
+
+def coletar_graficos(tarefas: list[tuple]) -> dict[str, str]:
+    """
+    Aguarda as renderizações submetidas e reporta os erros de cada gráfico individualmente.
+
+    Parâmetros:
+    -----------
+    tarefas : list[tuple]
+        Saída de submeter_graficos.
+
+    Retorno:
+    --------
+    dict[str, str]
+        Dicionário {nome_do_grafico: caminho_do_arquivo} apenas com os gráficos gerados com sucesso.
+    """
+
+    caminhos = {}
+    for nome, tarefa in tarefas:
+        _, descricao = GRAFICOS[nome]
+        try:
+            if isinstance(tarefa, Exception):
+                raise tarefa
+            caminhos[nome] = tarefa.result()
+        except Exception as e:
+            print(f"Erro ao gerar {descricao}: {e}")
+    return caminhos
+
+def criar_executor_graficos(n_workers: int = None) -> ProcessPoolExecutor:
+    """
+    Cria um pool de processos configurado com o backend Agg para renderizar gráficos.
+
+    Parâmetros:
+    -----------
+    n_workers : int, opcional
+        Número de processos. Se None, usa o número de núcleos disponíveis.
+
+    Retorno:
+    --------
+    ProcessPoolExecutor
+        Executor pronto para ser usado em submeter_graficos.
+    """
+
+    return ProcessPoolExecutor(max_workers=n_workers, initializer=_inicializar_worker)
@@ -0,0 +1,253 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .leitura_result import parse_log_file
+from instancia import carregar_arrays_instancia, ler_instancia_ampl
+
+# Classes de restrições verificadas por validar_solucao, na ordem do relatório
+RESTRICOES = ('atribuicao', 'elegibilidade', 'precedencia', 'intervalo', 'caminhao')
+
+def atribuicoes_da_solucao(solucao: dict, n_maquinas: int, n_caminhoes: int, por_empilhadeira: bool = None) -> np.ndarray:
+    """
+    Extrai as atribuições (operação, caminhão, máquina) iguais a 1 do alpha de uma solução.
+
+    Parâmetros:
+    -----------
+    solucao : dict
+        Dicionário retornado por parse_log_file.
+    n_maquinas, n_caminhoes : int
+        Dimensões da instância.
+    por_empilhadeira : bool, opcional
+        Se True, as chaves de alpha são empilhadeiras (matrizes operação x caminhão); se False, caminhões
+        (matrizes operação x máquina). Se None, segue a mesma regra de calculate_metrics (n_maquinas <= n_caminhoes).
+
+    Retorno:
+    --------
+    np.ndarray
+        Matriz (n_atribuicoes, 3) com operação, caminhão e máquina (a partir de 1), ordenada por operação.
+    """
+
+    if por_empilhadeira is None:
+        por_empilhadeira = n_maquinas <= n_caminhoes
+
+    blocos = []
+    for chave, matriz in solucao['alpha'].items():
+        linhas, colunas = np.nonzero(np.asarray(matriz) > 0.5)
+        fixa = np.full(len(linhas), chave, dtype=np.int64)
+        if por_empilhadeira:
+            blocos.append(np.column_stack((linhas + 1, colunas + 1, fixa)))
+        else:
+            blocos.append(np.column_stack((linhas + 1, fixa, colunas + 1)))
+
+    if not blocos:
+        return np.zeros((0, 3), dtype=np.int64)
+    atribuicoes = np.concatenate(blocos).astype(np.int64)
+    return atribuicoes[np.argsort(atribuicoes[:, 0], kind='stable')]
+
+def validar_solucao(arrays: dict[str, np.ndarray],
+                    solucao: dict,
+                    por_empilhadeira: bool = None,
+                    tolerancia: float = 1e-4) -> dict[str, list[str]]:
+    """
+    Verifica uma solução lida do log do solver contra a sua instância, sem passar pelo AMPL.
+
+    São verificadas, de forma vetorizada:
+    - 'atribuicao': cada operação é atribuída a exatamente um par (caminhão, máquina) e tem instante de início.
+    - 'elegibilidade': a máquina e o caminhão atribuídos são elegíveis para a operação (Ri = 1).
+    - 'precedencia': t[j] >= t[pr(j)] + p[pr(j), k], com k a máquina do predecessor.
+    - 'intervalo': para operações consecutivas i, j de uma mesma empilhadeira (em ordem de início),
+      t[j] >= t[i] + p[i, k] + s[i, j, k] + bk[i, j, k].
+    - 'caminhao': o atraso A de cada caminhão cobre max(0, término da sua última operação - d), as datas de saída
+      do log coincidem com as da instância e MAC cobre o término de todas as operações.
+
+    Parâmetros:
+    -----------
+    arrays : dict[str, np.ndarray]
+        Arrays da instância (veja instancia.montar_arrays_instancia).
+    solucao : dict
+        Dicionário retornado por parse_log_file.
+    por_empilhadeira : bool, opcional
+        Orientação de alpha (veja atribuicoes_da_solucao).
+    tolerancia : float, opcional
+        Folga absoluta aceita nas desigualdades, para absorver o arredondamento do solver (padrão = 1e-4).
+
+    Retorno:
+    --------
+    dict[str, list[str]]
+        Mensagens das violações encontradas em cada classe de restrição (listas vazias quando a solução é viável).
+    """
+
+    p = arrays['p']
+    s = arrays['s']
+    bk = arrays['bk']
+    pr = arrays['pr']
+    d = arrays['d']
+    Ri = arrays['Ri']
+    n_operacoes, n_maquinas = p.shape
+    n_caminhoes = len(d)
+    violacoes = {restricao: [] for restricao in RESTRICOES}
+
+    atribuicoes = atribuicoes_da_solucao(solucao, n_maquinas, n_caminhoes, por_empilhadeira)
+    dentro = ((atribuicoes[:, 0] >= 1) & (atribuicoes[:, 0] <= n_operacoes)
+              & (atribuicoes[:, 1] >= 1) & (atribuicoes[:, 1] <= n_caminhoes)
+              & (atribuicoes[:, 2] >= 1) & (atribuicoes[:, 2] <= n_maquinas))
+    for operacao, c, k in atribuicoes[~dentro].tolist():
+        violacoes['atribuicao'].append(f"Atribuição fora da instância: operação {operacao}, caminhão {c}, máquina {k}.")
+    atribuicoes = atribuicoes[dentro]
+
+    contagem = np.bincount(atribuicoes[:, 0] - 1, minlength=n_operacoes)
+    for operacao in np.flatnonzero(contagem != 1).tolist():
+        violacoes['atribuicao'].append(f"Operação {operacao + 1} atribuída {contagem[operacao]} vezes (esperado 1).")
+
+    # Primeira atribuição de cada operação (as repetidas já foram reportadas)
+    primeira = np.unique(atribuicoes[:, 0], return_index=True)[1]
+    caminhao = np.zeros(n_operacoes, dtype=np.int64)
+    maquina = np.zeros(n_operacoes, dtype=np.int64)
+    caminhao[atribuicoes[primeira, 0] - 1] = atribuicoes[primeira, 1]
+    maquina[atribuicoes[primeira, 0] - 1] = atribuicoes[primeira, 2]
+
+    inicio = np.full(n_operacoes, np.nan)
+    for operacao, valor in solucao['t'].items():
+        if 1 <= operacao <= n_operacoes:
+            inicio[operacao - 1] = valor
+    for operacao in np.flatnonzero(np.isnan(inicio) & (maquina > 0)).tolist():
+        violacoes['atribuicao'].append(f"Operação {operacao + 1} sem instante de início.")
+
+    atribuida = (maquina > 0) & ~np.isnan(inicio)
+    indices = np.flatnonzero(atribuida)
+    elegivel = np.zeros(n_operacoes, dtype=bool)
+    elegivel[indices] = Ri[indices, caminhao[indices] - 1, maquina[indices] - 1] == 1
+    for operacao in np.flatnonzero(atribuida & ~elegivel).tolist():
+        violacoes['elegibilidade'].append(
+            f"Operação {operacao + 1} atribuída ao caminhão {caminhao[operacao]} e à máquina {maquina[operacao]}, "
+            f"que não são elegíveis.")
+
+    # Processamento na máquina atribuída (as não elegíveis não têm p; usa zero para seguir com as demais verificações)
+    processamento = np.zeros(n_operacoes)
+    processamento[indices] = np.nan_to_num(p[indices, maquina[indices] - 1])
+    termino = inicio + processamento
+
+    # Precedência
+    com_predecessor = np.flatnonzero((pr > 0) & atribuida)
+    anteriores = pr[com_predecessor] - 1
+    validos = atribuida[anteriores]
+    com_predecessor, anteriores = com_predecessor[validos], anteriores[validos]
+    violadas = inicio[com_predecessor] < termino[anteriores] - tolerancia
+    for operacao, anterior in zip(com_predecessor[violadas].tolist(), anteriores[violadas].tolist()):
+        violacoes['precedencia'].append(
+            f"Operação {operacao + 1} começa em {inicio[operacao]:g}, antes do término do predecessor "
+            f"{anterior + 1} ({termino[anterior]:g}).")
+
+    # Setup e bloqueio entre operações consecutivas de cada empilhadeira
+    ordem = indices[np.lexsort((indices, inicio[indices], maquina[indices]))]
+    mesma_maquina = maquina[ordem[1:]] == maquina[ordem[:-1]]
+    i, j = ordem[:-1][mesma_maquina], ordem[1:][mesma_maquina]
+    k = maquina[i] - 1
+    minimo = termino[i] + s[k, i, j] + bk[k, i, j]
+    violadas = inicio[j] < minimo - tolerancia
+    for a, b, limite in zip(i[violadas].tolist(), j[violadas].tolist(), minimo[violadas].tolist()):
+        violacoes['intervalo'].append(
+            f"Na máquina {maquina[a]}, a operação {b + 1} começa em {inicio[b]:g}, antes de {limite:g} "
+            f"(término de {a + 1} mais setup e bloqueio).")
+
+    # Caminhões: atraso, datas de saída e makespan
+    saida = np.full(n_caminhoes, -np.inf)
+    np.maximum.at(saida, caminhao[indices] - 1, termino[indices])
+    atraso_minimo = np.maximum(saida - d, 0)
+    for c in range(1, n_caminhoes + 1):
+        atraso = solucao['A'].get(c, 0.0)
+        if atraso < atraso_minimo[c - 1] - tolerancia:
+            violacoes['caminhao'].append(
+                f"Caminhão {c} sai em {saida[c - 1]:g} com data {d[c - 1]}, mas o atraso informado é {atraso:g}.")
+        if c in solucao['d'] and abs(solucao['d'][c] - d[c - 1]) > tolerancia:
+            violacoes['caminhao'].append(
+                f"Data de saída do caminhão {c} no log ({solucao['d'][c]:g}) difere da instância ({d[c - 1]}).")
+    for operacao in np.flatnonzero(atribuida & (caminhao != arrays['caminhao'])).tolist():
+        violacoes['caminhao'].append(
+            f"Operação {operacao + 1} atribuída ao caminhão {caminhao[operacao]}, mas pertence ao caminhão "
+            f"{arrays['caminhao'][operacao]}.")
+    if solucao.get('MAC') is not None and len(indices) and solucao['MAC'] < termino[indices].max() - tolerancia:
+        violacoes['caminhao'].append(f"MAC = {solucao['MAC']:g} é menor que o último término ({termino[indices].max():g}).")
+
+    return violacoes
+
+def _validar_arquivo(caminho_log: str, caminho_instancia: str, por_empilhadeira: bool, tolerancia: float) -> dict[str, list[str]]:
+    # Lê a instância (binária ou texto) e o log e valida a solução (executado nos processos de trabalho)
+    ler = carregar_arrays_instancia if caminho_instancia.endswith('.npz') else ler_instancia_ampl
+    return validar_solucao(ler(caminho_instancia), parse_log_file(caminho_log), por_empilhadeira, tolerancia)
+
+def instancia_do_log(caminho_log: str, instancias: dict[str, str]) -> str:
+    """
+    Encontra a instância de um log: a de nome (sem o sufixo _AMPL) mais longo que seja prefixo do nome do log,
+    seguido de '_', '.' ou do fim do nome (e.g. 5_4_3_3_log.txt -> 5_4_3_3_AMPL.npz).
+    Retorna None se nenhuma instância corresponder.
+    """
+
+    nome_log = os.path.basename(caminho_log)
+    candidatas = [nome for nome in instancias
+                  if nome_log.startswith(nome) and (len(nome_log) == len(nome) or nome_log[len(nome)] in '_.')]
+    return instancias[max(candidatas, key=len)] if candidatas else None
+
+def validar_diretorio(pasta_logs: str,
+                      pasta_instancias: str,
+                      n_workers: int = None,
+                      por_empilhadeira: bool = None,
+                      tolerancia: float = 1e-4) -> dict[str, dict[str, list[str]]]:
+    """
+    Valida todos os logs de uma pasta contra as instâncias, em paralelo, e imprime um resumo por arquivo.
+    As instâncias binárias (.npz, veja pipeline_gerar_prints_parametros) têm preferência; sem elas, os arquivos
+    AMPL são lidos com ler_instancia_ampl.
+
+    Parâmetros:
+    -----------
+    pasta_logs : str
+        Pasta com os logs do solver.
+    pasta_instancias : str
+        Pasta com as instâncias *_AMPL.npz ou *_AMPL.txt. O log de cada instância é encontrado pelo nome (veja instancia_do_log).
+    n_workers : int, opcional
+        Número de processos (padrão = número de núcleos). Se 0, valida no processo principal.
+    por_empilhadeira, tolerancia :
+        Repassados a validar_solucao.
+
+    Retorno:
+    --------
+    dict[str, dict[str, list[str]]]
+        Violações de cada log. Logs sem instância correspondente ou que não puderam ser lidos aparecem
+        com a classe 'leitura'.
+    """
+
+    instancias = {}
+    for sufixo in ('_AMPL.txt', '_AMPL.npz'):
+        instancias.update({nome[:-len(sufixo)]: os.path.join(pasta_instancias, nome)
+                           for nome in os.listdir(pasta_instancias) if nome.endswith(sufixo)})
+    logs = sorted(os.path.join(pasta_logs, nome) for nome in os.listdir(pasta_logs)
+                  if os.path.isfile(os.path.join(pasta_logs, nome)) and not nome.endswith(('.npz', '_AMPL.txt')))
+
+    resultados = {}
+    tarefas = {}
+    executor = ProcessPoolExecutor(max_workers=n_workers) if n_workers != 0 else None
+    try:
+        for caminho_log in logs:
+            caminho_instancia = instancia_do_log(caminho_log, instancias)
+            if caminho_instancia is None:
+                resultados[caminho_log] = {'leitura': ["Nenhuma instância corresponde ao log."]}
+            elif executor is None:
+                tarefas[caminho_log] = (caminho_log, caminho_instancia, por_empilhadeira, tolerancia)
+            else:
+                tarefas[caminho_log] = executor.submit(_validar_arquivo, caminho_log, caminho_instancia, por_empilhadeira, tolerancia)
+
+        for caminho_log, tarefa in tarefas.items():
+            try:
+                resultados[caminho_log] = _validar_arquivo(*tarefa) if executor is None else tarefa.result()
+            except Exception as e:
+                resultados[caminho_log] = {'leitura': [f"Erro ao validar o log: {e}"]}
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    for caminho_log in logs:
+        total = sum(len(mensagens) for mensagens in resultados[caminho_log].values())
+        print(f"{os.path.basename(caminho_log)}: {'viável' if total == 0 else f'{total} violações'}")
+    return resultados
@@ -0,0 +1 @@
+from .simulador import simular_programacao, resumir_simulacao, parametros_simulacao, ordem_eventos
\ No newline at end of file
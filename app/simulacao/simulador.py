@@ -0,0 +1,213 @@
+import heapq
+import numpy as np
+
+from resultados.validacao import atribuicoes_da_solucao
+from parametros_avancados import faixas_velocidades_empilhadeiras
+
+def parametros_simulacao(instancia: dict) -> dict[str, np.ndarray]:
+    """
+    Extrai de uma instância gerada por gerar_instancia o que é preciso para sortear novamente os tempos de processamento:
+    a distância carregada de cada operação e a faixa de velocidades (em km/h) de cada empilhadeira.
+
+    Retorno:
+    --------
+    dict[str, np.ndarray]
+        Dicionário contendo:
+        - 'distancia': vetor (n,) com a distância percorrida (só ida) por cada operação.
+        - 'vel_min', 'vel_max': vetores (n_maquinas,) com a velocidade mínima e máxima de cada empilhadeira.
+    """
+
+    config = instancia['parametros']
+    distancias = instancia['distancias']
+    n_operacoes = instancia['parametros_basicos']['n_total_operacoes']
+
+    distancia = np.zeros(n_operacoes)
+    distancia[distancias['operacoes'] - 1] = distancias['carregado']
+
+    vel_min, vel_max = faixas_velocidades_empilhadeiras(instancia['classificacao_empilhadeiras_velocidade'],
+                                                        config['vel_min_emp_rapida'], config['vel_max_emp_rapida'],
+                                                        config['vel_min_emp_lenta'], config['vel_max_emp_lenta'])
+
+    return {'distancia': distancia, 'vel_min': vel_min, 'vel_max': vel_max}
+
+def ordem_eventos(pr: np.ndarray, maquina: np.ndarray, inicio: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Ordena as operações de uma programação como eventos de uma simulação: as sequências de cada máquina são dadas
+    pelos inícios programados, e uma operação só é processada depois do seu predecessor e da operação anterior
+    na mesma máquina. Como essas dependências não mudam entre replicações, a mesma ordem vale para todas.
+
+    Parâmetros:
+    -----------
+    pr : np.ndarray
+        Vetor (n,) com o predecessor de cada operação (0 quando não há).
+    maquina : np.ndarray
+        Vetor (n,) com a máquina (a partir de 1) de cada operação.
+    inicio : np.ndarray
+        Vetor (n,) com o início programado de cada operação.
+
+    Retorno:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        A ordem de processamento (índices a partir de zero) e, para cada operação, o índice da operação anterior
+        na mesma máquina (-1 se for a primeira).
+
+    Exceções:
+    ---------
+    ValueError
+        Se as sequências das máquinas contradizem as precedências (a programação não pode ser reproduzida).
+    """
+
+    n_operacoes = len(pr)
+    ordem_maquina = np.lexsort((np.arange(n_operacoes), inicio, maquina))
+    anterior = np.full(n_operacoes, -1, dtype=np.int64)
+    mesma = maquina[ordem_maquina[1:]] == maquina[ordem_maquina[:-1]]
+    anterior[ordem_maquina[1:][mesma]] = ordem_maquina[:-1][mesma]
+    proxima = np.full(n_operacoes, -1, dtype=np.int64)
+    proxima[anterior[anterior >= 0]] = np.flatnonzero(anterior >= 0)
+
+    sucessores = [[] for _ in range(n_operacoes)]
+    for operacao, predecessor in enumerate(pr.tolist()):
+        if predecessor > 0:
+            sucessores[predecessor - 1].append(operacao)
+
+    # Número de dependências (predecessor e anterior na máquina) ainda não processadas
+    pendentes = (pr > 0).astype(np.int64) + (anterior >= 0)
+    eventos = [(inicio[operacao], operacao) for operacao in np.flatnonzero(pendentes == 0).tolist()]
+    heapq.heapify(eventos)
+
+    ordem = []
+    while eventos:
+        _, operacao = heapq.heappop(eventos)
+        ordem.append(operacao)
+        liberadas = sucessores[operacao] + ([proxima[operacao]] if proxima[operacao] >= 0 else [])
+        for seguinte in liberadas:
+            pendentes[seguinte] -= 1
+            if pendentes[seguinte] == 0:
+                heapq.heappush(eventos, (inicio[seguinte], seguinte))
+
+    if len(ordem) < n_operacoes:
+        raise ValueError("As sequências das máquinas contradizem as precedências; a programação não pode ser simulada.")
+    return np.array(ordem, dtype=np.int64), anterior
+
+def simular_programacao(arrays: dict[str, np.ndarray],
+                        solucao: dict,
+                        distancia: np.ndarray,
+                        vel_min: np.ndarray,
+                        vel_max: np.ndarray,
+                        n_replicacoes: int = 1000,
+                        seed: int = None,
+                        tamanho_bloco: int = 10000,
+                        por_empilhadeira: bool = None) -> dict[str, np.ndarray]:
+    """
+    Reexecuta uma programação (máquinas e sequências fixas) com velocidades sorteadas novamente em cada replicação.
+
+    Como em calcular_tempo_processamento, cada operação sorteia uma velocidade uniforme na faixa da sua empilhadeira
+    e leva round(2 * distância / velocidade) segundos. Os setups e bloqueios são os da instância. Cada operação
+    começa assim que o predecessor termina e a empilhadeira fica livre (término da anterior + setup + bloqueio).
+    As replicações são processadas juntas, como colunas de arrays, em blocos de até tamanho_bloco.
+
+    Parâmetros:
+    -----------
+    arrays : dict[str, np.ndarray]
+        Arrays da instância (veja instancia.montar_arrays_instancia).
+    solucao : dict
+        Programação no formato de parse_log_file (ou de heuristica.solucao_para_parametros).
+    distancia : np.ndarray
+        Vetor (n,) com a distância (só ida) de cada operação.
+    vel_min, vel_max : np.ndarray
+        Vetores (n_maquinas,) com a faixa de velocidades de cada empilhadeira, em km/h.
+    n_replicacoes : int, opcional
+        Número de replicações (padrão = 1000).
+    seed : int, opcional
+        Semente do gerador de números aleatórios do numpy.
+    tamanho_bloco : int, opcional
+        Máximo de replicações simuladas ao mesmo tempo, para limitar a memória a O(tamanho_bloco * n).
+    por_empilhadeira : bool, opcional
+        Orientação de alpha (veja resultados.atribuicoes_da_solucao).
+
+    Retorno:
+    --------
+    dict[str, np.ndarray]
+        Dicionário contendo:
+        - 'makespan': vetor (n_replicacoes,) com o término da última operação.
+        - 'atraso': matriz (n_replicacoes, n_caminhoes) com o atraso de cada caminhão.
+        - 'makespan_programado': makespan da programação com os tempos da instância (mesma reexecução, sem sorteio).
+    """
+
+    pr = arrays['pr']
+    s = arrays['s']
+    bk = arrays['bk']
+    d = arrays['d']
+    n_operacoes, n_maquinas = arrays['p'].shape
+    n_caminhoes = len(d)
+
+    atribuicoes = atribuicoes_da_solucao(solucao, n_maquinas, n_caminhoes, por_empilhadeira)
+    maquina = np.zeros(n_operacoes, dtype=np.int64)
+    caminhao = np.zeros(n_operacoes, dtype=np.int64)
+    maquina[atribuicoes[:, 0] - 1] = atribuicoes[:, 2]
+    caminhao[atribuicoes[:, 0] - 1] = atribuicoes[:, 1]
+    if (maquina == 0).any():
+        raise ValueError(f"A operação {np.flatnonzero(maquina == 0)[0] + 1} não está atribuída a nenhuma máquina.")
+
+    inicio = np.array([solucao['t'].get(operacao, 0.0) for operacao in range(1, n_operacoes + 1)])
+    ordem, anterior = ordem_eventos(pr, maquina, inicio)
+
+    # Setup + bloqueio entre a operação anterior na máquina e cada operação
+    k = maquina - 1
+    tem_anterior = anterior >= 0
+    intervalo = np.zeros(n_operacoes)
+    intervalo[tem_anterior] = (s[k[tem_anterior], anterior[tem_anterior], np.flatnonzero(tem_anterior)]
+                               + bk[k[tem_anterior], anterior[tem_anterior], np.flatnonzero(tem_anterior)])
+    predecessor = pr - 1
+
+    def reexecutar(p: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # p: matriz (replicacoes, n); percorre os eventos na ordem, atualizando todas as replicações de uma vez
+        termino = np.zeros_like(p)
+        for operacao in ordem.tolist():
+            comeco = termino[:, predecessor[operacao]] if predecessor[operacao] >= 0 else 0.0
+            if anterior[operacao] >= 0:
+                comeco = np.maximum(comeco, termino[:, anterior[operacao]] + intervalo[operacao])
+            termino[:, operacao] = comeco + p[:, operacao]
+        saida = np.zeros((p.shape[0], n_caminhoes))
+        for c in range(n_caminhoes):
+            operacoes = np.flatnonzero(caminhao == c + 1)
+            if len(operacoes):
+                saida[:, c] = termino[:, operacoes].max(axis=1)
+        return termino.max(axis=1), np.maximum(saida - d, 0)
+
+    programado = np.nan_to_num(arrays['p'][np.arange(n_operacoes), k])[None, :]
+    makespan_programado = float(reexecutar(programado)[0][0])
+
+    gerador = np.random.default_rng(seed)
+    minimo = vel_min[k]
+    amplitude = vel_max[k] - vel_min[k]
+    makespan = np.empty(n_replicacoes)
+    atraso = np.empty((n_replicacoes, n_caminhoes))
+    for comeco in range(0, n_replicacoes, tamanho_bloco):
+        fim = min(comeco + tamanho_bloco, n_replicacoes)
+        velocidade = (minimo + amplitude * gerador.random((fim - comeco, n_operacoes))) * 1000 / 3600
+        p = np.rint(2 * distancia / velocidade)
+        makespan[comeco:fim], atraso[comeco:fim] = reexecutar(p)
+
+    return {'makespan': makespan, 'atraso': atraso, 'makespan_programado': makespan_programado}
+
+def resumir_simulacao(resultado: dict[str, np.ndarray], quantis: tuple = (0.05, 0.5, 0.95)) -> dict[str, dict]:
+    """
+    Resume as distribuições de uma simulação: média, desvio padrão e quantis do makespan, do atraso total,
+    do atraso máximo e do número de caminhões atrasados, além da probabilidade de atraso de cada caminhão.
+    """
+
+    atraso = resultado['atraso']
+    medidas = {
+        'makespan': resultado['makespan'],
+        'atraso_total': atraso.sum(axis=1),
+        'atraso_maximo': atraso.max(axis=1) if atraso.shape[1] else np.zeros(len(atraso)),
+        'caminhoes_atrasados': (atraso > 0).sum(axis=1),
+    }
+
+    resumo = {}
+    for nome, valores in medidas.items():
+        resumo[nome] = {'media': float(valores.mean()), 'desvio': float(valores.std())}
+        resumo[nome].update({f'q{round(q * 100)}': float(v) for q, v in zip(quantis, np.quantile(valores, quantis))})
+    resumo['prob_atraso_caminhao'] = {c + 1: float(v) for c, v in enumerate((atraso > 0).mean(axis=0).tolist())}
+    return resumo